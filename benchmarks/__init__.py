@@ -0,0 +1,3 @@
+"""
+Benchmarks of the Wrapped Exchange Array hot paths for airspeed velocity
+"""
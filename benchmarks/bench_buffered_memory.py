@@ -0,0 +1,48 @@
+"""
+Benchmarks of the buffered memory backend
+"""
+import numpy as np
+
+from wea import create_buffered_array, load_buffered_array
+
+from .common import DTYPES, NDIMS, SIZES, shape
+
+
+class BufferedArray:
+    params = [SIZES, DTYPES, NDIMS]
+    param_names = ["nbytes", "dtype", "ndim"]
+    timeout = 300
+
+    def setup(self, nbytes, dtype, ndim):
+        self.shape = shape(nbytes, dtype, ndim)
+        self.dtype = np.dtype(dtype)
+        self.wa = create_buffered_array(self.dtype, self.shape)
+        self.buf = self.wa.exchange_buffer
+        self.data = np.zeros(self.shape, dtype=self.dtype, order="F")
+
+    def time_create_buffered_array(self, nbytes, dtype, ndim):
+        create_buffered_array(self.dtype, self.shape)
+
+    def time_load_buffered_array(self, nbytes, dtype, ndim):
+        load_buffered_array(self.buf)
+
+    def time_exchange_buffer(self, nbytes, dtype, ndim):
+        self.wa.exchange_buffer
+
+    def time_exchange_buffers(self, nbytes, dtype, ndim):
+        self.wa.exchange_buffers
+
+    def time_assign(self, nbytes, dtype, ndim):
+        self.wa[...] = self.data
+
+    def time_parallel_assign(self, nbytes, dtype, ndim):
+        self.wa.assign(self.data)
+
+    def time_copy_out(self, nbytes, dtype, ndim):
+        self.wa.copy_out()
+
+    def peakmem_load_buffered_array(self, nbytes, dtype, ndim):
+        load_buffered_array(self.buf)
+
+    def peakmem_exchange_buffer(self, nbytes, dtype, ndim):
+        self.wa.exchange_buffer
@@ -0,0 +1,44 @@
+"""
+Benchmarks of the header codec
+"""
+import numpy as np
+
+import wea.meta_data as meta
+
+from .common import DTYPES, NDIMS
+
+
+class HeaderCodec:
+    params = [DTYPES, NDIMS]
+    param_names = ["dtype", "ndim"]
+
+    def setup(self, dtype, ndim):
+        self.dtype = np.dtype(dtype)
+        self.shape = (3,) * ndim
+        size, _, _ = meta._calculate_size(self.shape, self.dtype)
+        self.buf = bytearray(size)
+        meta._write_header(self.buf, self.dtype, self.shape)
+
+    def time_calculate_size(self, dtype, ndim):
+        meta._calculate_size(self.shape, self.dtype)
+
+    def time_create_header(self, dtype, ndim):
+        meta._create_header(self.dtype, self.shape)
+
+    def time_write_header(self, dtype, ndim):
+        meta._write_header(self.buf, self.dtype, self.shape)
+
+    def time_check_buffer_array(self, dtype, ndim):
+        meta.check_buffer_array(self.buf)
+
+
+class IndexFrames:
+    params = [[10, 1000, 100000]]
+    param_names = ["frames"]
+
+    def setup(self, frames):
+        header = meta._create_header(np.dtype("float64"), (4, 3))
+        self.buf = (bytes(header) + bytes(96)) * frames
+
+    def time_index_frames(self, frames):
+        meta.index_frames(self.buf)
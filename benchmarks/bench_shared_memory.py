@@ -0,0 +1,39 @@
+"""
+Benchmarks of the shared memory backend
+"""
+import numpy as np
+
+from wea import attach_shared_array, create_shared_array
+
+from .common import DTYPES, NDIMS, SIZES, segment_name, shape
+
+
+class SharedArray:
+    params = [SIZES, DTYPES, NDIMS]
+    param_names = ["nbytes", "dtype", "ndim"]
+    timeout = 300
+
+    def setup(self, nbytes, dtype, ndim):
+        self.shape = shape(nbytes, dtype, ndim)
+        self.dtype = np.dtype(dtype)
+        self.name = segment_name("shared")
+        self.wa = create_shared_array(self.name, self.dtype, self.shape)
+        self.create_name = segment_name("create")
+
+    def teardown(self, nbytes, dtype, ndim):
+        self.wa.unlink()
+
+    def time_create_shared_array(self, nbytes, dtype, ndim):
+        wa = create_shared_array(self.create_name, self.dtype, self.shape)
+        wa.unlink()
+
+    def time_attach_shared_array(self, nbytes, dtype, ndim):
+        wa = attach_shared_array(self.name)
+        wa.close()
+
+    def time_reattach(self, nbytes, dtype, ndim):
+        self.wa.reattach().close()
+
+    def peakmem_attach_shared_array(self, nbytes, dtype, ndim):
+        wa = attach_shared_array(self.name)
+        wa.close()
@@ -0,0 +1,50 @@
+"""
+Parameters shared by the benchmarks
+"""
+import os
+
+import numpy as np
+
+import wea.meta_data as meta
+
+# Array sizes in bytes from a single element to 1 GiB
+SIZES = [8, 1 << 12, 1 << 20, 1 << 26, 1 << 30]
+NDIMS = [1, 2, 4]
+# All supported data formats, the time units are represented by nanoseconds
+DTYPES = [
+    str(dtype)
+    for dtype in meta._WEA_IDENTS
+    if dtype.kind not in "mM" or np.datetime_data(dtype)[0] == "ns"
+]
+
+
+def shape(nbytes: int, dtype: np.dtype, ndim: int) -> tuple:
+    """
+    Shape of an array with about nbytes bytes, the elements are spread over
+    the first dimensions
+
+    :param nbytes: Array size in bytes
+    :type nbytes: int
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param ndim: Dimensions
+    :type ndim: int
+    :return: Array dimension
+    :rtype: tuple
+    """
+    count = max(nbytes // np.dtype(dtype).itemsize, 1)
+    side = max(int(round(count ** (1 / ndim))), 1)
+    dims = [side] * (ndim - 1)
+    return (max(count // side ** (ndim - 1), 1), *dims)
+
+
+def segment_name(prefix: str) -> str:
+    """
+    Shared memory name which is unique per benchmark process
+
+    :param prefix: Benchmark name
+    :type prefix: str
+    :return: Shared memory location
+    :rtype: str
+    """
+    return f"/wea-bench-{prefix}-{os.getpid()}"
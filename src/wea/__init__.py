@@ -5,10 +5,48 @@ from importlib.metadata import PackageNotFoundError, version
 
 from .buffered_memory import (
     BufferedExchangeArray,
+    BufferedGrowableArray,
+    DeltaTracker,
+    ExchangeRecord,
+    apply_delta,
     create_buffered_array,
+    create_exchange_record,
+    create_growable_buffered_array,
     load_buffered_array,
+    load_exchange_record,
+    pack_exchange_record,
+    read_buffered_array,
+)
+from .mapped_memory import (
+    MappedExchangeArray,
+    create_mapped_array,
+    open_mapped_array,
+)
+from .paging import advise, prefault
+from .parallel import parallel_copy
+from .shared_memory import (
+    SharedArena,
+    SharedArrayCache,
+    SharedArrayExecutor,
+    SharedExchangeArray,
+    SharedGrowableArray,
+    SharedMultiBuffer,
+    SharedRingBuffer,
+    SharedWindow,
+    attach_cached_array,
+    attach_growable_array,
+    attach_multi_buffer,
+    attach_ring_buffer,
+    attach_shared_arena,
+    attach_shared_array,
+    attach_shared_window,
+    create_growable_array,
+    create_multi_buffer,
+    create_ring_buffer,
+    create_shared_arena,
+    create_shared_array,
+    release_cached_array,
 )
-from .shared_memory import SharedExchangeArray, attach_shared_array, create_shared_array
 
 __all__ = [
     "__version__",
@@ -18,6 +56,39 @@ __all__ = [
     "attach_shared_array",
     "create_buffered_array",
     "load_buffered_array",
+    "read_buffered_array",
+    "ExchangeRecord",
+    "create_exchange_record",
+    "pack_exchange_record",
+    "load_exchange_record",
+    "DeltaTracker",
+    "apply_delta",
+    "BufferedGrowableArray",
+    "create_growable_buffered_array",
+    "SharedRingBuffer",
+    "create_ring_buffer",
+    "attach_ring_buffer",
+    "SharedMultiBuffer",
+    "create_multi_buffer",
+    "attach_multi_buffer",
+    "SharedArrayCache",
+    "attach_cached_array",
+    "release_cached_array",
+    "SharedArena",
+    "create_shared_arena",
+    "attach_shared_arena",
+    "SharedArrayExecutor",
+    "SharedGrowableArray",
+    "create_growable_array",
+    "attach_growable_array",
+    "SharedWindow",
+    "attach_shared_window",
+    "MappedExchangeArray",
+    "create_mapped_array",
+    "open_mapped_array",
+    "advise",
+    "prefault",
+    "parallel_copy",
 ]
 
 try:
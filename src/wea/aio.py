@@ -0,0 +1,164 @@
+"""
+asyncio transport for Wrapped Exchange Arrays
+"""
+# pylint: disable=W1202,W1203
+import asyncio
+import inspect
+import logging
+import typing
+
+import numpy as np
+
+from .buffered_memory.buffered_exchange_array import (
+    BufferedExchangeArray,
+    _exchange_buffers,
+    _frame_offset,
+)
+from .meta_data import _JULIA_WA_HEADER_SIZEOF, _frame_size
+
+LOGGER = logging.getLogger(__name__)
+
+ArrayHandler = typing.Callable[
+    [BufferedExchangeArray],
+    typing.Union[
+        typing.Optional[np.ndarray], typing.Awaitable[typing.Optional[np.ndarray]]
+    ],
+]
+
+
+async def send_array(
+    writer: asyncio.StreamWriter, arr: np.ndarray, order: str = "F"
+) -> None:
+    """
+    Send an array as exchange frame
+
+    Header and payload are handed to the transport separately, thus
+    BufferedExchangeArrays and arrays which are contiguous in the requested
+    order are not copied.
+
+    :param writer: Stream writer
+    :type writer: asyncio.StreamWriter
+    :param arr: Array to send
+    :type arr: np.ndarray
+    :param order: Memory layout of the frame, "K" keeps the layout of C
+     contiguous arrays, defaults to "F"
+    :type order: str, optional
+    """
+    writer.writelines(_exchange_buffers(arr, order))
+    await writer.drain()
+
+
+async def recv_array(reader: asyncio.StreamReader) -> BufferedExchangeArray:
+    """
+    Receive an exchange frame
+
+    The header is read first in order to know the size of the payload. The
+    fixed header fields are validated before the rest of the header is
+    allocated and the payload is moved from the stream straight into the
+    frame buffer.
+
+    :param reader: Stream reader
+    :type reader: asyncio.StreamReader
+    :raises EOFError: If the stream ends before a frame starts
+    :raises MemoryError: If the stream ends within a frame
+    :raises TypeError: If the header is invalid
+    :return: WrappedExchangeArray instance
+    :rtype: BufferedExchangeArray
+    """
+    prefix = await _readexactly(reader, _JULIA_WA_HEADER_SIZEOF, first=True)
+    off = _frame_offset(prefix)
+    header = memoryview(bytearray(off))
+    header[: len(prefix)] = prefix
+    await _readinto_exactly(reader, header[len(prefix) :])
+    size = _frame_size(header)
+    buf = memoryview(bytearray(size))
+    buf[:off] = header
+    await _readinto_exactly(reader, buf[off:])
+    return BufferedExchangeArray(exchange_buffer=buf)
+
+
+async def start_array_server(
+    handler: ArrayHandler,
+    host: typing.Optional[str] = None,
+    port: typing.Optional[int] = None,
+    **kwargs,
+) -> asyncio.AbstractServer:
+    """
+    Start a server which calls the handler for every received array
+
+    Every peer is served by its own task on the event loop. If the handler,
+    which may be a coroutine function, returns an array, the array is sent
+    back to the peer.
+
+    :param handler: Function called with every received array
+    :type handler: ArrayHandler
+    :param host: Host to listen on, defaults to all interfaces
+    :type host: typing.Optional[str], optional
+    :param port: Port to listen on, defaults to None
+    :type port: typing.Optional[int], optional
+    :return: Running server
+    :rtype: asyncio.AbstractServer
+    """
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                reply = handler(await recv_array(reader))
+                if inspect.isawaitable(reply):
+                    reply = await reply
+                if reply is not None:
+                    await send_array(writer, reply)
+        except (EOFError, ConnectionError, MemoryError, TypeError) as exc:
+            LOGGER.debug(f"Closing array connection: {exc}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    return await asyncio.start_server(serve, host, port, **kwargs)
+
+
+async def _readexactly(
+    reader: asyncio.StreamReader, size: int, first: bool = False
+) -> bytes:
+    """
+    Read exactly size bytes and translate a premature end of the stream
+
+    :param reader: Stream reader
+    :type reader: asyncio.StreamReader
+    :param size: Number of bytes
+    :type size: int
+    :param first: Whether the read starts a frame, defaults to False
+    :type first: bool, optional
+    :raises EOFError: If the stream ends before a frame starts
+    :raises MemoryError: If the stream ends within a frame
+    :return: Read bytes
+    :rtype: bytes
+    """
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as exc:
+        if first and not exc.partial:
+            raise EOFError("No further exchange frame available") from exc
+        raise MemoryError("Exchange frame is truncated") from exc
+
+
+async def _readinto_exactly(reader: asyncio.StreamReader, buf: memoryview) -> None:
+    """
+    Fill a buffer completely with the data available on the stream
+
+    :param reader: Stream reader
+    :type reader: asyncio.StreamReader
+    :param buf: Destination buffer
+    :type buf: memoryview
+    :raises MemoryError: If the stream ends before the buffer is filled
+    """
+    pos = 0
+    while pos < len(buf):
+        chunk = await reader.read(len(buf) - pos)
+        if not chunk:
+            raise MemoryError("Exchange frame is truncated")
+        buf[pos : pos + len(chunk)] = chunk
+        pos += len(chunk)
@@ -5,6 +5,31 @@ from .buffered_exchange_array import (
     BufferedExchangeArray,
     create_buffered_array,
     load_buffered_array,
+    read_buffered_array,
+)
+from .buffered_growable_array import (
+    BufferedGrowableArray,
+    create_growable_buffered_array,
+)
+from .delta import DeltaTracker, apply_delta
+from .exchange_record import (
+    ExchangeRecord,
+    create_exchange_record,
+    load_exchange_record,
+    pack_exchange_record,
 )
 
-__all__ = ["BufferedExchangeArray", "create_buffered_array", "load_buffered_array"]
+__all__ = [
+    "BufferedExchangeArray",
+    "create_buffered_array",
+    "load_buffered_array",
+    "read_buffered_array",
+    "ExchangeRecord",
+    "create_exchange_record",
+    "pack_exchange_record",
+    "load_exchange_record",
+    "DeltaTracker",
+    "apply_delta",
+    "BufferedGrowableArray",
+    "create_growable_buffered_array",
+]
@@ -4,12 +4,32 @@ buffer memory
 """
 # pylint: disable=W0201,W1202,W1203
 import logging
+import struct
 import typing
 
 import numpy as np
 
+from .. import instrumentation
+from ..codecs import compress_buffer, decompress_buffer
 from ..interface import WrappedExchangeArray
-from ..meta_data import _calculate_size, _write_header, check_buffer_array
+from ..meta_data import (
+    _JULIA_WA_HEADER_FORMAT,
+    _JULIA_WA_HEADER_SIZEOF,
+    _JULIA_WA_MAGIC,
+    _WEA_FLAG_CODECS,
+    _WEA_FLAG_DELTA,
+    _array_order,
+    _calculate_size,
+    _create_header,
+    _frame_size,
+    _header_byteorder,
+    _header_flags,
+    _header_order,
+    _max_header_size,
+    _swap_byteorder,
+    _write_header,
+    check_buffer_array,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +38,9 @@ class BufferedExchangeArray(WrappedExchangeArray):
     """
     Buffered memory Wrapped Exchange Array
 
+    The array data and the header share one exchange buffer, thus the
+    array is a view into the buffer which is handed over for the exchange.
+
     :param WrappedExchangeArray: WrappedExchangeArray type
     :type WrappedExchangeArray: WrappedExchangeArray
     """
@@ -25,75 +48,323 @@ class BufferedExchangeArray(WrappedExchangeArray):
     def __new__(cls, **kwargs):
         kwarg = ["dtype", "shape"]
         if "exchange_buffer" in kwargs:
-            buffer = kwargs["exchange_buffer"]
-            size = len(buffer)
-            off, pytype, dims = _load_buffered_array(buffer)
+            buffer, off, size, pytype, dims = _load_buffered_array(
+                kwargs.pop("exchange_buffer"), kwargs.pop("swap", False)
+            )
             for x_val, y_val in zip(kwarg, [pytype, dims]):
                 kwargs[x_val] = y_val
-            del kwargs["exchange_buffer"]
+            kwargs["order"] = _header_order(buffer)
         else:
             for x_val in kwarg:
                 if x_val not in kwargs:
                     raise TypeError(f"Missing {x_val} for creating wrapped array")
-                buffer, off, size = _create_buffered_array(
-                    kwargs["dtype"], kwargs["shape"]
-                )
+            kwargs.setdefault("order", "F")
+            buffer, off, size = _create_buffered_array(
+                np.dtype(kwargs["dtype"]), tuple(kwargs["shape"]), kwargs["order"]
+            )
         kwargs["buffer"] = buffer[off:]
-        kwargs["order"] = "F"
         obj = super(BufferedExchangeArray, cls).__new__(cls, **kwargs)
+        obj._exchange_buffer = buffer
         obj._exchange_buffer_offset = off
         obj._exchange_buffer_size = size
-        obj._exchange_buffer_header = buffer[:off]
+        obj._exchange_buffer_layout = _layout(obj)
         return obj
 
     def __array_finalize__(self, obj):
         if obj is None:
             return
-        self._exchange_buffer_header: bytearray = getattr(
-            obj, "_exchange_buffer_header", None
+        self._exchange_buffer: typing.Optional[memoryview] = getattr(
+            obj, "_exchange_buffer", None
         )
-        self._exchange_buffer_offset: int = getattr(
+        self._exchange_buffer_offset: typing.Optional[int] = getattr(
             obj, "_exchange_buffer_offset", None
         )
-        self._exchange_buffer_size: int = getattr(obj, "_exchange_buffer_size", None)
+        self._exchange_buffer_size: typing.Optional[int] = getattr(
+            obj, "_exchange_buffer_size", None
+        )
+        self._exchange_buffer_layout: typing.Optional[tuple] = getattr(
+            obj, "_exchange_buffer_layout", None
+        )
 
     @property
-    def exchange_buffer(self) -> bytearray:
+    def exchange_buffer(self) -> memoryview:
         """
-        Exchange bytearray which contains also the header information
+        Exchange buffer which contains also the header information
+
+        The buffer is shared with the array, thus no data is copied. Only
+        if the array does not cover the exchange buffer anymore, e.g. for
+        slices or copies, a new exchange buffer is created. The new buffer
+        keeps the memory layout of the original exchange buffer.
 
         :return: Array data with meta information
-        :rtype: bytearray
+        :rtype: memoryview
         """
-        buf = bytearray(self._exchange_buffer_size)
-        buf[: self._exchange_buffer_offset] = self._exchange_buffer_header
-        buf[self._exchange_buffer_offset :] = self.tobytes(order="F")
+        if self._exchange_buffer is not None and (
+            _layout(self) == self._exchange_buffer_layout
+        ):
+            return self._exchange_buffer
+        order = (
+            "F"
+            if self._exchange_buffer is None
+            else _header_order(self._exchange_buffer)
+        )
+        buf, off, _ = _create_buffered_array(self.dtype, self.shape, order)
+        arr = np.ndarray(self.shape, dtype=self.dtype, buffer=buf[off:], order=order)
+        arr[...] = self
+        if instrumentation.HOOKS:
+            instrumentation.emit(instrumentation.BYTES_COPIED, self.nbytes)
         return buf
 
+    @property
+    def exchange_buffers(self) -> typing.List[memoryview]:
+        """
+        Header and array data as separate buffers for scatter-gather I/O,
+        e.g. socket.sendmsg or os.writev. The payload keeps the memory layout
+        of the array like the exchange buffer.
+
+        :return: Header and payload buffer
+        :rtype: typing.List[memoryview]
+        """
+        return _exchange_buffers(self)
+
+    def compress(  # type: ignore[override]
+        self,
+        codec: str = "zlib",
+        shuffle: bool = False,
+        level: typing.Optional[int] = None,
+        threads: typing.Optional[int] = None,
+    ) -> bytearray:
+        """
+        Exchange buffer with compressed array data, which is decompressed
+        transparently by load_buffered_array
+
+        :param codec: "zlib" or "lzma", defaults to "zlib"
+        :type codec: str, optional
+        :param shuffle: Group the bytes of the elements by significance before
+         compressing, which helps for floating-point data, defaults to False
+        :type shuffle: bool, optional
+        :param level: Compression level or lzma preset, defaults to the codec
+         default
+        :type level: typing.Optional[int], optional
+        :param threads: Number of threads, defaults to the executor default
+        :type threads: typing.Optional[int], optional
+        :return: Compressed exchange buffer
+        :rtype: bytearray
+        """
+        return compress_buffer(
+            self.exchange_buffer, codec, shuffle=shuffle, level=level, threads=threads
+        )
+
 
-def create_buffered_array(dtype: np.dtype, shape: tuple) -> BufferedExchangeArray:
+def create_buffered_array(
+    dtype: np.dtype, shape: tuple, order: str = "F"
+) -> BufferedExchangeArray:
     """
     Create a new BufferedExchangeArray
 
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param order: Memory layout, "C" allows plain copies of C contiguous
+     arrays but is transposed in Julia, defaults to "F"
+    :type order: str, optional
     :return: WrappedExchangeArray instance
     :rtype: BufferedExchangeArray
     """
-    return BufferedExchangeArray(dtype=dtype, shape=shape)
+    return BufferedExchangeArray(dtype=dtype, shape=shape, order=order)
 
 
 def load_buffered_array(
-    buf: typing.Union[memoryview, bytearray]
+    buf: typing.Union[memoryview, bytearray, bytes], swap: bool = False
 ) -> BufferedExchangeArray:
     """
     Load a BufferedExchangeArray from a exchange bytes buffer
 
+    The array is a view into the provided buffer without copying the data.
+    Thus, changes of the buffer are visible in the array and an array loaded
+    from an immutable buffer, e.g. bytes, is read-only. Compressed buffers
+    are decompressed into a new buffer. Buffers of the other byte order are
+    loaded with a non-native data format, e.g. ">f8", unless swap is set.
+
+    :param buf: Exchange buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :param swap: Convert buffers of the other byte order to the native byte
+     order in place, defaults to False
+    :type swap: bool, optional
+    :return: WrappedExchangeArray instance
+    :rtype: BufferedExchangeArray
+    """
+    return BufferedExchangeArray(exchange_buffer=buf, swap=swap)
+
+
+def read_buffered_array(
+    readinto: typing.Callable[[memoryview], int],
+    out: typing.Optional[BufferedExchangeArray] = None,
+) -> BufferedExchangeArray:
+    """
+    Read an exchange frame with a readinto-like function, e.g.
+    socket.recv_into or file.readinto
+
+    If the frame matches the header of the provided array, the data is read
+    into the array and the array is returned. Otherwise a new array is
+    allocated. Thus, one array can be reused across messages by passing the
+    returned array as out.
+
+    :param readinto: Function which reads into a buffer and returns the count
+    :type readinto: typing.Callable[[memoryview], int]
+    :param out: Preallocated array, defaults to None
+    :type out: typing.Optional[BufferedExchangeArray], optional
+    :raises EOFError: If the stream ends before a frame starts
+    :raises MemoryError: If the stream ends within a frame
     :return: WrappedExchangeArray instance
     :rtype: BufferedExchangeArray
     """
+    header, off, size = _read_frame_header(readinto)
+    if (
+        out is not None
+        and out._exchange_buffer is not None
+        and not out._exchange_buffer.readonly
+        and _layout(out) == out._exchange_buffer_layout
+        and out._exchange_buffer[:off] == header
+    ):
+        _readinto_exactly(readinto, out._exchange_buffer[off:])
+        return out
+    buf = memoryview(bytearray(size))
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.BUFFER_ALLOCATED, size)
+    buf[:off] = header
+    _readinto_exactly(readinto, buf[off:])
     return BufferedExchangeArray(exchange_buffer=buf)
 
 
-def _create_buffered_array(dtype: np.dtype, shape: tuple):
+def _exchange_buffers(arr: np.ndarray, order: str = "K") -> typing.List[memoryview]:
+    """
+    Split an array into header and payload buffer
+
+    Frame backed BufferedExchangeArrays and arrays which are contiguous in
+    the requested order are not copied.
+
+    :param arr: Array to exchange
+    :type arr: np.ndarray
+    :param order: Memory layout of the payload, "K" keeps the layout of
+     contiguous arrays and otherwise the layout of their frame, defaults to "K"
+    :type order: str, optional
+    :return: Header and payload buffer
+    :rtype: typing.List[memoryview]
+    """
+    frame = None
+    if isinstance(arr, BufferedExchangeArray):
+        frame = arr._exchange_buffer
+        if frame is not None and _layout(arr) == arr._exchange_buffer_layout:
+            off = arr._exchange_buffer_offset
+            return [frame[:off], frame[off:]]
+    if order == "K":
+        order = _array_order(arr) or ("F" if frame is None else _header_order(frame))
+    header = _create_header(arr.dtype, arr.shape, order)
+    payload = arr.view(np.ndarray).ravel(order=_header_order(header)).view(np.uint8)
+    if instrumentation.HOOKS and not np.may_share_memory(payload, arr):
+        instrumentation.emit(instrumentation.BYTES_COPIED, payload.nbytes)
+    return [memoryview(header), payload.data]
+
+
+def _read_frame_header(readinto: typing.Callable[[memoryview], int]):
+    """
+    Read and validate the header of an exchange frame
+
+    :param readinto: Function which reads into a buffer and returns the count
+    :type readinto: typing.Callable[[memoryview], int]
+    :raises TypeError: If the header is invalid
+    :return: Header buffer, buffer offset and frame size
+    :rtype: Tuple
+    """
+    prefix = bytearray(_JULIA_WA_HEADER_SIZEOF)
+    count = _readinto(readinto, memoryview(prefix))
+    if count == 0:
+        raise EOFError("No further exchange frame available")
+    _readinto_exactly(readinto, memoryview(prefix)[count:])
+    off = _frame_offset(prefix)
+    header = bytearray(off)
+    header[: len(prefix)] = prefix
+    _readinto_exactly(readinto, memoryview(header)[len(prefix) :])
+    return header, off, _frame_size(header)
+
+
+def _frame_offset(prefix: typing.Union[bytes, bytearray]) -> int:
+    """
+    Extract the array offset, i.e. the header size, from the fixed header
+    fields at the start of an exchange frame
+
+    The magic number and the offset are validated before the rest of the
+    header is read, thus a corrupted or hostile stream can not trigger large
+    allocations.
+
+    :param prefix: Fixed header fields
+    :type prefix: typing.Union[bytes, bytearray]
+    :raises TypeError: If the magic number or the offset is invalid
+    :return: Buffer offset
+    :rtype: int
+    """
+    magic, _, n_count, off = struct.unpack_from(
+        _header_byteorder(prefix) + _JULIA_WA_HEADER_FORMAT, prefix
+    )
+    if magic != _JULIA_WA_MAGIC:
+        raise TypeError(f"WrappedArray version {magic} not supported")
+    if not (
+        _JULIA_WA_HEADER_SIZEOF + n_count * np.dtype("int64").itemsize
+        <= off
+        <= _max_header_size(n_count)
+    ):
+        raise TypeError(f"Invalid array offset {off} in exchange frame header")
+    return int(off)
+
+
+def _readinto(readinto: typing.Callable[[memoryview], int], buf: memoryview) -> int:
+    """
+    Read once into a buffer and treat None like no data
+
+    :param readinto: Function which reads into a buffer and returns the count
+    :type readinto: typing.Callable[[memoryview], int]
+    :param buf: Destination buffer
+    :type buf: memoryview
+    :return: Number of read bytes
+    :rtype: int
+    """
+    count = readinto(buf)
+    return 0 if count is None else count
+
+
+def _readinto_exactly(readinto: typing.Callable[[memoryview], int], buf: memoryview):
+    """
+    Fill a buffer completely
+
+    :param readinto: Function which reads into a buffer and returns the count
+    :type readinto: typing.Callable[[memoryview], int]
+    :param buf: Destination buffer
+    :type buf: memoryview
+    :raises MemoryError: If the stream ends before the buffer is filled
+    """
+    pos = 0
+    while pos < len(buf):
+        count = _readinto(readinto, buf[pos:])
+        if count == 0:
+            raise MemoryError("Exchange frame is truncated")
+        pos += count
+
+
+def _layout(arr: np.ndarray) -> tuple:
+    """
+    Describe the memory layout of an array
+
+    :param arr: Array to describe
+    :type arr: np.ndarray
+    :return: Data address, dtype, shape and strides
+    :rtype: tuple
+    """
+    return arr.__array_interface__["data"][0], arr.dtype, arr.shape, arr.strides
+
+
+def _create_buffered_array(dtype: np.dtype, shape: tuple, order: str = "F"):
     """
     Create a new exchange buffer for the BufferedExchangeArray
 
@@ -101,27 +372,50 @@ def _create_buffered_array(dtype: np.dtype, shape: tuple):
     :type type: np.dtype
     :param shape: Array dimension
     :type shape: tuple
-    :return: exchange buffer header, buffer offset and size
+    :param order: Memory layout, defaults to "F"
+    :type order: str, optional
+    :return: exchange buffer, buffer offset and size
     :rtype: Tuple
     """
     size, _, _ = _calculate_size(shape, dtype)
     LOGGER.debug(f"Creating bytes buffer with size {size}")
-    buf = bytearray(size)
-    off = _write_header(buf, dtype, shape)
+    buf = memoryview(bytearray(size))
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.BUFFER_ALLOCATED, size)
+    off = _write_header(buf, dtype, shape, order)
     return buf, off, size
 
 
-def _load_buffered_array(buf: typing.Union[memoryview, bytearray]):
+def _load_buffered_array(
+    buf: typing.Union[memoryview, bytearray, bytes], swap: bool = False
+):
     """
     Extract meta data from an exchange buffer
 
     :param buf: Exchange buffer
-    :type buf: typing.Union[memoryview, bytearray]
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :param swap: Convert to the native byte order in place, defaults to False
+    :type swap: bool, optional
     :raises MemoryError: If buffer is smaller than expected
     :raises TypeError: If Julia magic number is not inside
     :raises TypeError: The dtype does not fit
     :raises TypeError: If Complex32 is provided by Julia
-    :return: Offset, dtype and dimesions
+    :raises TypeError: If the buffer is a delta frame
+    :raises TypeError: If swap is set for a read-only buffer of the other
+     byte order
+    :return: Exchange buffer, offset, size, dtype and dimesions
     :rtype: Tuple
     """
-    return check_buffer_array(buf)
+    buf = memoryview(buf).cast("B")
+    off, pytype, dims = check_buffer_array(buf)
+    flags = _header_flags(buf)
+    if flags & _WEA_FLAG_DELTA:
+        raise TypeError("Exchange buffer is a delta frame, which has to be applied")
+    if flags & _WEA_FLAG_CODECS:
+        buf = decompress_buffer(buf)
+    size, _, _ = _calculate_size(dims, pytype)
+    if len(buf) < size:
+        raise MemoryError("Exchange buffer is too small for wrapped array")
+    if swap:
+        pytype = _swap_byteorder(buf[:size])
+    return buf[:size], off, size, pytype, dims
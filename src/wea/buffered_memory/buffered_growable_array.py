@@ -0,0 +1,176 @@
+"""
+Appendable Wrapped Exchange Array with reserved buffer capacity
+"""
+# pylint: disable=W1202,W1203
+import logging
+import typing
+
+import numpy as np
+
+from .. import instrumentation
+from ..meta_data import (
+    _WEA_EXT_CAPACITY,
+    _WEA_FLAG_GROWABLE,
+    _extension_flags,
+    _header_dims,
+    _require_extension,
+    _set_extension_flags,
+)
+from .buffered_exchange_array import (
+    BufferedExchangeArray,
+    _create_buffered_array,
+    load_buffered_array,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BufferedGrowableArray:
+    """
+    Buffered array which grows along its last axis, the slowest varying axis
+    in Fortran order
+
+    The exchange buffer reserves space for capacity entries along the last
+    axis and the header holds the logical length, thus the exchange buffer up
+    to the logical length is a regular exchange frame. Appending beyond the
+    capacity moves the data into a buffer of twice the capacity, which keeps
+    the copies amortized. Arrays returned before keep the previous buffer.
+    """
+
+    def __init__(
+        self, dtype: np.dtype, shape: tuple, capacity: typing.Optional[int] = None
+    ):
+        shape = tuple(shape)
+        if not shape:
+            raise ValueError("Growable array requires at least one dimension")
+        self._dtype = np.dtype(dtype)
+        self._frame_shape = shape[:-1]
+        self._frame_nbytes = self._dtype.itemsize * int(np.prod(self._frame_shape))
+        self._allocate(max(shape[-1], 1 if capacity is None else int(capacity), 1))
+        self._dims[-1] = shape[-1]
+
+    def __len__(self) -> int:
+        return int(self._dims[-1])
+
+    @property
+    def array(self) -> BufferedExchangeArray:
+        """
+        Return the array with its current length as view into the exchange
+        buffer
+
+        :return: WrappedExchangeArray instance
+        :rtype: BufferedExchangeArray
+        """
+        return load_buffered_array(self.exchange_buffer)
+
+    @property
+    def exchange_buffer(self) -> memoryview:
+        """
+        Exchange frame of the current length without the reserved capacity
+
+        :return: Array data with meta information
+        :rtype: memoryview
+        """
+        return self._buffer[: self._offset + self._frame_nbytes * len(self)]
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the number of entries along the last axis which fit into the
+        exchange buffer
+
+        :return: Capacity
+        :rtype: int
+        """
+        return self._full.shape[-1]
+
+    @property
+    def frame_shape(self) -> tuple:
+        """
+        Return the shape of one entry along the last axis
+
+        :return: Frame shape
+        :rtype: tuple
+        """
+        return self._frame_shape
+
+    def append(self, data: np.ndarray) -> int:
+        """
+        Append one frame or several frames along the last axis
+
+        :param data: Frame or frames stacked along the last axis
+        :type data: np.ndarray
+        :raises ValueError: If the frame shape differs
+        :return: New length
+        :rtype: int
+        """
+        data = np.asanyarray(data)
+        if data.shape == self._frame_shape:
+            data = data[..., np.newaxis]
+        if data.shape[:-1] != self._frame_shape:
+            raise ValueError(
+                f"Frames of {data.shape[:-1]} do not match {self._frame_shape}"
+            )
+        length = len(self)
+        end = length + data.shape[-1]
+        if end > self.capacity:
+            self.reserve(max(end, 2 * self.capacity))
+        self._full[..., length:end] = data
+        self._dims[-1] = end
+        return end
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Move the data into a buffer of a larger capacity, a smaller capacity
+        is ignored
+
+        :param capacity: Number of entries along the last axis
+        :type capacity: int
+        """
+        if capacity <= self.capacity:
+            return
+        length = len(self)
+        previous = self._full[..., :length]
+        LOGGER.debug(f"Growing exchange buffer to a capacity of {capacity}")
+        self._allocate(capacity)
+        self._full[..., :length] = previous
+        self._dims[-1] = length
+        if instrumentation.HOOKS:
+            instrumentation.emit(instrumentation.BYTES_COPIED, previous.nbytes)
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Protected allocation of an exchange buffer with a capacity
+
+        :param capacity: Number of entries along the last axis
+        :type capacity: int
+        """
+        shape = (*self._frame_shape, capacity)
+        buf, off, _ = _create_buffered_array(self._dtype, shape)
+        self._buffer = buf
+        self._offset = off
+        self._dims = _header_dims(buf, len(shape))
+        self._full = np.ndarray(shape, dtype=self._dtype, buffer=buf[off:], order="F")
+        ext = _require_extension(buf, len(shape), off)
+        _set_extension_flags(ext, _extension_flags(ext) | _WEA_FLAG_GROWABLE)
+        ext[_WEA_EXT_CAPACITY] = capacity
+
+
+def create_growable_buffered_array(
+    dtype: np.dtype, shape: tuple, capacity: typing.Optional[int] = None
+) -> BufferedGrowableArray:
+    """
+    Create a new BufferedGrowableArray
+
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Initial dimension, the last axis grows
+    :type shape: tuple
+    :param capacity: Reserved entries along the last axis, defaults to the
+     initial length
+    :type capacity: typing.Optional[int], optional
+    :raises ValueError: If the shape has no axis to grow
+    :return: Returns a BufferedGrowableArray instance
+    :rtype: BufferedGrowableArray
+    """
+    return BufferedGrowableArray(dtype, shape, capacity)
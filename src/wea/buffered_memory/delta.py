@@ -0,0 +1,262 @@
+"""
+Incremental updates of Wrapped Exchange Arrays by changed payload blocks
+"""
+# pylint: disable=W1202,W1203
+import logging
+import struct
+import typing
+
+import numpy as np
+
+from ..meta_data import (
+    _WEA_EXT_PAYLOAD,
+    _WEA_FLAG_DELTA,
+    _array_order,
+    _create_header,
+    _extension_flags,
+    _header_byteorder,
+    _header_flags,
+    _header_order,
+    _require_extension,
+    _set_extension_flags,
+    check_buffer_array,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_BLOCK_FORMAT = "2q"
+_BLOCK_SIZE = 1 << 16
+
+
+class DeltaTracker:
+    """
+    Tracker of the changed payload blocks of an array
+
+    The payload is split into fixed-size blocks in the memory layout of the
+    array, i.e. in the layout of the exchange buffer. Every delta compares
+    the blocks with the snapshot of the previous delta and only carries the
+    changed blocks, which apply_delta patches into the array of the receiver.
+    """
+
+    def __init__(self, arr: np.ndarray, block_size: int = _BLOCK_SIZE):
+        order = _array_order(arr)
+        if order is None:
+            raise ValueError("Delta tracking requires a contiguous array")
+        self._array = arr
+        self._order = order
+        self._block_size = max(-(-int(block_size) // 8), 1) * 8
+        self._snapshot = _payload(arr, order).copy()
+
+    @property
+    def block_size(self) -> int:
+        """
+        Return the number of payload bytes per block
+
+        :return: Block size
+        :rtype: int
+        """
+        return self._block_size
+
+    def dirty_blocks(self) -> np.ndarray:
+        """
+        Compare the array with the snapshot without updating the snapshot
+
+        :return: Sorted indices of the changed blocks
+        :rtype: np.ndarray
+        """
+        return _dirty_blocks(
+            _payload(self._array, self._order), self._snapshot, self._block_size
+        )
+
+    def delta(self) -> bytearray:
+        """
+        Create a delta frame of the changes since the previous delta and
+        update the snapshot
+
+        :return: Delta frame with the header of the array
+        :rtype: bytearray
+        """
+        payload = _payload(self._array, self._order)
+        blocks = _dirty_blocks(payload, self._snapshot, self._block_size)
+        frame = _create_delta(
+            self._array.dtype,
+            self._array.shape,
+            self._order,
+            payload,
+            blocks,
+            self._block_size,
+        )
+        for block in _block_slices(blocks, self._block_size, len(payload)):
+            self._snapshot[block] = payload[block]
+        return frame
+
+
+def apply_delta(
+    arr: np.ndarray, delta: typing.Union[memoryview, bytearray, bytes]
+) -> int:
+    """
+    Patch the changed blocks of a delta frame into an array in place
+
+    :param arr: Array with the state the delta is based on
+    :type arr: np.ndarray
+    :param delta: Delta frame
+    :type delta: typing.Union[memoryview, bytearray, bytes]
+    :raises TypeError: If the buffer is no delta frame
+    :raises ValueError: If the data format or dimension of the array differs
+    :raises MemoryError: If the delta frame is truncated
+    :return: Number of patched blocks
+    :rtype: int
+    """
+    delta = memoryview(delta).cast("B")
+    off, pytype, dims = check_buffer_array(delta)
+    if not _header_flags(delta) & _WEA_FLAG_DELTA:
+        raise TypeError("Exchange buffer is no delta frame")
+    if arr.dtype != pytype or arr.shape != dims:
+        raise ValueError(
+            f"Delta frame of {pytype}{dims} does not match array of "
+            f"{arr.dtype}{arr.shape}"
+        )
+    order = _header_order(delta)
+    contiguous = arr.flags.f_contiguous if order == "F" else arr.flags.c_contiguous
+    if not contiguous or not arr.flags.writeable:
+        raise ValueError(f"Delta requires a writeable array in {order} order")
+    ext = _require_extension(delta, len(dims), off)
+    if len(delta) < off + ext[_WEA_EXT_PAYLOAD]:
+        raise MemoryError("Exchange buffer is too small for delta payload")
+    byteorder = _header_byteorder(delta)
+    block_size, count = struct.unpack_from(byteorder + _BLOCK_FORMAT, delta, off)
+    pos = off + struct.calcsize(_BLOCK_FORMAT)
+    blocks = np.frombuffer(
+        delta, dtype=np.dtype(byteorder + "i8"), count=count, offset=pos
+    )
+    pos += blocks.nbytes
+    payload = _payload(arr, order)
+    for block in _block_slices(blocks, block_size, len(payload)):
+        length = block.stop - block.start
+        payload[block] = np.frombuffer(delta, dtype=np.uint8, count=length, offset=pos)
+        pos += length
+    LOGGER.debug(f"Applied {count} blocks of {block_size} bytes")
+    return count
+
+
+def _payload(arr: np.ndarray, order: typing.Literal["C", "F"]) -> np.ndarray:
+    """
+    Protected byte view of the payload of a contiguous array
+
+    :param arr: Array
+    :type arr: np.ndarray
+    :param order: Memory layout of the array
+    :type order: typing.Literal["C", "F"]
+    :return: Flat uint8 view
+    :rtype: np.ndarray
+    """
+    return arr.view(np.ndarray).reshape(-1, order=order).view(np.uint8)
+
+
+def _dirty_blocks(
+    payload: np.ndarray, snapshot: np.ndarray, block_size: int
+) -> np.ndarray:
+    """
+    Protected vectorized comparison of the blocks of two payloads
+
+    Full blocks are compared as rows of 64-bit words, the tail block on its
+    own.
+
+    :param payload: Current payload
+    :type payload: np.ndarray
+    :param snapshot: Previous payload
+    :type snapshot: np.ndarray
+    :param block_size: Block size, a multiple of 8
+    :type block_size: int
+    :return: Sorted indices of the changed blocks
+    :rtype: np.ndarray
+    """
+    full = len(payload) // block_size
+    end = full * block_size
+    words = (full, block_size // 8)
+    changed = np.any(
+        payload[:end].view(np.uint64).reshape(words)
+        != snapshot[:end].view(np.uint64).reshape(words),
+        axis=1,
+    )
+    blocks = np.flatnonzero(changed)
+    if end < len(payload) and not np.array_equal(payload[end:], snapshot[end:]):
+        blocks = np.append(blocks, full)
+    return blocks.astype(np.int64)
+
+
+def _block_slices(
+    blocks: np.ndarray, block_size: int, size: int
+) -> typing.Iterator[slice]:
+    """
+    Protected payload slices of blocks
+
+    :param blocks: Block indices
+    :type blocks: np.ndarray
+    :param block_size: Block size
+    :type block_size: int
+    :param size: Payload size
+    :type size: int
+    :raises MemoryError: If a block is outside of the payload
+    :yield: Payload slice per block
+    :rtype: typing.Iterator[slice]
+    """
+    for block in blocks.tolist():
+        start = block * block_size
+        if block < 0 or start >= size:
+            raise MemoryError(f"Delta block {block} is outside of the payload")
+        yield slice(start, min(start + block_size, size))
+
+
+def _create_delta(
+    dtype: np.dtype,
+    shape: tuple,
+    order: str,
+    payload: np.ndarray,
+    blocks: np.ndarray,
+    block_size: int,
+) -> bytearray:
+    """
+    Protected creation of a delta frame
+
+    The frame reuses the header of the array with the delta flag set. The
+    payload holds the block size, the number of blocks, the block indices
+    and the bytes of the blocks.
+
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param order: Memory layout
+    :type order: str
+    :param payload: Current payload
+    :type payload: np.ndarray
+    :param blocks: Indices of the changed blocks
+    :type blocks: np.ndarray
+    :param block_size: Block size
+    :type block_size: int
+    :return: Delta frame
+    :rtype: bytearray
+    """
+    slices = list(_block_slices(blocks, block_size, len(payload)))
+    table = struct.calcsize(_BLOCK_FORMAT) + blocks.nbytes
+    length = table + sum(block.stop - block.start for block in slices)
+    out = _create_header(dtype, shape, order)
+    off = len(out)
+    out.extend(bytes(length))
+    byteorder = _header_byteorder(out)
+    struct.pack_into(byteorder + _BLOCK_FORMAT, out, off, block_size, len(blocks))
+    out[off + struct.calcsize(_BLOCK_FORMAT) : off + table] = blocks.astype(
+        byteorder + "i8"
+    ).tobytes()
+    pos = off + table
+    data = np.frombuffer(out, dtype=np.uint8)
+    for block in slices:
+        data[pos : pos + block.stop - block.start] = payload[block]
+        pos += block.stop - block.start
+    del data
+    ext = _require_extension(out, len(shape), off)
+    _set_extension_flags(ext, _extension_flags(ext) | _WEA_FLAG_DELTA)
+    ext[_WEA_EXT_PAYLOAD] = length
+    LOGGER.debug(f"Created delta of {len(blocks)} blocks with {length} bytes")
+    return out
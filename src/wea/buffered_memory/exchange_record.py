@@ -0,0 +1,175 @@
+"""
+Record of several named Wrapped Exchange Arrays in one exchange buffer
+"""
+# pylint: disable=W1202,W1203
+import collections.abc
+import logging
+import struct
+import typing
+
+import numpy as np
+
+from ..meta_data import (
+    _JULIA_WA_AGLIGN,
+    _WEA_ENTRY_FORMAT,
+    _WEA_ENTRY_SIZEOF,
+    _align,
+    _array_order,
+    _calculate_size,
+    _decode_key,
+    _encode_key,
+    _write_header,
+)
+from .buffered_exchange_array import BufferedExchangeArray, load_buffered_array
+
+LOGGER = logging.getLogger(__name__)
+
+_WEA_RECORD_MAGIC = np.uint32(0x57454152)
+_WEA_RECORD_VERSION = 1
+_WEA_RECORD_FORMAT = "I2Hq"
+_WEA_RECORD_SIZEOF = _JULIA_WA_AGLIGN
+
+
+class ExchangeRecord(collections.abc.Mapping):
+    """
+    Read-only mapping of names to BufferedExchangeArrays sharing one buffer
+
+    The buffer starts with the record header and a table of contents, which
+    maps every name to the offset and size of a WrappedArray frame. Every
+    frame is aligned and has its own header, thus the arrays are views into
+    the record buffer and can be exchanged on their own as well.
+    """
+
+    def __init__(self, buf: typing.Union[memoryview, bytearray, bytes]):
+        buf = memoryview(buf).cast("B")
+        if len(buf) < _WEA_RECORD_SIZEOF:
+            raise MemoryError("Exchange buffer is smaller than record header")
+        magic, _, count, size = struct.unpack_from(_WEA_RECORD_FORMAT, buf)
+        if magic != _WEA_RECORD_MAGIC:
+            raise TypeError(f"Exchange record version {magic} not supported")
+        if len(buf) < size:
+            raise MemoryError("Exchange buffer is too small for exchange record")
+        self._buffer = buf[:size]
+        self._arrays: typing.Dict[str, BufferedExchangeArray] = {}
+        for idx in range(count):
+            encoded, off, length = struct.unpack_from(
+                _WEA_ENTRY_FORMAT, buf, _WEA_RECORD_SIZEOF + idx * _WEA_ENTRY_SIZEOF
+            )
+            self._arrays[_decode_key(encoded)] = load_buffered_array(
+                self._buffer[off : off + length]
+            )
+
+    def __getitem__(self, key: str) -> BufferedExchangeArray:
+        return self._arrays[key]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    @property
+    def exchange_buffer(self) -> memoryview:
+        """
+        Exchange buffer of the whole record
+
+        :return: Record data with meta information
+        :rtype: memoryview
+        """
+        return self._buffer
+
+
+def create_exchange_record(spec: typing.Mapping[str, tuple]) -> ExchangeRecord:
+    """
+    Create a new ExchangeRecord with one allocation
+
+    :param spec: Data format, array dimension and optionally the memory
+     layout, "F" by default, per name
+    :type spec: typing.Mapping[str, tuple]
+    :raises ValueError: If an order is unknown
+    :return: Record with zero initialized arrays
+    :rtype: ExchangeRecord
+    """
+    keys = [_encode_key(key) for key in spec]
+    if len(keys) > np.iinfo(np.uint16).max:
+        raise ValueError("Exchange record supports at most 65535 arrays")
+    start = _WEA_RECORD_SIZEOF + len(keys) * _WEA_ENTRY_SIZEOF
+    entries = []
+    end = _align(start)
+    for dtype, shape, *_ in spec.values():
+        length, _, _ = _calculate_size(shape, np.dtype(dtype))
+        entries.append((end, length))
+        end = _align(end + length)
+    LOGGER.debug(f"Creating exchange record with {len(keys)} arrays and size {end}")
+    buf = memoryview(bytearray(end))
+    struct.pack_into(
+        _WEA_RECORD_FORMAT,
+        buf,
+        0,
+        np.uint32(_WEA_RECORD_MAGIC),
+        np.uint16(_WEA_RECORD_VERSION),
+        np.uint16(len(keys)),
+        np.int64(end),
+    )
+    for idx, (key, (off, length), (dtype, shape, *order)) in enumerate(
+        zip(keys, entries, spec.values())
+    ):
+        struct.pack_into(
+            _WEA_ENTRY_FORMAT,
+            buf,
+            _WEA_RECORD_SIZEOF + idx * _WEA_ENTRY_SIZEOF,
+            key,
+            np.int64(off),
+            np.int64(length),
+        )
+        _write_header(
+            buf[off : off + length],
+            np.dtype(dtype),
+            tuple(shape),
+            order[0] if order else "F",
+        )
+    return ExchangeRecord(buf)
+
+
+def pack_exchange_record(
+    arrays: typing.Mapping[str, np.ndarray], order: str = "K"
+) -> ExchangeRecord:
+    """
+    Pack arrays into a new ExchangeRecord
+
+    :param arrays: Arrays per name
+    :type arrays: typing.Mapping[str, np.ndarray]
+    :param order: Memory layout of the arrays, "K" keeps the layout of
+     contiguous arrays and uses "F" otherwise, defaults to "K"
+    :type order: str, optional
+    :raises ValueError: If the order is unknown
+    :return: Record with copies of the arrays
+    :rtype: ExchangeRecord
+    """
+    record = create_exchange_record(
+        {
+            key: (
+                val.dtype,
+                val.shape,
+                (_array_order(val) or "F") if order == "K" else order,
+            )
+            for key, val in arrays.items()
+        }
+    )
+    for key, val in arrays.items():
+        record[key][...] = val
+    return record
+
+
+def load_exchange_record(
+    buf: typing.Union[memoryview, bytearray, bytes]
+) -> ExchangeRecord:
+    """
+    Load an ExchangeRecord from an exchange buffer without copying
+
+    :param buf: Exchange buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :return: Record with views into the buffer
+    :rtype: ExchangeRecord
+    """
+    return ExchangeRecord(buf)
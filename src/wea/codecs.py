@@ -0,0 +1,258 @@
+"""
+Optional compression of Wrapped Exchange Array frames
+"""
+# pylint: disable=W1202,W1203
+import logging
+import lzma
+import struct
+import typing
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import instrumentation
+from .meta_data import (
+    _WEA_EXT_PAYLOAD,
+    _WEA_FLAG_CODECS,
+    _WEA_FLAG_LZMA,
+    _WEA_FLAG_SHUFFLE,
+    _WEA_FLAG_ZLIB,
+    _calculate_size,
+    _extension_flags,
+    _header_byteorder,
+    _header_flags,
+    _require_extension,
+    _set_extension_flags,
+    check_buffer_array,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_CODECS = {"zlib": _WEA_FLAG_ZLIB, "lzma": _WEA_FLAG_LZMA}
+_CHUNK_FORMAT = "2q"
+_CHUNK_SIZE = 1 << 22
+
+
+def compress_buffer(
+    buf: typing.Union[memoryview, bytearray, bytes],
+    codec: str = "zlib",
+    shuffle: bool = False,
+    level: typing.Optional[int] = None,
+    chunk_size: int = _CHUNK_SIZE,
+    threads: typing.Optional[int] = None,
+) -> bytearray:
+    """
+    Compress the payload of an exchange buffer
+
+    The header is kept with the codec recorded in its extension block, thus
+    load_buffered_array decompresses the buffer transparently. The payload
+    is split into chunks, which are compressed in a thread pool because
+    zlib and lzma release the GIL. Compressed buffers can not be read by the
+    Julia WrappedArray.
+
+    :param buf: Exchange buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :param codec: "zlib" or "lzma", defaults to "zlib"
+    :type codec: str, optional
+    :param shuffle: Group the bytes of the elements by significance before
+     compressing, which helps for floating-point data, defaults to False
+    :type shuffle: bool, optional
+    :param level: Compression level or lzma preset, defaults to the codec
+     default
+    :type level: typing.Optional[int], optional
+    :param chunk_size: Payload bytes per chunk, defaults to 4 MiB
+    :type chunk_size: int, optional
+    :param threads: Number of threads, defaults to the executor default
+    :type threads: typing.Optional[int], optional
+    :raises ValueError: If the codec is unknown
+    :raises TypeError: If the header has no extension block
+    :return: Compressed exchange buffer
+    :rtype: bytearray
+    """
+    if codec not in _CODECS:
+        raise ValueError(f"Codec {codec} is not one of {', '.join(_CODECS)}")
+    buf = memoryview(buf).cast("B")
+    off, pytype, dims = check_buffer_array(buf)
+    ext = _require_extension(buf, len(dims), off)
+    if _extension_flags(ext) & _WEA_FLAG_CODECS:
+        raise TypeError("Exchange buffer is already compressed")
+    size, _, _ = _calculate_size(dims, pytype)
+    itemsize = pytype.itemsize
+    chunk_size = max(chunk_size // itemsize, 1) * itemsize
+    chunks = [
+        buf[pos : min(pos + chunk_size, size)] for pos in range(off, size, chunk_size)
+    ]
+    flags = _CODECS[codec] | (_WEA_FLAG_SHUFFLE if shuffle else 0)
+
+    def compress(chunk: memoryview) -> bytes:
+        data = _shuffle(chunk, itemsize) if shuffle else chunk
+        if codec == "zlib":
+            return zlib.compress(data, -1 if level is None else level)
+        return lzma.compress(data, preset=level)
+
+    compressed = _map(compress, chunks, threads)
+    table = struct.calcsize(_CHUNK_FORMAT) + len(compressed) * struct.calcsize("q")
+    payload = table + sum(len(chunk) for chunk in compressed)
+    LOGGER.debug(f"Compressed {size - off} bytes to {payload} bytes with {codec}")
+    out = bytearray(off + payload)
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.BUFFER_ALLOCATED, len(out))
+    out[:off] = buf[:off]
+    byteorder = _header_byteorder(buf)
+    struct.pack_into(byteorder + _CHUNK_FORMAT, out, off, chunk_size, len(compressed))
+    struct.pack_into(
+        f"{byteorder}{len(compressed)}q",
+        out,
+        off + struct.calcsize(_CHUNK_FORMAT),
+        *[len(chunk) for chunk in compressed],
+    )
+    pos = off + table
+    for chunk in compressed:
+        out[pos : pos + len(chunk)] = chunk
+        pos += len(chunk)
+    ext = _require_extension(out, len(dims), off)
+    _set_extension_flags(ext, _extension_flags(ext) | flags)
+    ext[_WEA_EXT_PAYLOAD] = payload
+    return out
+
+
+def decompress_buffer(
+    buf: typing.Union[memoryview, bytearray, bytes],
+    threads: typing.Optional[int] = None,
+) -> memoryview:
+    """
+    Decompress a compressed exchange buffer
+
+    :param buf: Compressed exchange buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :param threads: Number of threads, defaults to the executor default
+    :type threads: typing.Optional[int], optional
+    :raises MemoryError: If the buffer is smaller than expected
+    :raises TypeError: If the chunk table or a chunk is invalid
+    :return: Exchange buffer
+    :rtype: memoryview
+    """
+    buf = memoryview(buf).cast("B")
+    off, pytype, dims = check_buffer_array(buf)
+    flags = _compression(buf)
+    if not flags & _WEA_FLAG_CODECS:
+        raise TypeError("Exchange buffer is not compressed")
+    ext = _require_extension(buf, len(dims), off)
+    payload = int(ext[_WEA_EXT_PAYLOAD])
+    if len(buf) < off + payload:
+        raise MemoryError("Exchange buffer is too small for compressed payload")
+    size, _, _ = _calculate_size(dims, pytype)
+    byteorder = _header_byteorder(buf)
+    table = struct.calcsize(_CHUNK_FORMAT)
+    if payload < table:
+        raise TypeError("Exchange buffer has an invalid chunk table")
+    chunk_size, count = struct.unpack_from(byteorder + _CHUNK_FORMAT, buf, off)
+    # The chunks have to cover the payload exactly before any length is trusted
+    if chunk_size <= 0 or count != -(-(size - off) // chunk_size):
+        raise TypeError("Exchange buffer has an invalid chunk table")
+    table += count * struct.calcsize("q")
+    if payload < table:
+        raise TypeError("Exchange buffer has an invalid chunk table")
+    lengths = struct.unpack_from(
+        f"{byteorder}{count}q", buf, off + struct.calcsize(_CHUNK_FORMAT)
+    )
+    if min(lengths, default=0) < 0 or table + sum(lengths) != payload:
+        raise TypeError("Exchange buffer has an invalid chunk table")
+    pos = off + table
+    chunks = []
+    for length in lengths:
+        chunks.append(buf[pos : pos + length])
+        pos += length
+    out = memoryview(bytearray(size))
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.BUFFER_ALLOCATED, size)
+    out[:off] = buf[:off]
+
+    def decompress(idx: int):
+        start = off + idx * chunk_size
+        length = min(chunk_size, size - start)
+        # Bound the output, a chunk never expands beyond its share of the payload
+        if flags & _WEA_FLAG_ZLIB:
+            inflate = zlib.decompressobj()
+            data = inflate.decompress(chunks[idx], length + 1)
+            eof = inflate.eof
+        else:
+            unpack = lzma.LZMADecompressor()
+            data = unpack.decompress(chunks[idx], length + 1)
+            eof = unpack.eof
+        if len(data) != length or not eof:
+            raise TypeError(f"Exchange buffer chunk {idx} has an invalid length")
+        if flags & _WEA_FLAG_SHUFFLE:
+            _unshuffle(data, out[start : start + len(data)], pytype.itemsize)
+        else:
+            out[start : start + len(data)] = data
+
+    _map(decompress, range(count), threads)
+    ext = _require_extension(out, len(dims), off)
+    _set_extension_flags(ext, _extension_flags(ext) & ~(flags | _WEA_FLAG_SHUFFLE))
+    ext[_WEA_EXT_PAYLOAD] = 0
+    return out
+
+
+def _map(
+    func: typing.Callable, items: typing.Sequence, threads: typing.Optional[int]
+) -> list:
+    """
+    Map a function over chunks in a thread pool if there are several chunks
+
+    :param func: Function
+    :type func: typing.Callable
+    :param items: Chunks
+    :type items: typing.Sequence
+    :param threads: Number of threads
+    :type threads: typing.Optional[int]
+    :return: Results
+    :rtype: list
+    """
+    if len(items) <= 1 or threads == 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(func, items))
+
+
+def _compression(buf: typing.Union[memoryview, bytearray, bytes]) -> int:
+    """
+    Extract the codec flags of an exchange buffer
+
+    :param buf: Exchange buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :return: Codec flags, zero if the buffer is not compressed
+    :rtype: int
+    """
+    return _header_flags(buf) & (_WEA_FLAG_CODECS | _WEA_FLAG_SHUFFLE)
+
+
+def _shuffle(chunk: memoryview, itemsize: int) -> bytes:
+    """
+    Group the bytes of all elements by their significance
+
+    :param chunk: Payload chunk
+    :type chunk: memoryview
+    :param itemsize: Element size
+    :type itemsize: int
+    :return: Shuffled chunk
+    :rtype: bytes
+    """
+    data = np.frombuffer(chunk, dtype=np.uint8).reshape(-1, itemsize)
+    return data.T.tobytes()
+
+
+def _unshuffle(data: bytes, out: memoryview, itemsize: int):
+    """
+    Restore the byte order of the elements of a shuffled chunk
+
+    :param data: Shuffled chunk
+    :type data: bytes
+    :param out: Destination of the chunk
+    :type out: memoryview
+    :param itemsize: Element size
+    :type itemsize: int
+    """
+    dst = np.frombuffer(out, dtype=np.uint8).reshape(-1, itemsize)
+    dst[...] = np.frombuffer(data, dtype=np.uint8).reshape(itemsize, -1).T
@@ -0,0 +1,158 @@
+"""
+Futex based wait and wake on 32-bit words in shared memory
+"""
+# pylint: disable=W1202,W1203
+import ctypes
+import errno
+import logging
+import os
+import platform
+import sys
+import time
+import typing
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+_SYS_FUTEX = {
+    "x86_64": 202,
+    "amd64": 202,
+    "i386": 240,
+    "i686": 240,
+    "aarch64": 98,
+    "arm64": 98,
+    "riscv64": 98,
+    "armv7l": 240,
+    "ppc64le": 221,
+    "s390x": 238,
+}
+_NR_FUTEX = _SYS_FUTEX.get(platform.machine().lower())
+_FUTEX_WAIT = 0
+_FUTEX_WAKE = 1
+_WAKE_ALL = 0x7FFFFFFF
+# Interval for polling on platforms without futex
+_POLL_INTERVAL = 0.0005
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_syscall() -> typing.Optional[typing.Callable]:
+    """
+    Load the syscall function of the C library on Linux
+
+    :return: syscall or None if futex is not available
+    :rtype: typing.Optional[typing.Callable]
+    """
+    if not sys.platform.startswith("linux") or _NR_FUTEX is None:
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+
+
+_SYSCALL = _load_syscall()
+
+
+def futex_word(arr: np.ndarray) -> np.ndarray:
+    """
+    View the first four bytes of an array as futex word
+
+    :param arr: Array in shared memory, aligned to four bytes
+    :type arr: np.ndarray
+    :return: One element uint32 view
+    :rtype: np.ndarray
+    """
+    return arr.view(np.uint8)[:4].view(np.uint32)
+
+
+def wait(word: np.ndarray, expected: int, timeout: typing.Optional[float] = None):
+    """
+    Block while a futex word holds the expected value
+
+    Without futex support, e.g. on other platforms than Linux, the word is
+    polled.
+
+    :param word: Futex word
+    :type word: np.ndarray
+    :param expected: Value to wait on
+    :type expected: int
+    :param timeout: Timeout in seconds, defaults to waiting forever
+    :type timeout: typing.Optional[float], optional
+    :raises OSError: If the futex syscall fails
+    :return: False on timeout
+    :rtype: bool
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    address = word.__array_interface__["data"][0]
+    while int(word[0]) == expected:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return False
+        if _SYSCALL is None:
+            time.sleep(
+                _POLL_INTERVAL if remaining is None else min(_POLL_INTERVAL, remaining)
+            )
+            continue
+        spec = None
+        if remaining is not None:
+            spec = ctypes.byref(
+                _Timespec(int(remaining), int(remaining % 1 * 1_000_000_000))
+            )
+        result = _futex(address, _FUTEX_WAIT, expected, spec)
+        if result == -1:
+            err = ctypes.get_errno()
+            if err not in (errno.EAGAIN, errno.EINTR, errno.ETIMEDOUT):
+                raise OSError(err, os.strerror(err))
+    return True
+
+
+def wake(word: np.ndarray) -> int:
+    """
+    Wake all waiters of a futex word
+
+    :param word: Futex word
+    :type word: np.ndarray
+    :raises OSError: If the futex syscall fails
+    :return: Number of woken waiters, 0 without futex support
+    :rtype: int
+    """
+    if _SYSCALL is None:
+        return 0
+    result = _futex(word.__array_interface__["data"][0], _FUTEX_WAKE, _WAKE_ALL, None)
+    if result == -1:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return result
+
+
+def _futex(address: int, operation: int, value: int, spec) -> int:
+    """
+    Protected futex syscall on a shared word
+
+    :param address: Address of the futex word
+    :type address: int
+    :param operation: FUTEX_WAIT or FUTEX_WAKE
+    :type operation: int
+    :param value: Expected value or number of waiters to wake
+    :type value: int
+    :param spec: Relative timeout
+    :type spec: typing.Optional[ctypes.Structure]
+    :raises OSError: If the platform has no futex syscall
+    :return: Syscall result
+    :rtype: int
+    """
+    if _SYSCALL is None or _NR_FUTEX is None:
+        raise OSError(errno.ENOSYS, os.strerror(errno.ENOSYS))
+    return _SYSCALL(
+        ctypes.c_long(_NR_FUTEX),
+        ctypes.c_void_p(address),
+        ctypes.c_int(operation),
+        ctypes.c_uint32(value),
+        spec,
+        None,
+        ctypes.c_int(0),
+    )
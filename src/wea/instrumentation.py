@@ -0,0 +1,123 @@
+"""
+Opt-in instrumentation of copies, allocations, segments and header codec
+
+Hooks are callables which receive an event name and a value, i.e. a number
+of bytes or a duration in seconds. Without hooks, every instrumented call
+site only checks an empty tuple.
+"""
+import collections
+import contextlib
+import threading
+import typing
+
+Hook = typing.Callable[[str, float], None]
+
+BYTES_COPIED = "bytes_copied"
+BUFFER_ALLOCATED = "buffer_allocated"
+SEGMENT_CREATED = "segment_created"
+SEGMENT_ATTACHED = "segment_attached"
+SEGMENT_CLOSED = "segment_closed"
+SEGMENT_UNLINKED = "segment_unlinked"
+HEADER_ENCODE = "header_encode"
+HEADER_DECODE = "header_decode"
+REOPEN = "reopen"
+
+# Replaced as a whole on changes, thus call sites can check and iterate it
+# without locking
+HOOKS: typing.Tuple[Hook, ...] = ()
+_LOCK = threading.Lock()
+
+
+class Counters:
+    """
+    Hook which counts the events and sums up their values per event name
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: typing.Dict[str, int] = collections.defaultdict(int)
+        self.totals: typing.Dict[str, float] = collections.defaultdict(float)
+
+    def __call__(self, event: str, value: float) -> None:
+        with self._lock:
+            self.counts[event] += 1
+            self.totals[event] += value
+
+    def snapshot(self) -> typing.Dict[str, typing.Tuple[int, float]]:
+        """
+        Copy the current counters
+
+        :return: Count and total per event name
+        :rtype: typing.Dict[str, typing.Tuple[int, float]]
+        """
+        with self._lock:
+            return {key: (val, self.totals[key]) for key, val in self.counts.items()}
+
+    def reset(self) -> None:
+        """
+        Reset all counters
+        """
+        with self._lock:
+            self.counts.clear()
+            self.totals.clear()
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register a hook, which is called synchronously for every event
+
+    :param hook: Callable receiving the event name and value
+    :type hook: Hook
+    """
+    global HOOKS
+    with _LOCK:
+        HOOKS = HOOKS + (hook,)
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    Unregister a hook
+
+    :param hook: Registered hook
+    :type hook: Hook
+    :raises ValueError: If the hook is not registered
+    """
+    global HOOKS
+    with _LOCK:
+        if hook not in HOOKS:
+            raise ValueError("Hook is not registered")
+        hooks = list(HOOKS)
+        hooks.remove(hook)
+        HOOKS = tuple(hooks)
+
+
+@contextlib.contextmanager
+def instrumented(hook: typing.Optional[Hook] = None):
+    """
+    Context manager which registers a hook for the enclosed block
+
+    :param hook: Callable receiving the event name and value, defaults to a
+     new Counters instance
+    :type hook: typing.Optional[Hook], optional
+    :yield: The registered hook
+    :rtype: Hook
+    """
+    hook = Counters() if hook is None else hook
+    add_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_hook(hook)
+
+
+def emit(event: str, value: float) -> None:
+    """
+    Pass an event to all hooks, call sites check HOOKS before
+
+    :param event: Event name
+    :type event: str
+    :param value: Number of bytes or duration in seconds
+    :type value: float
+    """
+    for hook in HOOKS:
+        hook(event, value)
@@ -1,8 +1,12 @@
 """
 Interface class
 """
+import typing
+
 import numpy as np
 
+from .parallel import parallel_copy
+
 
 class WrappedExchangeArray(np.ndarray):
     """
@@ -11,3 +15,34 @@ class WrappedExchangeArray(np.ndarray):
     :param np: numpy
     :type np: numpy
     """
+
+    def assign(self, src: typing.Any, threads: typing.Optional[int] = None) -> None:
+        """
+        Copy data into the array with several threads
+
+        :param src: Source array or anything which broadcasts to the array
+        :type src: typing.Any
+        :param threads: Number of threads, defaults to the number of CPUs
+        :type threads: typing.Optional[int], optional
+        """
+        parallel_copy(self, src, threads)
+
+    def copy_out(
+        self,
+        out: typing.Optional[np.ndarray] = None,
+        threads: typing.Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Copy the array into a plain numpy array with several threads
+
+        :param out: Array to copy into, defaults to a new array with the
+         memory layout of the array
+        :type out: typing.Optional[np.ndarray], optional
+        :param threads: Number of threads, defaults to the number of CPUs
+        :type threads: typing.Optional[int], optional
+        :return: Copy of the array
+        :rtype: np.ndarray
+        """
+        if out is None:
+            out = np.empty_like(self.view(np.ndarray))
+        return parallel_copy(out, self, threads)
@@ -0,0 +1,10 @@
+"""
+Memory Mapped File Wrapped Exchange Array
+"""
+from .mapped_exchange_array import (
+    MappedExchangeArray,
+    create_mapped_array,
+    open_mapped_array,
+)
+
+__all__ = ["MappedExchangeArray", "create_mapped_array", "open_mapped_array"]
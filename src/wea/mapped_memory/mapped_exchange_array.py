@@ -0,0 +1,212 @@
+"""
+Wrapped Exchange Array implementation for memory mapped files
+"""
+# pylint: disable=W0201,W1202,W1203
+import logging
+import mmap
+import os
+import typing
+
+import numpy as np
+
+from .. import paging
+from ..interface import WrappedExchangeArray
+from ..meta_data import (
+    _calculate_size,
+    _eltype,
+    _extension,
+    _header_order,
+    _order_flags,
+    _write_header,
+    check_buffer_array,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_ACCESS_MODES = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
+class MappedExchangeArray(WrappedExchangeArray):
+    """
+    Memory mapped file Wrapped Exchange Array
+
+    The file has the same layout as the shared memory segment, thus only the
+    touched pages are read from the file.
+
+    :param WrappedExchangeArray: WrappedExchangeArray type
+    :type WrappedExchangeArray: WrappedExchangeArray
+    """
+
+    def __new__(cls, path: str, create: bool, mode: str = "r+", **kwargs):
+        kwarg = ["dtype", "shape"]
+        if create is True:
+            for x_val in kwarg:
+                if x_val not in kwargs:
+                    raise TypeError(f"Missing {x_val} for creating wrapped array")
+            kwargs.setdefault("order", "F")
+            mm, off = _create_mapped_array(
+                path, kwargs["dtype"], kwargs["shape"], kwargs["order"]
+            )
+        else:
+            kwarg.append("order")
+            for x_val in kwarg:
+                if x_val in kwargs:
+                    raise TypeError(
+                        f"Ignoring {x_val}. Is not necessary for opening "
+                        f"wrapped array"
+                    )
+            mm, off, pytype, dims = _open_mapped_array(path, mode)
+            for x_val, y_val in zip(kwarg, [pytype, dims, _header_order(mm)]):
+                kwargs[x_val] = y_val
+        buf = memoryview(mm)
+        kwargs["buffer"] = buf[off:]
+        obj = super(MappedExchangeArray, cls).__new__(cls, **kwargs)
+        obj._mmap = mm
+        obj._ext = _extension(buf, len(kwargs["shape"]), off)
+        obj._access = mmap.ACCESS_WRITE if create is True else _ACCESS_MODES[mode]
+        return obj
+
+    def __array_finalize__(self, obj):
+        if obj is None:
+            return
+        self._mmap: typing.Optional[mmap.mmap] = getattr(obj, "_mmap", None)
+        self._ext: typing.Optional[np.ndarray] = getattr(obj, "_ext", None)
+        self._access: typing.Optional[int] = getattr(obj, "_access", None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.close()
+
+    @property
+    def mmap(self) -> typing.Optional[mmap.mmap]:
+        """
+        Return memory map handle
+
+        :return: memory map handle, None for arrays which are not mapped
+        :rtype: typing.Optional[mmap.mmap]
+        """
+        return self._mmap
+
+    def flush(self) -> None:
+        """
+        Write changes back to the file, does nothing for read-only and
+        copy-on-write maps
+        """
+        if self._mmap is not None and not self._mmap.closed and self.flags.writeable:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close the memory map
+        """
+        if self._mmap is not None and not self._mmap.closed:
+            self.flush()
+            self._mmap.close()
+
+
+def create_mapped_array(path: str, dtype: np.dtype, shape: tuple, order: str = "F"):
+    """
+    Create a new WrappedExchangeArray in a memory mapped file
+
+    :param path: File location
+    :type path: str
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param order: Memory layout, "C" allows plain copies of C contiguous
+     arrays but is transposed in Julia, defaults to "F"
+    :type order: str, optional
+    :return: Returns a WrappedArray instance
+    :rtype: WrappedArray
+    """
+    return MappedExchangeArray(path, True, dtype=dtype, shape=shape, order=order)
+
+
+def open_mapped_array(
+    path: str,
+    mode: str = "r",
+    prefault: typing.Union[bool, int] = False,
+    advice: typing.Sequence[str] = (),
+):
+    """
+    Open an existing WrappedExchangeArray in a memory mapped file
+
+    :param path: File location
+    :type path: str
+    :param mode: "r" for read-only, "r+" for read-write and "c" for
+     copy-on-write access, defaults to "r"
+    :type mode: str, optional
+    :param prefault: Fault in all pages, an integer sets the number of
+     threads, defaults to False
+    :type prefault: typing.Union[bool, int], optional
+    :param advice: madvise hints like "sequential", defaults to no hints
+    :type advice: typing.Sequence[str], optional
+    :return: Returns a WrappedArray instance
+    :rtype: WrappedArray
+    """
+    arr = MappedExchangeArray(path, False, mode=mode)
+    if advice:
+        paging.advise(arr, *advice)
+    if prefault:
+        paging.prefault(arr, threads=int(prefault))
+    return arr
+
+
+def _create_mapped_array(
+    path: str, dtype: np.dtype, shape: tuple, order: str = "F"
+) -> typing.Tuple:
+    """
+    Create a new WrappedArray file and map it
+
+    :param path: File location
+    :type path: str
+    :param dtype: Data format
+    :type type: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param order: Memory layout, defaults to "F"
+    :type order: str, optional
+    :raises FileExistsError: If the file already exists
+    :raises TypeError: If the data format is not supported
+    :return: Memory map and buffer offset
+    :rtype: Tuple
+    """
+    dtype = np.dtype(dtype)
+    size, _, _ = _calculate_size(shape, dtype)
+    # Reject an unknown data format or order before the file is created
+    _eltype(dtype)
+    _order_flags(order)
+    LOGGER.debug(f"Creating memory mapped file: {path}")
+    with open(path, "x+b") as fid:
+        try:
+            fid.truncate(size)
+            mm = mmap.mmap(fid.fileno(), size, access=mmap.ACCESS_WRITE)
+            off = _write_header(memoryview(mm), dtype, shape, order)
+        except BaseException:
+            os.remove(path)
+            raise
+    return mm, off
+
+
+def _open_mapped_array(path: str, mode: str) -> typing.Tuple:
+    """
+    Map an existing WrappedArray file
+
+    :param path: File location
+    :type path: str
+    :param mode: Access mode
+    :type mode: str
+    :raises ValueError: If the mode is unknown
+    :raises FileNotFoundError: If the file does not exist
+    :return: Memory map, buffer offset, dtype and shape
+    :rtype: Tuple
+    """
+    if mode not in _ACCESS_MODES:
+        raise ValueError(f"Mode {mode} is not one of {', '.join(_ACCESS_MODES)}")
+    # Copy-on-write maps never write back, thus read access suffices
+    with open(path, "r+b" if mode == "r+" else "rb") as fid:
+        mm = mmap.mmap(fid.fileno(), 0, access=_ACCESS_MODES[mode])
+    return mm, *check_buffer_array(memoryview(mm))
@@ -20,14 +20,24 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 IN THE SOFTWARE.
 """
 
+import ast
+import functools
 import struct
-from typing import Tuple, Union
+import sys
+import time
+from typing import Literal, Optional, Tuple, Union
 
 import numpy as np
+from numpy.lib import format as npformat
 
+from . import instrumentation
 from .utils import checkdims, roundup
 
 _JULIA_WA_MAGIC = np.uint32(0x57412D31)
+# Headers are written in the byte order of the payload. A byte-swapped magic
+# number marks a header of the other byte order.
+_JULIA_WA_MAGIC_SWAPPED = _JULIA_WA_MAGIC.byteswap()
+_SWAPPED_BYTEORDER = ">" if sys.byteorder == "little" else "<"
 _JULIA_WA_AGLIGN = 64
 _JULIA_WA_TYPES = (
     (1, np.dtype("int8"), "signed 8-bit integer"),
@@ -45,11 +55,85 @@ _JULIA_WA_TYPES = (
 )
 _JULIA_WA_IDENTS = {T: i for (i, T, _) in _JULIA_WA_TYPES}
 _JULIA_WA_ELTYPES = [T for (i, T, str) in _JULIA_WA_TYPES]
+# Types beyond the Julia WrappedArray, which can not be read by Julia. The
+# identifiers start above the Julia range. Structured types are described by
+# a descriptor behind the wea extension block.
+_WEA_TIME_UNITS = (
+    "Y",
+    "M",
+    "W",
+    "D",
+    "h",
+    "m",
+    "s",
+    "ms",
+    "us",
+    "ns",
+    "ps",
+    "fs",
+    "as",
+)
+_WEA_TYPES = (
+    (0x0101, np.dtype("bool"), "boolean"),
+    (0x0102, np.dtype("float16"), "16-bit floating-point"),
+    *(
+        (0x0110 + i, np.dtype(f"datetime64[{unit}]"), f"datetime in {unit}")
+        for i, unit in enumerate(_WEA_TIME_UNITS)
+    ),
+    *(
+        (0x0130 + i, np.dtype(f"timedelta64[{unit}]"), f"time delta in {unit}")
+        for i, unit in enumerate(_WEA_TIME_UNITS)
+    ),
+)
+_WEA_STRUCTURED = 0x01FF
+_WEA_IDENTS = {T: i for (i, T, _) in _JULIA_WA_TYPES + _WEA_TYPES}
+_WEA_ELTYPES = {i: T for (i, T, _) in _JULIA_WA_TYPES + _WEA_TYPES}
+_WEA_DESCR_FORMAT = "q"
+_WEA_DESCR_SIZEOF = struct.calcsize(_WEA_DESCR_FORMAT)
+# Upper bound of the descriptor length, which bounds the header size of
+# exchange frames read from untrusted streams
+_WEA_DESCR_MAX_SIZE = 1 << 16
 _JULIA_WA_HEADER_FORMAT = "I2Hq"
 _JULIA_WA_HEADER_SIZEOF = struct.calcsize(_JULIA_WA_HEADER_FORMAT)
+_JULIA_WA_DIM_SIZEOF = 8
+_MAGIC_STRUCT = struct.Struct("I")
+# The wea extension block lives in the alignment padding between the
+# dimensions and the array data, which is ignored by the Julia WrappedArray.
+# It is accessed as int64 words, where the first word holds the block magic,
+# version and flags.
+_WEA_EXT_MAGIC = np.uint32(0x57454158)
+_WEA_EXT_VERSION = 1
+_WEA_EXT_FORMAT = "I2H"
+_WEA_EXT_SIZEOF = 64
+_WEA_EXT_SEQUENCE = 1
+_WEA_EXT_HEAD = 2
+_WEA_EXT_TAIL = 3
+_WEA_EXT_FRONT = 4
+_WEA_EXT_PAYLOAD = 5
+# The first four bytes of the notify word are used as futex word
+_WEA_EXT_NOTIFY = 6
+_WEA_EXT_CAPACITY = 7
+_WEA_FLAG_RING = 0x0001
+_WEA_FLAG_MULTI_BUFFER = 0x0002
+_WEA_FLAG_ZLIB = 0x0004
+_WEA_FLAG_LZMA = 0x0008
+_WEA_FLAG_SHUFFLE = 0x0010
+_WEA_FLAG_DELTA = 0x0020
+_WEA_FLAG_C_ORDER = 0x0040
+_WEA_FLAG_GROWABLE = 0x0080
+_WEA_FLAG_CODECS = _WEA_FLAG_ZLIB | _WEA_FLAG_LZMA
+# Frames with these flags store the payload length in the extension block
+_WEA_FLAG_PAYLOAD = _WEA_FLAG_CODECS | _WEA_FLAG_DELTA
+# Directory entries map a key to the offset and size of a WrappedArray in
+# containers of several arrays
+_WEA_KEY_SIZEOF = 48
+_WEA_ENTRY_FORMAT = f"{_WEA_KEY_SIZEOF}s2q"
+_WEA_ENTRY_SIZEOF = struct.calcsize(_WEA_ENTRY_FORMAT)
 
 
-def _write_header(buf: Union[memoryview, bytearray], dtype: np.dtype, shape: tuple):
+def _write_header(
+    buf: Union[memoryview, bytearray], dtype: np.dtype, shape: tuple, order: str = "F"
+):
     """
     Write the header data into the shared memory
 
@@ -59,32 +143,242 @@ def _write_header(buf: Union[memoryview, bytearray], dtype: np.dtype, shape: tup
     :type dtype: np.dtype
     :param shape: Array dimension
     :type shape: tuple
+    :param order: Memory layout, defaults to "F"
+    :type order: str, optional
     :return: Offset to the start of the array
     :rtype: int
     """
-    size, off, n_count = _calculate_size(shape, dtype)
-    if dtype not in _JULIA_WA_IDENTS:
-        raise TypeError(f"Type {dtype} is not supported for WrappedArray")
-    eltype = _JULIA_WA_IDENTS[dtype]
+    start = time.perf_counter() if instrumentation.HOOKS else None
+    size, off, _ = _calculate_size(shape, dtype)
+    eltype = _eltype(dtype)
+    flags = _order_flags(order)
     if len(buf) < size:
         raise MemoryError("Shared memory buffer is too small for wrapped array")
-    struct.pack_into(
-        _JULIA_WA_HEADER_FORMAT,
+    _pack_header(
+        buf, eltype, shape, off, flags, _descriptor(dtype), _dtype_byteorder(dtype)
+    )
+    if start is not None:
+        instrumentation.emit(instrumentation.HEADER_ENCODE, time.perf_counter() - start)
+    return int(off)
+
+
+def _create_header(dtype: np.dtype, shape: tuple, order: str = "F") -> bytearray:
+    """
+    Create a standalone header which preceeds the array data
+
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param order: Memory layout, defaults to "F"
+    :type order: str, optional
+    :return: Header buffer with the size of the array offset
+    :rtype: bytearray
+    """
+    start = time.perf_counter() if instrumentation.HOOKS else None
+    _, off, _ = _calculate_size(shape, dtype)
+    buf = bytearray(off)
+    _pack_header(
         buf,
-        0,
-        np.uint32(_JULIA_WA_MAGIC),
-        np.uint16(eltype),
-        np.uint16(n_count),
-        np.int64(off),
+        _eltype(dtype),
+        shape,
+        off,
+        _order_flags(order),
+        _descriptor(dtype),
+        _dtype_byteorder(dtype),
     )
-    for idx, val in enumerate(shape):
-        struct.pack_into(
-            "q",
-            buf,
-            int(_JULIA_WA_HEADER_SIZEOF + idx * np.dtype("int64").itemsize),
-            np.int64(val),
+    if start is not None:
+        instrumentation.emit(instrumentation.HEADER_ENCODE, time.perf_counter() - start)
+    return buf
+
+
+def _order_flags(order: str) -> int:
+    """
+    Translate a memory layout into extension flags
+
+    The Julia WrappedArray only knows the Fortran order, thus C ordered
+    arrays appear transposed in Julia.
+
+    :param order: "F" for Fortran or "C" for C order
+    :type order: str
+    :raises ValueError: If the order is unknown
+    :return: Flags
+    :rtype: int
+    """
+    if order not in ("C", "F"):
+        raise ValueError(f"Order {order} is not one of C, F")
+    return _WEA_FLAG_C_ORDER if order == "C" else 0
+
+
+def _header_order(buf: Union[memoryview, bytearray, bytes]) -> Literal["C", "F"]:
+    """
+    Read the memory layout of a header
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :return: "C" if the C order flag is set, otherwise "F"
+    :rtype: typing.Literal["C", "F"]
+    """
+    return "C" if _header_flags(buf) & _WEA_FLAG_C_ORDER else "F"
+
+
+def _array_order(arr: np.ndarray) -> Optional[Literal["C", "F"]]:
+    """
+    Determine the memory layout of an array, Fortran order is preferred for
+    arrays which are contiguous in both orders
+
+    :param arr: Array
+    :type arr: np.ndarray
+    :return: "F", "C" or None if the array is not contiguous
+    :rtype: typing.Optional[typing.Literal["C", "F"]]
+    """
+    if arr.flags.f_contiguous:
+        return "F"
+    if arr.flags.c_contiguous:
+        return "C"
+    return None
+
+
+def _eltype(dtype: np.dtype) -> int:
+    """
+    Look up the WrappedArray type identifier
+
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :raises TypeError: If the data format is not supported
+    :return: Type identifier
+    :rtype: int
+    """
+    if dtype.names is not None and not dtype.hasobject:
+        return _WEA_STRUCTURED
+    native = dtype.newbyteorder("=")
+    if native in _WEA_IDENTS:
+        return _WEA_IDENTS[native]
+    raise TypeError(f"Type {dtype} is not supported for WrappedArray")
+
+
+def _dtype_byteorder(dtype: np.dtype) -> str:
+    """
+    Determine the byte order of the header for a data format
+
+    Structured data formats keep the byte order of their fields in the type
+    descriptor, thus their header is always native.
+
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :return: "=" for native or the struct prefix of the other byte order
+    :rtype: str
+    """
+    if dtype.names is not None or dtype.isnative:
+        return "="
+    return _SWAPPED_BYTEORDER
+
+
+def _header_byteorder(buf: Union[memoryview, bytearray, bytes]) -> str:
+    """
+    Determine the byte order of a header by its magic number
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :return: "=" for native or the struct prefix of the other byte order
+    :rtype: str
+    """
+    (magic,) = _MAGIC_STRUCT.unpack_from(buf)
+    return _SWAPPED_BYTEORDER if magic == _JULIA_WA_MAGIC_SWAPPED else "="
+
+
+def _descriptor(dtype: np.dtype) -> bytes:
+    """
+    Describe a structured data format for the header
+
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :raises TypeError: If the descriptor exceeds the maximum length
+    :return: Encoded numpy descriptor, empty for other data formats
+    :rtype: bytes
+    """
+    if dtype.names is None:
+        return b""
+    descr = repr(npformat.dtype_to_descr(dtype)).encode("utf-8")
+    if len(descr) > _WEA_DESCR_MAX_SIZE:
+        raise TypeError(
+            f"Type descriptor of {len(descr)} bytes exceeds {_WEA_DESCR_MAX_SIZE}"
         )
-    return int(off)
+    return descr
+
+
+def _read_descriptor(buf: Union[memoryview, bytearray], n_count: int, off: int):
+    """
+    Read the structured data format behind the wea extension block
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray]
+    :param n_count: Dimensions
+    :type n_count: int
+    :param off: Offset to the start of the array
+    :type off: int
+    :raises TypeError: If the descriptor is missing or invalid
+    :return: Data format
+    :rtype: np.dtype
+    """
+    pos = _extension_offset(n_count) + _WEA_EXT_SIZEOF
+    if pos + _WEA_DESCR_SIZEOF > off:
+        raise TypeError("WrappedArray header has no type descriptor")
+    byteorder = _header_byteorder(buf)
+    (length,) = struct.unpack_from(byteorder + _WEA_DESCR_FORMAT, buf, pos)
+    pos += _WEA_DESCR_SIZEOF
+    if not 0 < length <= off - pos:
+        raise TypeError("WrappedArray type descriptor is truncated")
+    try:
+        descr = ast.literal_eval(bytes(buf[pos : pos + length]).decode("utf-8"))
+        return npformat.descr_to_dtype(descr)
+    except (ValueError, TypeError, SyntaxError, UnicodeDecodeError) as err:
+        raise TypeError("WrappedArray type descriptor is invalid") from err
+
+
+def _pack_header(
+    buf: Union[memoryview, bytearray],
+    eltype: int,
+    shape: tuple,
+    off: int,
+    flags: int = 0,
+    descr: bytes = b"",
+    byteorder: str = "=",
+):
+    """
+    Pack the header fields into a buffer
+
+    :param buf: Header buffer
+    :type buf: bytes
+    :param eltype: Type identifier
+    :type eltype: int
+    :param shape: Array dimension
+    :type shape: tuple
+    :param off: Offset to the start of the array
+    :type off: int
+    :param flags: Extension flags, defaults to 0
+    :type flags: int, optional
+    :param descr: Type descriptor of structured data formats, defaults to
+     no descriptor
+    :type descr: bytes, optional
+    :param byteorder: struct byte order prefix, defaults to native
+    :type byteorder: str, optional
+    """
+    n_count = len(shape)
+    _header_struct(byteorder, n_count).pack_into(
+        buf, 0, int(_JULIA_WA_MAGIC), eltype, n_count, off, *shape
+    )
+    ext = _extension_offset(n_count)
+    if off - ext >= _WEA_EXT_SIZEOF:
+        buf[ext : ext + _WEA_EXT_SIZEOF] = bytes(_WEA_EXT_SIZEOF)
+        _ext_struct(byteorder).pack_into(
+            buf, ext, int(_WEA_EXT_MAGIC), _WEA_EXT_VERSION, flags
+        )
+    if descr:
+        pos = ext + _WEA_EXT_SIZEOF
+        struct.pack_into(byteorder + _WEA_DESCR_FORMAT, buf, pos, len(descr))
+        pos += _WEA_DESCR_SIZEOF
+        buf[pos : pos + len(descr)] = descr
 
 
 def _read_header(buf: Union[memoryview, bytearray]):
@@ -97,11 +391,220 @@ def _read_header(buf: Union[memoryview, bytearray]):
      to the start of the array, Array shape
     :rtype: Tuple[int, int, int, int, tuple]
     """
-    magic, eltype, n_count, off = struct.unpack_from(_JULIA_WA_HEADER_FORMAT, buf)
-    dims = struct.unpack_from(
-        "".join(["q" for _ in range(0, n_count, 1)]), buf, int(_JULIA_WA_HEADER_SIZEOF)
+    byteorder = _header_byteorder(buf)
+    magic, eltype, n_count, off = _header_struct(byteorder, 0).unpack_from(buf)
+    dims = _dims_struct(byteorder, n_count).unpack_from(buf, _JULIA_WA_HEADER_SIZEOF)
+    return magic, eltype, n_count, off, dims
+
+
+def _header_dims(buf: Union[memoryview, bytearray], n_count: int) -> np.ndarray:
+    """
+    Map the dimensions of a header, e.g. for updating the length of a
+    growable array in place
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray]
+    :param n_count: Dimensions
+    :type n_count: int
+    :return: Dimensions in the byte order of the header
+    :rtype: np.ndarray
+    """
+    return np.ndarray(
+        (n_count,),
+        dtype=np.dtype(_header_byteorder(buf) + "i8"),
+        buffer=buf,
+        offset=_JULIA_WA_HEADER_SIZEOF,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _header_struct(byteorder: str, n_count: int) -> struct.Struct:
+    """
+    Compiled codec of the fixed header fields followed by the dimensions
+
+    :param byteorder: struct byte order prefix
+    :type byteorder: str
+    :param n_count: Dimensions
+    :type n_count: int
+    :return: Header codec
+    :rtype: struct.Struct
+    """
+    return struct.Struct(f"{byteorder}{_JULIA_WA_HEADER_FORMAT}{n_count}q")
+
+
+@functools.lru_cache(maxsize=None)
+def _dims_struct(byteorder: str, n_count: int) -> struct.Struct:
+    """
+    Compiled codec of the dimensions
+
+    :param byteorder: struct byte order prefix
+    :type byteorder: str
+    :param n_count: Dimensions
+    :type n_count: int
+    :return: Dimension codec
+    :rtype: struct.Struct
+    """
+    return struct.Struct(f"{byteorder}{n_count}q")
+
+
+@functools.lru_cache(maxsize=None)
+def _ext_struct(byteorder: str) -> struct.Struct:
+    """
+    Compiled codec of the first word of the wea extension block
+
+    :param byteorder: struct byte order prefix
+    :type byteorder: str
+    :return: Extension codec
+    :rtype: struct.Struct
+    """
+    return struct.Struct(byteorder + _WEA_EXT_FORMAT)
+
+
+def _extension_offset(n_count: int) -> int:
+    """
+    Calculate the offset of the wea extension block
+
+    :param n_count: Dimensions
+    :type n_count: int
+    :return: Offset right behind the dimensions
+    :rtype: int
+    """
+    return _JULIA_WA_HEADER_SIZEOF + n_count * _JULIA_WA_DIM_SIZEOF
+
+
+def _extension(
+    buf: Union[memoryview, bytearray], n_count: int, off: int
+) -> Optional[np.ndarray]:
+    """
+    Map the wea extension block of a header
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray]
+    :param n_count: Dimensions
+    :type n_count: int
+    :param off: Offset to the start of the array
+    :type off: int
+    :return: Extension words in the byte order of the header or None if the
+     header has no extension block, e.g. if it was written by Julia
+    :rtype: typing.Optional[np.ndarray]
+    """
+    ext = _extension_offset(n_count)
+    if off - ext < _WEA_EXT_SIZEOF:
+        return None
+    (magic,) = _MAGIC_STRUCT.unpack_from(buf, ext)
+    if magic == _WEA_EXT_MAGIC:
+        dtype = np.dtype(np.int64)
+    elif magic == _WEA_EXT_MAGIC.byteswap():
+        dtype = np.dtype(np.int64).newbyteorder()
+    else:
+        return None
+    return np.ndarray(
+        (_WEA_EXT_SIZEOF // dtype.itemsize,), dtype=dtype, buffer=buf, offset=ext
     )
-    return magic, eltype, n_count, off, tuple(dims)
+
+
+def _require_extension(
+    buf: Union[memoryview, bytearray], n_count: int, off: int
+) -> np.ndarray:
+    """
+    Map the wea extension block of a header which has to provide one
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray]
+    :param n_count: Dimensions
+    :type n_count: int
+    :param off: Offset to the start of the array
+    :type off: int
+    :raises TypeError: If the header has no extension block
+    :return: Extension words in the byte order of the header
+    :rtype: np.ndarray
+    """
+    ext = _extension(buf, n_count, off)
+    if ext is None:
+        raise TypeError("Exchange buffer header has no extension block")
+    return ext
+
+
+def _extension_flags(ext: np.ndarray) -> int:
+    """
+    Read the flags of a wea extension block
+
+    :param ext: Extension words
+    :type ext: np.ndarray
+    :return: Flags
+    :rtype: int
+    """
+    _, _, flags = _ext_struct(_dtype_byteorder(ext.dtype)).unpack_from(ext.data)
+    return flags
+
+
+def _header_flags(buf: Union[memoryview, bytearray, bytes]) -> int:
+    """
+    Read the flags of the wea extension block of a header
+
+    :param buf: Header buffer
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :return: Flags, zero if the header has no extension block
+    :rtype: int
+    """
+    buf = memoryview(buf)
+    _, _, n_count, off, _ = _read_header(buf)
+    ext = _extension(buf, n_count, off)
+    return 0 if ext is None else _extension_flags(ext)
+
+
+def _set_extension_flags(ext: np.ndarray, flags: int):
+    """
+    Write the flags of a wea extension block
+
+    :param ext: Extension words
+    :type ext: np.ndarray
+    :param flags: Flags
+    :type flags: int
+    """
+    _ext_struct(_dtype_byteorder(ext.dtype)).pack_into(
+        ext.data, 0, int(_WEA_EXT_MAGIC), _WEA_EXT_VERSION, flags
+    )
+
+
+def _encode_key(key: str) -> bytes:
+    """
+    Encode an array key for a directory entry
+
+    :param key: Array key
+    :type key: str
+    :raises ValueError: If the key is empty or too long
+    :return: Encoded key
+    :rtype: bytes
+    """
+    encoded = key.encode("utf-8")
+    if not 0 < len(encoded) <= _WEA_KEY_SIZEOF:
+        raise ValueError(f"Key {key} must have between 1 and {_WEA_KEY_SIZEOF} bytes")
+    return encoded
+
+
+def _decode_key(encoded: bytes) -> str:
+    """
+    Decode an array key of a directory entry
+
+    :param encoded: Encoded key
+    :type encoded: bytes
+    :return: Array key
+    :rtype: str
+    """
+    return encoded.rstrip(b"\0").decode("utf-8")
+
+
+def _align(size: int) -> int:
+    """
+    Align a size or offset to the WrappedArray alignment
+
+    :param size: Size or offset
+    :type size: int
+    :return: Aligned size or offset
+    :rtype: int
+    """
+    return -(-size // _JULIA_WA_AGLIGN) * _JULIA_WA_AGLIGN
 
 
 def _wrapped_exchange_array_header_size(n_count: int):
@@ -113,9 +616,21 @@ def _wrapped_exchange_array_header_size(n_count: int):
     :return: Up-rounded size
     :rtype: int
     """
-    add = _JULIA_WA_HEADER_SIZEOF + n_count * np.dtype("int64").itemsize
-    cld = roundup(add, _JULIA_WA_AGLIGN)
-    return int(cld)
+    return roundup(_extension_offset(n_count), _JULIA_WA_AGLIGN)
+
+
+def _max_header_size(n_count: int) -> int:
+    """
+    Calculate the largest valid header size, i.e. a header with the
+    longest type descriptor
+
+    :param n_count: Dimensions
+    :type n_count: int
+    :return: Up-rounded size
+    :rtype: int
+    """
+    end = _extension_offset(n_count) + _WEA_EXT_SIZEOF + _WEA_DESCR_SIZEOF
+    return _align(end + _WEA_DESCR_MAX_SIZE)
 
 
 def _calculate_size(shape: tuple, dtype: np.dtype):
@@ -132,8 +647,11 @@ def _calculate_size(shape: tuple, dtype: np.dtype):
     n_count = len(shape)
     num = checkdims(shape)
     off = _wrapped_exchange_array_header_size(n_count)
-    size = off + dtype.itemsize * num
-    return int(size), int(off), int(n_count)
+    descr = _descriptor(dtype)
+    if descr:
+        end = _extension_offset(n_count) + _WEA_EXT_SIZEOF + _WEA_DESCR_SIZEOF
+        off = max(off, _align(end + len(descr)))
+    return off + dtype.itemsize * num, off, n_count
 
 
 def check_buffer_array(buf: Union[memoryview, bytearray]) -> Tuple:
@@ -149,12 +667,165 @@ def check_buffer_array(buf: Union[memoryview, bytearray]) -> Tuple:
     :return: Offset, dtype and dimesions
     :rtype: Tuple
     """
+    start = time.perf_counter() if instrumentation.HOOKS else None
     if len(buf) < _JULIA_WA_HEADER_SIZEOF:
         raise MemoryError("Shared memory is smaller than header size")
-    magic, eltype, _, off, dims = _read_header(buf)
+    magic, eltype, n_count, off, dims = _read_header(buf)
     if magic != _JULIA_WA_MAGIC:
         raise TypeError(f"WrappedArray version {magic} not supported")
-    if eltype > len(_JULIA_WA_ELTYPES):
+    if eltype == _WEA_STRUCTURED:
+        pytype = _read_descriptor(buf, n_count, off)
+    elif eltype in _WEA_ELTYPES:
+        pytype = _WEA_ELTYPES[eltype]
+        if _header_byteorder(buf) != "=":
+            pytype = pytype.newbyteorder()
+    else:
         raise TypeError("Provided eltype not found in supported list")
-    pytype = _JULIA_WA_ELTYPES[eltype - 1]
+    if start is not None:
+        instrumentation.emit(instrumentation.HEADER_DECODE, time.perf_counter() - start)
     return off, pytype, dims
+
+
+def _frame_size(header: Union[memoryview, bytearray, bytes]) -> int:
+    """
+    Calculate the size of an exchange frame from its header
+
+    :param header: Complete header
+    :type header: typing.Union[memoryview, bytearray, bytes]
+    :return: Frame size
+    :rtype: int
+    """
+    header = memoryview(header)
+    off, pytype, dims = check_buffer_array(header)
+    if _header_flags(header) & _WEA_FLAG_PAYLOAD:
+        ext = _require_extension(header, len(dims), off)
+        return off + int(ext[_WEA_EXT_PAYLOAD])
+    size, _, _ = _calculate_size(dims, pytype)
+    return size
+
+
+def index_frames(
+    buf: Union[memoryview, bytearray, bytes]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Index a buffer of back-to-back exchange frames, e.g. a stream written by
+    wea.stream.write_arrays
+
+    Runs of frames with identical headers are detected by comparing the
+    headers of the following frames with numpy at once, thus buffers of many
+    equally shaped frames are indexed without parsing every header.
+
+    :param buf: Buffer of concatenated exchange frames
+    :type buf: typing.Union[memoryview, bytearray, bytes]
+    :raises MemoryError: If the last frame is truncated
+    :raises TypeError: If a header is invalid
+    :return: Frame offsets, frame sizes, dtypes and shapes, the latter two
+     as object arrays
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    """
+    view = memoryview(buf).cast("B")
+    data = np.frombuffer(view, dtype=np.uint8)
+    runs = []
+    pos = 0
+    while pos < len(view):
+        try:
+            off, pytype, dims = check_buffer_array(view[pos:])
+        except struct.error as err:
+            raise MemoryError("Exchange frame is truncated") from err
+        if len(view) - pos < off:
+            raise MemoryError("Exchange frame is truncated")
+        size = _frame_size(view[pos : pos + off])
+        if len(view) - pos < size:
+            raise MemoryError("Exchange frame is truncated")
+        count = _header_run(data[pos:], off, size)
+        runs.append((pos, count, size, pytype, dims))
+        pos += count * size
+    offsets = np.concatenate(
+        [
+            np.arange(start, start + count * size, size)
+            for start, count, size, _, _ in runs
+        ]
+        or [np.empty(0, dtype=np.int64)]
+    ).astype(np.int64)
+    counts = [count for _, count, _, _, _ in runs]
+    sizes = np.repeat(np.array([size for _, _, size, _, _ in runs], np.int64), counts)
+    dtypes = np.empty(len(runs), dtype=object)
+    shapes = np.empty(len(runs), dtype=object)
+    for idx, (_, _, _, pytype, dims) in enumerate(runs):
+        dtypes[idx], shapes[idx] = pytype, dims
+    return offsets, sizes, np.repeat(dtypes, counts), np.repeat(shapes, counts)
+
+
+def _header_run(data: np.ndarray, off: int, size: int) -> int:
+    """
+    Count the frames at the start of a buffer which repeat the header of the
+    first frame, probing windows of doubling length
+
+    :param data: Bytes starting at the first frame
+    :type data: np.ndarray
+    :param off: Header size
+    :type off: int
+    :param size: Frame size
+    :type size: int
+    :return: Number of frames with identical header, at least one
+    :rtype: int
+    """
+    available = len(data) // size
+    count, window = 1, 1
+    header = data[:off]
+    while count < available:
+        stop = min(count + window, available)
+        frames = data[count * size : stop * size].reshape(stop - count, size)
+        same = np.all(frames[:, :off] == header, axis=1)
+        if not same.all():
+            return count + int(np.argmin(same))
+        count, window = stop, window * 2
+    return count
+
+
+def _swap_byteorder(buf: Union[memoryview, bytearray]) -> np.dtype:
+    """
+    Convert an exchange buffer of the other byte order to the native byte
+    order in place, the header as well as the array data
+
+    :param buf: Writable exchange buffer
+    :type buf: typing.Union[memoryview, bytearray]
+    :raises TypeError: If the buffer is compressed or a delta frame
+    :raises TypeError: If the buffer is read-only
+    :return: Native data format
+    :rtype: np.dtype
+    """
+    off, pytype, dims = check_buffer_array(buf)
+    native = pytype.newbyteorder("=")
+    if native == pytype and _header_byteorder(buf) == "=":
+        return pytype
+    if _header_flags(buf) & _WEA_FLAG_PAYLOAD:
+        raise TypeError("Exchange buffer payload is no array data")
+    if memoryview(buf).readonly:
+        raise TypeError("Exchange buffer is read-only and can not be swapped")
+    _byteswap(np.ndarray((checkdims(dims),), dtype=pytype, buffer=buf, offset=off))
+    ext = _extension(buf, len(dims), off)
+    words = None if ext is None else ext.tolist()
+    flags = 0 if ext is None else _extension_flags(ext)
+    descr = _descriptor(native)
+    if len(descr) != len(_descriptor(pytype)):
+        raise TypeError("Native type descriptor does not fit into the header")
+    _pack_header(buf, _eltype(native), dims, off, flags, descr)
+    if words is not None:
+        _require_extension(buf, len(dims), off)[1:] = words[1:]
+    return native
+
+
+def _byteswap(arr: np.ndarray):
+    """
+    Swap the non-native parts of an array in place, field by field for
+    structured data formats
+
+    :param arr: Array
+    :type arr: np.ndarray
+    """
+    if arr.dtype.names is not None:
+        for name in arr.dtype.names:
+            _byteswap(arr[name])
+    elif not arr.dtype.isnative:
+        arr.byteswap(inplace=True)
@@ -0,0 +1,129 @@
+"""
+Paging control for memory mapped Wrapped Exchange Arrays
+"""
+# pylint: disable=W1202,W1203
+import logging
+import mmap
+import sys
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+_MADV_POPULATE_READ = 22 if sys.platform.startswith("linux") else None
+_MADV_POPULATE_WRITE = 23 if sys.platform.startswith("linux") else None
+
+
+def advise(arr: np.ndarray, *advice: str) -> None:
+    """
+    Apply madvise hints to the pages of a memory mapped array
+
+    :param arr: Shared memory or memory mapped file array
+    :type arr: np.ndarray
+    :param advice: Hint names like "sequential", "willneed" or "hugepage"
+    :type advice: str
+    :raises ValueError: If a hint is not available on the platform
+    """
+    mm, start, length = _mapped_range(arr)
+    for name in advice:
+        option = getattr(mmap, f"MADV_{name.upper()}", None)
+        if option is None or not hasattr(mm, "madvise"):
+            raise ValueError(f"Advice {name} is not supported on this platform")
+        LOGGER.debug(f"Advising {length} bytes as {name}")
+        mm.madvise(option, start, length)
+
+
+def prefault(arr: np.ndarray, threads: int = 1) -> float:
+    """
+    Fault in all pages of a memory mapped array in advance, which moves the
+    page fault latency from the first access to this call
+
+    A single thread uses MADV_POPULATE_READ/WRITE if the kernel supports it,
+    where copy-on-write maps are only populated for reading in order to keep
+    their pages shared with the file. Otherwise and with more threads, one
+    byte per page is read.
+
+    :param arr: Shared memory or memory mapped file array
+    :type arr: np.ndarray
+    :param threads: Number of threads touching the pages, defaults to 1
+    :type threads: int, optional
+    :return: Elapsed time in seconds
+    :rtype: float
+    """
+    start_time = time.perf_counter()
+    mm, start, length = _mapped_range(arr)
+    populate = _populate_option(arr)
+    if threads <= 1 and populate is not None and _populate(mm, populate, start, length):
+        LOGGER.debug(f"Populated {length} bytes")
+    elif length > 0:
+        pages = np.ndarray((length,), dtype=np.uint8, buffer=mm, offset=start)
+        bounds = np.linspace(0, -(-length // mmap.PAGESIZE), max(threads, 1) + 1)
+        chunks = [
+            pages[int(lower) * mmap.PAGESIZE : int(upper) * mmap.PAGESIZE]
+            for lower, upper in zip(bounds[:-1], bounds[1:])
+        ]
+        with ThreadPoolExecutor(max_workers=max(threads, 1)) as pool:
+            list(pool.map(lambda chunk: chunk[:: mmap.PAGESIZE].sum(), chunks))
+        LOGGER.debug(f"Touched {length} bytes with {threads} threads")
+    return time.perf_counter() - start_time
+
+
+def _populate_option(arr: np.ndarray) -> typing.Optional[int]:
+    """
+    Select the madvise option for populating the pages of an array
+
+    :param arr: Shared memory or memory mapped file array
+    :type arr: np.ndarray
+    :return: MADV_POPULATE_WRITE for writeable shared maps, otherwise
+     MADV_POPULATE_READ, None if not available
+    :rtype: typing.Optional[int]
+    """
+    if arr.flags.writeable and getattr(arr, "_access", None) != mmap.ACCESS_COPY:
+        return _MADV_POPULATE_WRITE
+    return _MADV_POPULATE_READ
+
+
+def _populate(mm: mmap.mmap, option: int, start: int, length: int) -> bool:
+    """
+    Populate pages with madvise
+
+    :param mm: Memory map
+    :type mm: mmap.mmap
+    :param option: MADV_POPULATE_READ or MADV_POPULATE_WRITE
+    :type option: int
+    :param start: Page aligned offset
+    :type start: int
+    :param length: Number of bytes
+    :type length: int
+    :return: False if the kernel does not support the option
+    :rtype: bool
+    """
+    try:
+        mm.madvise(option, start, length)
+    except OSError:
+        return False
+    return True
+
+
+def _mapped_range(arr: np.ndarray) -> typing.Tuple[mmap.mmap, int, int]:
+    """
+    Find the memory map of an array and the page range of its data
+
+    :param arr: Shared memory or memory mapped file array
+    :type arr: np.ndarray
+    :raises TypeError: If the array is not memory mapped
+    :return: Memory map, page aligned offset and number of bytes
+    :rtype: typing.Tuple[mmap.mmap, int, int]
+    """
+    mem = getattr(arr, "_mem", None)
+    mm = getattr(mem, "_mmap", None) if mem is not None else getattr(arr, "_mmap", None)
+    if mm is None:
+        raise TypeError("Array is not memory mapped")
+    base = np.frombuffer(mm, dtype=np.uint8).__array_interface__["data"][0]
+    data = arr.__array_interface__["data"][0] - base
+    start = data // mmap.PAGESIZE * mmap.PAGESIZE
+    end = min(data + arr.nbytes, len(mm))
+    return mm, start, end - start
@@ -0,0 +1,95 @@
+"""
+Multi-threaded bulk copies of Wrapped Exchange Arrays
+"""
+# pylint: disable=W1202,W1203
+import logging
+import os
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import instrumentation
+
+LOGGER = logging.getLogger(__name__)
+
+# Smaller chunks do not pay off the thread handover
+_MIN_CHUNK = 1 << 22
+
+
+def parallel_copy(
+    dst: np.ndarray, src: typing.Any, threads: typing.Optional[int] = None
+) -> np.ndarray:
+    """
+    Copy an array into another one with several threads, since numpy
+    releases the GIL while copying
+
+    Arrays of the same memory layout, e.g. Fortran ordered arrays of the
+    backends, are split into contiguous ranges of bytes. Otherwise the copy
+    is split along the slowest varying axis of the destination. Copies
+    smaller than 4 MiB per thread use fewer threads. Overlapping source and
+    destination are copied by numpy in one piece, since the chunks would
+    read data which another thread already overwrote. Values are cast like
+    in an assignment.
+
+    :param dst: Destination array
+    :type dst: np.ndarray
+    :param src: Source array or anything which broadcasts to the destination
+    :type src: typing.Any
+    :param threads: Number of threads, defaults to the number of CPUs
+    :type threads: typing.Optional[int], optional
+    :return: Destination array
+    :rtype: np.ndarray
+    """
+    target = dst.view(np.ndarray)
+    source = np.broadcast_to(np.asanyarray(src).view(np.ndarray), target.shape)
+    threads = threads or os.cpu_count() or 1
+    count = max(min(threads, target.nbytes // _MIN_CHUNK), 1)
+    if count == 1 or np.may_share_memory(target, source):
+        np.copyto(target, source, casting="unsafe")
+    else:
+        pairs = _split(target, source, count)
+        LOGGER.debug(f"Copying {target.nbytes} bytes in {len(pairs)} chunks")
+        with ThreadPoolExecutor(max_workers=len(pairs)) as pool:
+            list(
+                pool.map(
+                    lambda pair: np.copyto(pair[0], pair[1], casting="unsafe"), pairs
+                )
+            )
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.BYTES_COPIED, target.nbytes)
+    return dst
+
+
+def _split(
+    dst: np.ndarray, src: np.ndarray, count: int
+) -> typing.List[typing.Tuple[np.ndarray, np.ndarray]]:
+    """
+    Split destination and source into matching chunks
+
+    :param dst: Destination array
+    :type dst: np.ndarray
+    :param src: Source array with the shape of the destination
+    :type src: np.ndarray
+    :param count: Number of chunks
+    :type count: int
+    :return: Destination and source chunk pairs
+    :rtype: typing.List[typing.Tuple[np.ndarray, np.ndarray]]
+    """
+    if dst.flags.f_contiguous and src.flags.f_contiguous:
+        dst, src = dst.reshape(-1, order="F"), src.reshape(-1, order="F")
+    elif dst.flags.c_contiguous and src.flags.c_contiguous:
+        dst, src = dst.reshape(-1, order="C"), src.reshape(-1, order="C")
+    axis = max(
+        (idx for idx in range(dst.ndim) if dst.shape[idx] > 1),
+        key=lambda idx: abs(dst.strides[idx]),
+        default=0,
+    )
+    length = dst.shape[axis] if dst.ndim else 1
+    edges = [length * idx // count for idx in range(count + 1)]
+    pairs = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        if stop > start:
+            index = (slice(None),) * axis + (slice(start, stop),)
+            pairs.append((dst[index], src[index]))
+    return pairs
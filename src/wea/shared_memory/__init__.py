@@ -1,10 +1,55 @@
 """
 Shared Memory Wrapped Exchange Array
 """
+from .shared_arena import SharedArena, attach_shared_arena, create_shared_arena
+from .shared_array_cache import (
+    SharedArrayCache,
+    attach_cached_array,
+    release_cached_array,
+)
 from .shared_exchange_array import (
     SharedExchangeArray,
     attach_shared_array,
     create_shared_array,
 )
+from .shared_executor import SharedArrayExecutor
+from .shared_growable_array import (
+    SharedGrowableArray,
+    attach_growable_array,
+    create_growable_array,
+)
+from .shared_multi_buffer import (
+    SharedMultiBuffer,
+    attach_multi_buffer,
+    create_multi_buffer,
+)
+from .shared_ring_buffer import (
+    SharedRingBuffer,
+    attach_ring_buffer,
+    create_ring_buffer,
+)
+from .shared_window import SharedWindow, attach_shared_window
 
-__all__ = ["SharedExchangeArray", "create_shared_array", "attach_shared_array"]
+__all__ = [
+    "SharedExchangeArray",
+    "create_shared_array",
+    "attach_shared_array",
+    "SharedRingBuffer",
+    "create_ring_buffer",
+    "attach_ring_buffer",
+    "SharedMultiBuffer",
+    "create_multi_buffer",
+    "attach_multi_buffer",
+    "SharedArrayCache",
+    "attach_cached_array",
+    "release_cached_array",
+    "SharedArena",
+    "create_shared_arena",
+    "attach_shared_arena",
+    "SharedArrayExecutor",
+    "SharedGrowableArray",
+    "create_growable_array",
+    "attach_growable_array",
+    "SharedWindow",
+    "attach_shared_window",
+]
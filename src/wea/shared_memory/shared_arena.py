@@ -0,0 +1,277 @@
+"""
+Arena which hosts many Wrapped Exchange Arrays in one shared memory segment
+"""
+# pylint: disable=W1202,W1203
+import logging
+import struct
+import typing
+from multiprocessing import shared_memory
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .. import instrumentation
+from ..meta_data import (
+    _JULIA_WA_AGLIGN,
+    _WEA_ENTRY_FORMAT,
+    _WEA_ENTRY_SIZEOF,
+    _align,
+    _calculate_size,
+    _decode_key,
+    _encode_key,
+    _write_header,
+)
+from .shared_exchange_array import (
+    SharedExchangeArray,
+    _segment_buffer,
+    _wrap_shared_array,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_WEA_ARENA_MAGIC = np.uint32(0x57454141)
+_WEA_ARENA_FORMAT = "2I2q"
+_WEA_ARENA_SIZEOF = _JULIA_WA_AGLIGN
+
+
+class SharedArena:
+    """
+    Shared memory segment with a directory of WrappedArrays
+
+    The segment starts with the arena header and a directory of fixed-size
+    entries, which map a key to the offset of a WrappedArray inside the
+    segment. Every array is placed at an aligned offset with its own
+    WrappedArray header. Space is allocated by bumping the end of the used
+    region, thus arrays cannot be freed individually. Only one process is
+    allowed to create arrays at a time, while every process can attach.
+    """
+
+    def __init__(self, shm: SharedMemory):
+        magic, entries, _, _ = struct.unpack_from(
+            _WEA_ARENA_FORMAT, _segment_buffer(shm)
+        )
+        if magic != _WEA_ARENA_MAGIC:
+            raise TypeError(f"Shared memory segment {shm.name} is no arena")
+        self._mem = shm
+        self._entries = entries
+        self._directory: typing.Dict[str, int] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._header()[3]
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    def __getitem__(self, key: str) -> SharedExchangeArray:
+        return self.attach(key)
+
+    @property
+    def mem(self) -> SharedMemory:
+        """
+        Return shared memory handle
+
+        :return: shared memory handle
+        :rtype: multiprocessing.shared_memory.SharedMemory
+        """
+        return self._mem
+
+    @property
+    def free(self) -> int:
+        """
+        Return the number of bytes left for new arrays
+
+        :return: Free bytes
+        :rtype: int
+        """
+        return self._mem.size - self._header()[2]
+
+    def keys(self) -> typing.List[str]:
+        """
+        Return the keys of all arrays in the arena
+
+        :return: Array keys
+        :rtype: typing.List[str]
+        """
+        self._refresh()
+        return list(self._directory)
+
+    def create(
+        self, key: str, dtype: np.dtype, shape: tuple, order: str = "F"
+    ) -> SharedExchangeArray:
+        """
+        Create a new WrappedExchangeArray inside the arena
+
+        :param key: Array key with at most 48 bytes in UTF-8
+        :type key: str
+        :param dtype: Data format
+        :type dtype: np.dtype
+        :param shape: Array dimension
+        :type shape: tuple
+        :param order: Memory layout, defaults to "F"
+        :type order: str, optional
+        :raises FileExistsError: If the key already exists
+        :raises MemoryError: If the arena is out of space or entries
+        :return: Returns a WrappedArray instance
+        :rtype: WrappedArray
+        """
+        encoded = _encode_key(key)
+        if self._lookup(key) is not None:
+            raise FileExistsError(f"Array {key} already exists in arena")
+        _, entries, end, count = self._header()
+        if count >= entries:
+            raise MemoryError("Arena directory is full")
+        size, _, _ = _calculate_size(shape, dtype)
+        base = _align(end)
+        if base + size > self._mem.size:
+            raise MemoryError("Arena is too small for wrapped array")
+        LOGGER.debug(f"Creating array {key} at offset {base} in arena")
+        _write_header(
+            _segment_buffer(self._mem)[base : base + size], dtype, shape, order
+        )
+        struct.pack_into(
+            _WEA_ENTRY_FORMAT,
+            _segment_buffer(self._mem),
+            _WEA_ARENA_SIZEOF + count * _WEA_ENTRY_SIZEOF,
+            encoded,
+            np.int64(base),
+            np.int64(size),
+        )
+        self._pack_header(end=base + size, count=count + 1)
+        self._directory[key] = base
+        return _wrap_shared_array(self._mem, base)
+
+    def attach(self, key: str) -> SharedExchangeArray:
+        """
+        Attach to an existing WrappedExchangeArray inside the arena
+
+        :param key: Array key
+        :type key: str
+        :raises KeyError: If the key does not exist
+        :return: Returns a WrappedArray instance
+        :rtype: WrappedArray
+        """
+        base = self._lookup(key)
+        if base is None:
+            raise KeyError(key)
+        return _wrap_shared_array(self._mem, base)
+
+    def close(self) -> None:
+        """
+        Close shared memory segment
+        """
+        self._mem.close()
+        if instrumentation.HOOKS:
+            instrumentation.emit(instrumentation.SEGMENT_CLOSED, self._mem.size)
+
+    def unlink(self) -> None:
+        """
+        Unlink shared memory segment
+        """
+        self._mem.unlink()
+        if instrumentation.HOOKS:
+            instrumentation.emit(instrumentation.SEGMENT_UNLINKED, self._mem.size)
+
+    def _header(self) -> typing.Tuple[int, int, int, int]:
+        """
+        Protected read of the arena header
+
+        :return: Magic, number of entries, end of the used region and count
+        :rtype: typing.Tuple[int, int, int, int]
+        """
+        return struct.unpack_from(_WEA_ARENA_FORMAT, _segment_buffer(self._mem))
+
+    def _pack_header(self, end: int, count: int) -> None:
+        """
+        Protected write of the arena header
+
+        :param end: End of the used region
+        :type end: int
+        :param count: Number of arrays
+        :type count: int
+        """
+        struct.pack_into(
+            _WEA_ARENA_FORMAT,
+            _segment_buffer(self._mem),
+            0,
+            np.uint32(_WEA_ARENA_MAGIC),
+            np.uint32(self._entries),
+            np.int64(end),
+            np.int64(count),
+        )
+
+    def _lookup(self, key: str) -> typing.Optional[int]:
+        """
+        Protected lookup of an array offset, new directory entries of other
+        processes are read on a miss
+
+        :param key: Array key
+        :type key: str
+        :return: Offset of the array header or None
+        :rtype: typing.Optional[int]
+        """
+        if key not in self._directory:
+            self._refresh()
+        return self._directory.get(key)
+
+    def _refresh(self) -> None:
+        """
+        Protected read of the directory entries which are not known yet
+        """
+        for idx in range(len(self._directory), len(self)):
+            encoded, base, _ = struct.unpack_from(
+                _WEA_ENTRY_FORMAT,
+                _segment_buffer(self._mem),
+                _WEA_ARENA_SIZEOF + idx * _WEA_ENTRY_SIZEOF,
+            )
+            self._directory[_decode_key(encoded)] = base
+
+
+def create_shared_arena(name: str, size: int, entries: int = 1024) -> SharedArena:
+    """
+    Create a new arena in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :param size: Bytes available for arrays including their headers
+    :type size: int
+    :param entries: Maximum number of arrays, defaults to 1024
+    :type entries: int, optional
+    :return: Returns a SharedArena instance
+    :rtype: SharedArena
+    """
+    start = _WEA_ARENA_SIZEOF + entries * _WEA_ENTRY_SIZEOF
+    LOGGER.debug(f"Creating arena {name} with {entries} entries")
+    shm = shared_memory.SharedMemory(name=name, create=True, size=start + size)
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.SEGMENT_CREATED, shm.size)
+    struct.pack_into(
+        _WEA_ARENA_FORMAT,
+        _segment_buffer(shm),
+        0,
+        np.uint32(_WEA_ARENA_MAGIC),
+        np.uint32(entries),
+        np.int64(start),
+        np.int64(0),
+    )
+    return SharedArena(shm)
+
+
+def attach_shared_arena(name: str) -> SharedArena:
+    """
+    Attach to an existing arena in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :return: Returns a SharedArena instance
+    :rtype: SharedArena
+    """
+    shm = shared_memory.SharedMemory(name=name, create=False)
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.SEGMENT_ATTACHED, shm.size)
+    return SharedArena(shm)
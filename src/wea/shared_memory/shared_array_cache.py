@@ -0,0 +1,215 @@
+"""
+Process-wide cache of attached shared memory Wrapped Exchange Arrays
+"""
+# pylint: disable=W1202,W1203
+import collections
+import contextlib
+import logging
+import os
+import threading
+import time
+import typing
+
+from .shared_exchange_array import SharedExchangeArray
+
+LOGGER = logging.getLogger(__name__)
+
+_SHM_DIRECTORY = "/dev/shm"
+
+
+class _CacheEntry:
+    """
+    Cached mapping with its reference count
+    """
+
+    __slots__ = ("name", "array", "refs", "last_used", "identity")
+
+    def __init__(self, name: str, identity: typing.Optional[tuple]):
+        self.name = name
+        self.array = SharedExchangeArray(name, False)
+        self.refs = 0
+        self.last_used = time.monotonic()
+        self.identity = identity
+
+
+class SharedArrayCache:
+    """
+    Cache of attached shared memory segments keyed by segment name
+
+    Attaching returns a view over the cached mapping and increments the
+    reference count of the mapping. The view is the handle for releasing the
+    reference again. Idle mappings, i.e. without references, are dropped if
+    more than maxsize segments are cached (least recently used first) or if
+    they were not used for ttl seconds. If validate is set, every attach
+    checks whether the segment was recreated or resized under the same name
+    and maps it again if so. The previous mapping keeps its own reference
+    count. The check relies on the shared memory directory of Linux and is
+    skipped on other platforms.
+
+    numpy arrays reference the mapping without holding a buffer export, thus
+    closing it explicitly would invalidate views which are still in use.
+    Dropped mappings are unmapped with their last view instead.
+    """
+
+    def __init__(
+        self, maxsize: int = 128, ttl: typing.Optional[float] = None, validate=True
+    ):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._validate = validate and os.path.isdir(_SHM_DIRECTORY)
+        self._entries: typing.OrderedDict[str, _CacheEntry] = collections.OrderedDict()
+        self._mappings: typing.Dict[int, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def attach(self, name: str) -> SharedExchangeArray:
+        """
+        Attach to a shared memory segment through the cache
+
+        :param name: Shared memory location
+        :type name: str
+        :raises FileNotFoundError: If the segment does not exist
+        :return: View over the cached mapping, the handle for release
+        :rtype: SharedExchangeArray
+        """
+        identity = _segment_identity(name) if self._validate else None
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.identity != identity:
+                LOGGER.debug(f"Shared memory segment {name} was recreated")
+                self._drop(name)
+                entry = None
+            if entry is None:
+                entry = _CacheEntry(name, identity)
+                self._entries[name] = entry
+                self._mappings[id(entry.array.mem)] = entry
+            self._entries.move_to_end(name)
+            entry.refs += 1
+            entry.last_used = time.monotonic()
+            self._evict()
+            return entry.array.view(SharedExchangeArray)
+
+    def release(self, array: SharedExchangeArray) -> None:
+        """
+        Release the reference of an array which was attached through the cache
+
+        :param array: View returned by attach
+        :type array: SharedExchangeArray
+        :raises ValueError: If the array holds no reference of the cache
+        """
+        with self._lock:
+            entry = self._mappings.get(id(getattr(array, "_mem", None)))
+            if entry is None or entry.refs == 0:
+                raise ValueError("Array holds no reference of the cache")
+            entry.refs -= 1
+            entry.last_used = time.monotonic()
+            if entry.refs == 0 and self._entries.get(entry.name) is not entry:
+                self._forget(entry)
+            self._evict()
+
+    @contextlib.contextmanager
+    def attached(self, name: str):
+        """
+        Context manager which attaches and releases a segment
+
+        :param name: Shared memory location
+        :type name: str
+        :yield: View over the cached mapping
+        :rtype: SharedExchangeArray
+        """
+        array = self.attach(name)
+        try:
+            yield array
+        finally:
+            self.release(array)
+
+    def clear(self) -> None:
+        """
+        Drop all idle mappings
+        """
+        with self._lock:
+            for name in [n for n, e in self._entries.items() if e.refs == 0]:
+                self._drop(name)
+
+    def _evict(self) -> None:
+        """
+        Protected eviction of idle mappings, the lock has to be held
+        """
+        now = time.monotonic()
+        excess = len(self._entries) - self._maxsize
+        for name, entry in list(self._entries.items()):
+            if entry.refs > 0:
+                continue
+            if excess > 0:
+                excess -= 1
+            elif self._ttl is None or now - entry.last_used < self._ttl:
+                continue
+            self._drop(name)
+
+    def _drop(self, name: str) -> None:
+        """
+        Protected removal of a segment name, the lock has to be held
+
+        Mappings with references stay known until their last release.
+
+        :param name: Shared memory location
+        :type name: str
+        """
+        entry = self._entries.pop(name)
+        if entry.refs == 0:
+            self._forget(entry)
+
+    def _forget(self, entry: _CacheEntry) -> None:
+        """
+        Protected removal of an idle mapping, the lock has to be held
+
+        :param entry: Cached mapping
+        :type entry: _CacheEntry
+        """
+        LOGGER.debug(f"Dropping cached shared memory segment {entry.name}")
+        del self._mappings[id(entry.array.mem)]
+
+
+_CACHE = SharedArrayCache()
+
+
+def attach_cached_array(name: str) -> SharedExchangeArray:
+    """
+    Attach to an existing WrappedExchangeArray through the process-wide cache
+
+    :param name: Shared memory location
+    :type name: str
+    :return: Returns a WrappedArray instance, the handle for release
+    :rtype: WrappedArray
+    """
+    return _CACHE.attach(name)
+
+
+def release_cached_array(array: SharedExchangeArray) -> None:
+    """
+    Release a WrappedExchangeArray attached through the process-wide cache
+
+    :param array: Array returned by attach_cached_array
+    :type array: SharedExchangeArray
+    :raises ValueError: If the array holds no reference of the cache
+    """
+    _CACHE.release(array)
+
+
+def _segment_identity(name: str) -> tuple:
+    """
+    Identify the segment behind a name on Linux
+
+    :param name: Shared memory location
+    :type name: str
+    :raises FileNotFoundError: If the segment does not exist
+    :return: Device, inode and size of the segment
+    :rtype: tuple
+    """
+    stat = os.stat(os.path.join(_SHM_DIRECTORY, name.lstrip("/")))
+    return stat.st_dev, stat.st_ino, stat.st_size
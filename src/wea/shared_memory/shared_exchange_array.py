@@ -1,8 +1,13 @@
 """
 Wrapped Exchange Array implementation for shared memory
 """
+import asyncio
+import contextlib
 import logging
+import os
+import time
 import typing
+import warnings
 
 # pylint: disable=W0201,W1202,W1203
 from multiprocessing import shared_memory
@@ -10,11 +15,31 @@ from multiprocessing.shared_memory import SharedMemory
 
 import numpy as np
 
+from .. import futex, instrumentation, paging
 from ..interface import WrappedExchangeArray
-from ..meta_data import _calculate_size, _write_header, check_buffer_array
+from ..meta_data import (
+    _WEA_EXT_NOTIFY,
+    _WEA_EXT_SEQUENCE,
+    _calculate_size,
+    _extension,
+    _header_order,
+    _order_flags,
+    _write_header,
+    check_buffer_array,
+)
+
+try:
+    import _posixshmem
+except ImportError:  # pragma: no cover
+    _posixshmem = None
 
 LOGGER = logging.getLogger(__name__)
 
+_SEGMENT_EVENTS = {
+    "close": instrumentation.SEGMENT_CLOSED,
+    "unlink": instrumentation.SEGMENT_UNLINKED,
+}
+
 
 class SharedExchangeArray(WrappedExchangeArray):
     """
@@ -30,9 +55,12 @@ class SharedExchangeArray(WrappedExchangeArray):
             for x_val in kwarg:
                 if x_val not in kwargs:
                     raise TypeError(f"Missing {x_val} for creating wrapped array")
-            shm, off = _create_shared_array(name, kwargs["dtype"], kwargs["shape"])
+            kwargs.setdefault("order", "F")
+            shm, off = _create_shared_array(
+                name, kwargs["dtype"], kwargs["shape"], kwargs["order"]
+            )
         else:
-            kwarg = ["dtype", "shape"]
+            kwarg = ["dtype", "shape", "order"]
             for x_val in kwarg:
                 if x_val in kwargs:
                     raise TypeError(
@@ -40,18 +68,49 @@ class SharedExchangeArray(WrappedExchangeArray):
                         f"wrapped array"
                     )
             shm, off, pytype, dims = _attach_shared_array(name)
-            for x_val, y_val in zip(kwarg, [pytype, dims]):
+            for x_val, y_val in zip(kwarg, [pytype, dims, _header_order(shm.buf)]):
                 kwargs[x_val] = y_val
         kwargs["buffer"] = shm.buf[off:]
-        kwargs["order"] = "F"
         obj = super(SharedExchangeArray, cls).__new__(cls, **kwargs)
         obj._mem = shm
+        obj._ext = _extension(shm.buf, len(kwargs["shape"]), off)
+        obj._base = None
         return obj
 
     def __array_finalize__(self, obj):
         if obj is None:
             return
         self._mem: SharedMemory = getattr(obj, "_mem", None)
+        self._ext: typing.Optional[np.ndarray] = getattr(obj, "_ext", None)
+        # Offset of the WrappedArray header of arena members
+        self._base: typing.Optional[int] = getattr(obj, "_base", None)
+
+    def __reduce__(self):
+        segment = _segment_offset(self)
+        if segment is None:
+            return self.view(np.ndarray).__reduce__()
+        ext = None
+        if self._ext is not None:
+            ext = (
+                _segment_offset(self._ext, self._mem),
+                self._ext.dtype,
+                len(self._ext),
+            )
+        return (
+            _rebuild_shared_array,
+            (
+                self._mem.name,
+                segment,
+                self.dtype,
+                self.shape,
+                self.strides,
+                ext,
+                self._base,
+            ),
+        )
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
 
     def __enter__(self):
         return self
@@ -69,42 +128,284 @@ class SharedExchangeArray(WrappedExchangeArray):
         """
         return self._mem
 
-    def reopen(self):
+    @property
+    def version(self) -> int:
+        """
+        Return the sequence counter of the shared memory segment, which is
+        odd while a write is in progress
+
+        :return: Sequence counter
+        :rtype: int
+        """
+        return int(self._sequence()[_WEA_EXT_SEQUENCE])
+
+    @contextlib.contextmanager
+    def write(self):
+        """
+        Context manager which marks a write to the shared memory segment for
+        readers using read_consistent or snapshot. Only one process is allowed
+        to write at a time.
+
+        The sequence counter is a seqlock without memory barriers, numpy has
+        no fences. Readers observe the counter and the array data in program
+        order only on x86 and x86-64, whose memory model neither reorders
+        stores with stores nor loads with loads. On weakly ordered platforms,
+        e.g. ARM, a reader may accept a torn read.
+
+        :yield: The array itself
+        :rtype: SharedExchangeArray
+        """
+        seq = self._sequence()
+        seq[_WEA_EXT_SEQUENCE] += 1
+        try:
+            yield self
+        finally:
+            seq[_WEA_EXT_SEQUENCE] += 1
+
+    def read_consistent(
+        self,
+        func: typing.Callable[[np.ndarray], typing.Any],
+        retries: typing.Optional[int] = None,
+    ) -> typing.Any:
+        """
+        Call a function on the array and repeat the call until no write
+        overlapped with it
+
+        The detection of overlapping writes is only reliable on x86 and
+        x86-64, see write.
+
+        :param func: Function which reads from the array
+        :type func: typing.Callable[[np.ndarray], typing.Any]
+        :param retries: Maximum number of retries, defaults to unlimited
+        :type retries: typing.Optional[int], optional
+        :raises TimeoutError: If no consistent read succeeded within retries
+        :return: Result of the function
+        :rtype: typing.Any
+        """
+        seq = self._sequence()
+        attempt = 0
+        while retries is None or attempt <= retries:
+            attempt += 1
+            start = seq[_WEA_EXT_SEQUENCE]
+            if start & 1:
+                time.sleep(0)
+                continue
+            result = func(self.view(np.ndarray))
+            if seq[_WEA_EXT_SEQUENCE] == start:
+                return result
+        raise TimeoutError(f"No consistent read within {retries} retries")
+
+    def snapshot(
+        self,
+        out: typing.Optional[np.ndarray] = None,
+        retries: typing.Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Copy a consistent snapshot of the array
+
+        :param out: Array to copy into, defaults to a new array
+        :type out: typing.Optional[np.ndarray], optional
+        :param retries: Maximum number of retries, defaults to unlimited
+        :type retries: typing.Optional[int], optional
+        :return: Copy of the array
+        :rtype: np.ndarray
+        """
+        if out is None:
+            out = np.empty_like(self.view(np.ndarray))
+
+        def copy(arr: np.ndarray):
+            np.copyto(out, arr)
+            if instrumentation.HOOKS:
+                instrumentation.emit(instrumentation.BYTES_COPIED, arr.nbytes)
+            return out
+
+        return self.read_consistent(copy, retries)
+
+    def notify(self) -> int:
         """
-        Reopen a shared memory segement
+        Increment the notification counter of the segment and wake all
+        processes waiting on it. Only one process is allowed to notify at a
+        time.
+
+        :return: Notification counter
+        :rtype: int
+        """
+        word = self._notify_word()
+        word[0] += np.uint32(1)
+        futex.wake(word)
+        return int(word[0])
+
+    def wait(
+        self, timeout: typing.Optional[float] = None, seen: typing.Optional[int] = None
+    ) -> int:
+        """
+        Block until the notification counter differs from the seen counter.
+        The futex wait of Linux costs no CPU while idle, other platforms poll.
+
+        :param timeout: Timeout in seconds, defaults to waiting forever
+        :type timeout: typing.Optional[float], optional
+        :param seen: Counter returned by the previous wait, defaults to the
+         current counter, i.e. waiting for the next notify
+        :type seen: typing.Optional[int], optional
+        :raises TimeoutError: If no notification arrived within the timeout
+        :return: Notification counter
+        :rtype: int
+        """
+        word = self._notify_word()
+        seen = int(word[0]) if seen is None else seen
+        if not futex.wait(word, seen, timeout):
+            raise TimeoutError(f"No notification within {timeout} seconds")
+        return int(word[0])
+
+    async def wait_async(
+        self, timeout: typing.Optional[float] = None, seen: typing.Optional[int] = None
+    ) -> int:
+        """
+        Awaitable wait, which blocks a thread of the default executor of the
+        event loop. A cancelled wait occupies its thread until the next
+        notification or the timeout.
+
+        :param timeout: Timeout in seconds, defaults to waiting forever
+        :type timeout: typing.Optional[float], optional
+        :param seen: Counter returned by the previous wait, defaults to the
+         current counter, i.e. waiting for the next notify
+        :type seen: typing.Optional[int], optional
+        :raises TimeoutError: If no notification arrived within the timeout
+        :return: Notification counter
+        :rtype: int
+        """
+        word = self._notify_word()
+        seen = int(word[0]) if seen is None else seen
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.wait, timeout, seen)
+
+    def reopen(self) -> None:
+        """
+        Reopen a shared memory segement in place
+
+        .. deprecated::
+            numpy 2 does not allow to replace the buffer of an existing array,
+            thus reopen fails there. Use reattach, which returns the attached
+            array.
 
         :raises FileNotFoundError: If shared memory segment was deleted
+        :raises AttributeError: If numpy does not allow to replace the buffer
         """
-        if self._mem is not None:
-            shm, off, _, _ = _attach_shared_array(self.mem.name)
-            self._mem, self.data = shm, shm.buf[off:]
-        else:
+        warnings.warn(
+            "reopen is deprecated, use reattach which returns the attached array",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        obj = self.reattach()
+        # numpy before 2 allows to replace the buffer, the stubs do not
+        self.data = obj.data  # type: ignore[misc]
+        self._mem, self._ext = obj._mem, obj._ext
+
+    def reattach(self) -> "SharedExchangeArray":
+        """
+        Attach the shared memory segment again, e.g. after it was recreated
+
+        The array keeps its previous mapping, the returned array has to be
+        used afterwards. Arena members attach the arena segment again and map
+        the same member.
+
+        :raises FileNotFoundError: If shared memory segment was deleted
+        :return: Array attached to the shared memory segment
+        :rtype: SharedExchangeArray
+        """
+        if self._mem is None:
             raise FileNotFoundError("No shared memory element set for connecting")
+        start = time.perf_counter() if instrumentation.HOOKS else None
+        if self._base is None:
+            obj = SharedExchangeArray(self._mem.name, False)
+        else:
+            shm = shared_memory.SharedMemory(name=self._mem.name, create=False)
+            if instrumentation.HOOKS:
+                instrumentation.emit(instrumentation.SEGMENT_ATTACHED, shm.size)
+            obj = _wrap_shared_array(shm, self._base)
+        if start is not None:
+            instrumentation.emit(instrumentation.REOPEN, time.perf_counter() - start)
+        return obj
 
     def close(self) -> None:
         """
         Close shared memory segment
+
+        :raises TypeError: If the array is a member of an arena
         """
         self._close("close")
 
     def unlink(self) -> None:
         """
         Unlink shared memory segment
+
+        :raises TypeError: If the array is a member of an arena
         """
         self._close("unlink")
 
+    def _ext_words(self) -> np.ndarray:
+        """
+        Protected access to the extension words of the segment header
+
+        :raises TypeError: If the segment header has no extension block
+        :return: Extension words
+        :rtype: np.ndarray
+        """
+        if self._ext is None:
+            raise TypeError("Shared memory segment has no extension block")
+        return self._ext
+
+    def _sequence(self) -> np.ndarray:
+        """
+        Protected access to the extension words holding the sequence counter
+
+        :raises TypeError: If the segment header has no extension block
+        :return: Extension words
+        :rtype: np.ndarray
+        """
+        if self._ext is None:
+            raise TypeError("Shared memory segment has no sequence counter")
+        return self._ext
+
+    def _notify_word(self) -> np.ndarray:
+        """
+        Protected access to the futex word of the notification counter
+
+        :raises TypeError: If the segment header has no extension block
+        :return: One element uint32 view
+        :rtype: np.ndarray
+        """
+        if self._ext is None:
+            raise TypeError("Shared memory segment has no notification counter")
+        return futex.futex_word(self._ext[_WEA_EXT_NOTIFY:])
+
     def _close(self, action: str) -> None:
         """
         Protected wrapper function for closing or unlinking shared memory
 
         :param action: attribute function
         :type action: str
+        :raises TypeError: If the array is a member of an arena
         """
+        if self._base is not None:
+            raise TypeError(
+                f"Array is a member of arena {self._mem.name}, {action} the arena "
+                f"instead"
+            )
         func = getattr(self._mem, action)
         func()
+        if instrumentation.HOOKS:
+            instrumentation.emit(_SEGMENT_EVENTS[action], self._mem.size)
 
 
-def create_shared_array(name: str, dtype: np.dtype, shape: tuple):
+def create_shared_array(
+    name: str,
+    dtype: np.dtype,
+    shape: tuple,
+    prefault: typing.Union[bool, int] = False,
+    advice: typing.Sequence[str] = (),
+    order: str = "F",
+):
     """
     Create a new WrappedExchangeArray in shared memory
 
@@ -114,25 +415,72 @@ def create_shared_array(name: str, dtype: np.dtype, shape: tuple):
     :type dtype: np.dtype
     :param shape: Array dimension
     :type shape: tuple
+    :param prefault: Fault in all pages, an integer sets the number of
+     threads, defaults to False
+    :type prefault: typing.Union[bool, int], optional
+    :param advice: madvise hints like "hugepage", defaults to no hints
+    :type advice: typing.Sequence[str], optional
+    :param order: Memory layout, "C" allows plain copies of C contiguous
+     arrays but is transposed in Julia, defaults to "F"
+    :type order: str, optional
     :return: Returns a WrappedArray instance
     :rtype: WrappedArray
     """
-    return SharedExchangeArray(name, True, dtype=dtype, shape=shape)
+    return _apply_paging(
+        SharedExchangeArray(name, True, dtype=dtype, shape=shape, order=order),
+        prefault,
+        advice,
+    )
 
 
-def attach_shared_array(name: str):
+def attach_shared_array(
+    name: str,
+    prefault: typing.Union[bool, int] = False,
+    advice: typing.Sequence[str] = (),
+):
     """
     Attach to an existing WrappedExchangeArray in shared memory
 
     :param name: Shared memory location
     :type name: str
+    :param prefault: Fault in all pages, an integer sets the number of
+     threads, defaults to False
+    :type prefault: typing.Union[bool, int], optional
+    :param advice: madvise hints like "sequential", defaults to no hints
+    :type advice: typing.Sequence[str], optional
     :return: Returns a WrappedArray instance
     :rtype: WrappedArray
     """
-    return SharedExchangeArray(name, False)
+    return _apply_paging(SharedExchangeArray(name, False), prefault, advice)
+
+
+def _apply_paging(
+    arr: SharedExchangeArray,
+    prefault: typing.Union[bool, int],
+    advice: typing.Sequence[str],
+) -> SharedExchangeArray:
+    """
+    Apply madvise hints first and prefault the pages afterwards
+
+    :param arr: Shared memory array
+    :type arr: SharedExchangeArray
+    :param prefault: Fault in all pages, an integer sets the number of threads
+    :type prefault: typing.Union[bool, int]
+    :param advice: madvise hints
+    :type advice: typing.Sequence[str]
+    :return: The array itself
+    :rtype: SharedExchangeArray
+    """
+    if advice:
+        paging.advise(arr, *advice)
+    if prefault:
+        paging.prefault(arr, threads=int(prefault))
+    return arr
 
 
-def _create_shared_array(name: str, dtype: np.dtype, shape: tuple) -> typing.Tuple:
+def _create_shared_array(
+    name: str, dtype: np.dtype, shape: tuple, order: str = "F"
+) -> typing.Tuple:
     """
     Create a new WrappedArray in shared memory
 
@@ -142,13 +490,19 @@ def _create_shared_array(name: str, dtype: np.dtype, shape: tuple) -> typing.Tup
     :type type: np.dtype
     :param shape: Array dimension
     :type shape: tuple
+    :param order: Memory layout, defaults to "F"
+    :type order: str, optional
     :return: Shared memory segment and buffer offset
     :rtype: Tuple
     """
     size, _, _ = _calculate_size(shape, dtype)
+    # Reject an unknown order before the segment is created
+    _order_flags(order)
     LOGGER.debug(f"Creating shared memory segment: {name}")
     shm = shared_memory.SharedMemory(name=name, create=True, size=size)
-    off = _write_header(shm.buf, dtype, shape)
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.SEGMENT_CREATED, shm.size)
+    off = _write_header(shm.buf, dtype, shape, order)
     return shm, off
 
 
@@ -162,4 +516,139 @@ def _attach_shared_array(name: str) -> typing.Tuple:
     :rtype: Tuple
     """
     shm = shared_memory.SharedMemory(name=name, create=False)
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.SEGMENT_ATTACHED, shm.size)
     return shm, *check_buffer_array(shm.buf)
+
+
+def _segment_buffer(shm: SharedMemory) -> memoryview:
+    """
+    Buffer of a shared memory segment
+
+    :param shm: Shared memory segment
+    :type shm: SharedMemory
+    :raises ValueError: If the segment is closed
+    :return: Segment buffer
+    :rtype: memoryview
+    """
+    if shm.buf is None:
+        raise ValueError(f"Shared memory segment {shm.name} is closed")
+    return shm.buf
+
+
+def _shm_open(name: str, readonly: bool = False) -> typing.Optional[int]:
+    """
+    Open a file descriptor of an existing POSIX shared memory segment
+
+    SharedMemory does not expose its descriptor, thus the CPython module
+    _posixshmem which backs SharedMemory opens the segment. Platforms without
+    it, e.g. Windows, return None and callers fall back to SharedMemory.
+
+    :param name: Shared memory location
+    :type name: str
+    :param readonly: Open the segment read-only, defaults to False
+    :type readonly: bool, optional
+    :raises FileNotFoundError: If the segment does not exist
+    :return: File descriptor, which the caller closes, or None
+    :rtype: typing.Optional[int]
+    """
+    if _posixshmem is None:
+        return None
+    name = name if name.startswith("/") else f"/{name}"
+    flags = os.O_RDONLY if readonly else os.O_RDWR
+    return _posixshmem.shm_open(name, flags, mode=0o600)
+
+
+def _wrap_shared_array(shm: SharedMemory, base: int) -> SharedExchangeArray:
+    """
+    Wrap a WrappedArray which starts at an offset inside a segment
+
+    :param shm: Shared memory segment
+    :type shm: SharedMemory
+    :param base: Offset of the WrappedArray header
+    :type base: int
+    :return: Returns a WrappedArray instance
+    :rtype: WrappedArray
+    """
+    frame = _segment_buffer(shm)[base:]
+    off, pytype, dims = check_buffer_array(frame)
+    obj = np.ndarray(
+        dims, dtype=pytype, buffer=frame[off:], order=_header_order(frame)
+    ).view(SharedExchangeArray)
+    obj._mem = shm
+    obj._ext = _extension(frame, len(dims), off)
+    obj._base = base
+    return obj
+
+
+def _segment_offset(
+    arr: np.ndarray, shm: typing.Optional[SharedMemory] = None
+) -> typing.Optional[int]:
+    """
+    Offset of the array data inside its shared memory segment
+
+    :param arr: Array which might be a view into the segment
+    :type arr: np.ndarray
+    :param shm: Shared memory segment, defaults to the segment of the array
+    :type shm: typing.Optional[SharedMemory], optional
+    :return: Offset of the first element or None if the data is not inside
+     the segment, e.g. for copies
+    :rtype: typing.Optional[int]
+    """
+    shm = getattr(arr, "_mem", None) if shm is None else shm
+    if shm is None or shm.buf is None:
+        return None
+    base = np.frombuffer(shm.buf, dtype=np.uint8).__array_interface__["data"][0]
+    start = arr.__array_interface__["data"][0] - base
+    low = start + sum(min((n - 1) * s, 0) for n, s in zip(arr.shape, arr.strides))
+    high = start + sum(max((n - 1) * s, 0) for n, s in zip(arr.shape, arr.strides))
+    if arr.size and (low < 0 or high + arr.itemsize > shm.size):
+        return None
+    return start
+
+
+def _rebuild_shared_array(
+    name: str,
+    offset: int,
+    dtype: np.dtype,
+    shape: tuple,
+    strides: tuple,
+    ext: typing.Optional[tuple],
+    base: typing.Optional[int] = None,
+) -> SharedExchangeArray:
+    """
+    Attach to the segment of a pickled SharedExchangeArray and map the same
+    view again
+
+    :param name: Shared memory location
+    :type name: str
+    :param offset: Offset of the first element
+    :type offset: int
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param strides: Strides of the view
+    :type strides: tuple
+    :param ext: Offset, data format and length of the extension words
+    :type ext: typing.Optional[tuple]
+    :param base: Offset of the WrappedArray header of arena members,
+     defaults to None
+    :type base: typing.Optional[int], optional
+    :return: View into the shared memory segment
+    :rtype: SharedExchangeArray
+    """
+    shm = shared_memory.SharedMemory(name=name, create=False)
+    if instrumentation.HOOKS:
+        instrumentation.emit(instrumentation.SEGMENT_ATTACHED, shm.size)
+    obj = np.ndarray(
+        shape, dtype=dtype, buffer=shm.buf, offset=offset, strides=strides
+    ).view(SharedExchangeArray)
+    obj._mem = shm
+    obj._base = base
+    if ext is not None:
+        ext_off, ext_dtype, ext_len = ext
+        obj._ext = np.ndarray(
+            (ext_len,), dtype=ext_dtype, buffer=shm.buf, offset=ext_off
+        )
+    return obj
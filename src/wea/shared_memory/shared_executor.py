@@ -0,0 +1,156 @@
+"""
+Process pool which maps functions over chunks of shared memory arrays
+"""
+# pylint: disable=W1202,W1203
+import logging
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .shared_exchange_array import SharedExchangeArray, _segment_offset
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedArrayExecutor:
+    """
+    Process pool for chunked maps over SharedExchangeArrays
+
+    Chunks are pickled as references to their shared memory segment, thus
+    the workers read from and write into the segments without copying the
+    payload. The function has to be picklable, e.g. defined at module level.
+    """
+
+    def __init__(
+        self,
+        max_workers: typing.Optional[int] = None,
+        mp_context=None,
+    ):
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(self._max_workers, mp_context=mp_context)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.shutdown()
+
+    def map(
+        self,
+        func: typing.Callable[[np.ndarray], typing.Any],
+        arr: SharedExchangeArray,
+        out: typing.Optional[SharedExchangeArray] = None,
+        axis: typing.Optional[int] = None,
+        chunks: typing.Optional[int] = None,
+    ) -> SharedExchangeArray:
+        """
+        Split an array into chunks along an axis and write the results of
+        the function per chunk into the matching chunk of the output array
+
+        :param func: Function which maps a chunk to the output chunk
+        :type func: typing.Callable[[np.ndarray], typing.Any]
+        :param arr: Input array
+        :type arr: SharedExchangeArray
+        :param out: Output array with the same length along the axis,
+         defaults to the input array
+        :type out: typing.Optional[SharedExchangeArray], optional
+        :param axis: Axis to split, defaults to the slowest varying axis,
+         which keeps the chunks of contiguous arrays contiguous
+        :type axis: typing.Optional[int], optional
+        :param chunks: Number of chunks, defaults to the number of workers
+        :type chunks: typing.Optional[int], optional
+        :raises TypeError: If an array is not backed by shared memory
+        :raises ValueError: If the lengths along the axis differ
+        :return: Output array
+        :rtype: SharedExchangeArray
+        """
+        out = arr if out is None else out
+        for x_val in (arr, out):
+            if _segment_offset(x_val) is None:
+                raise TypeError("Chunked maps require arrays in shared memory")
+        if axis is None:
+            axis = 0 if arr.flags.c_contiguous and arr.ndim > 1 else arr.ndim - 1
+        if arr.shape[axis] != out.shape[axis]:
+            raise ValueError(
+                f"Length {arr.shape[axis]} of input and {out.shape[axis]} of "
+                f"output differ along axis {axis}"
+            )
+        bounds = _chunk_bounds(arr.shape[axis], chunks or self._max_workers)
+        LOGGER.debug(f"Mapping {func} over {len(bounds)} chunks along axis {axis}")
+        futures = [
+            self._pool.submit(
+                _apply_chunk,
+                func,
+                _take(arr, axis, start, stop),
+                _take(out, axis, start, stop),
+            )
+            for start, stop in bounds
+        ]
+        for future in futures:
+            future.result()
+        return out
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the process pool
+
+        :param wait: Wait for pending chunks, defaults to True
+        :type wait: bool, optional
+        """
+        self._pool.shutdown(wait=wait)
+
+
+def _chunk_bounds(length: int, chunks: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Split a length into at most chunks non-empty ranges of similar size
+
+    :param length: Length along the axis
+    :type length: int
+    :param chunks: Number of chunks
+    :type chunks: int
+    :return: Start and stop per chunk
+    :rtype: typing.List[typing.Tuple[int, int]]
+    """
+    chunks = max(min(int(chunks), length), 1)
+    edges = [length * idx // chunks for idx in range(chunks + 1)]
+    return [(a, b) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def _take(arr: np.ndarray, axis: int, start: int, stop: int) -> np.ndarray:
+    """
+    View of a range along an axis
+
+    :param arr: Array
+    :type arr: np.ndarray
+    :param axis: Axis
+    :type axis: int
+    :param start: First index
+    :type start: int
+    :param stop: Stop index
+    :type stop: int
+    :return: View of the range
+    :rtype: np.ndarray
+    """
+    index = [slice(None)] * arr.ndim
+    index[axis] = slice(start, stop)
+    return arr[tuple(index)]
+
+
+def _apply_chunk(
+    func: typing.Callable[[np.ndarray], typing.Any],
+    arr: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Worker side of a chunked map
+
+    :param func: Function which maps a chunk to the output chunk
+    :type func: typing.Callable[[np.ndarray], typing.Any]
+    :param arr: Input chunk, a view of a SharedExchangeArray
+    :type arr: np.ndarray
+    :param out: Output chunk, a view of a SharedExchangeArray
+    :type out: np.ndarray
+    """
+    out.view(np.ndarray)[...] = func(arr.view(np.ndarray))
@@ -0,0 +1,234 @@
+"""
+Appendable Wrapped Exchange Array in one growing shared memory segment
+"""
+# pylint: disable=W1202,W1203
+import logging
+import os
+import typing
+
+import numpy as np
+
+from ..meta_data import (
+    _WEA_EXT_CAPACITY,
+    _WEA_FLAG_GROWABLE,
+    _extension_flags,
+    _header_dims,
+    _header_order,
+    _set_extension_flags,
+    check_buffer_array,
+)
+from .shared_exchange_array import SharedExchangeArray, _segment_buffer, _shm_open
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedGrowableArray:
+    """
+    Array which grows along its last axis, the slowest varying axis in
+    Fortran order
+
+    The segment reserves space for capacity entries along the last axis and
+    the header holds the logical length, thus every reader attaching to the
+    segment sees a regular WrappedArray. Appending beyond the capacity grows
+    the segment geometrically with ftruncate and maps it again, the data is
+    not copied. Readers map a grown segment again when they access the
+    array. Only one process is allowed to append.
+    """
+
+    def __init__(self, array: SharedExchangeArray):
+        if array._ext is None or not (
+            _extension_flags(array._ext) & _WEA_FLAG_GROWABLE
+        ):
+            raise TypeError(f"Shared memory segment {array.mem.name} is not growable")
+        if _header_order(_segment_buffer(array.mem)) != "F":
+            raise TypeError(
+                f"Shared memory segment {array.mem.name} has to be in Fortran "
+                f"order to grow along its last axis"
+            )
+        self._name = array.mem.name
+        self._map(array)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self._dims[-1])
+
+    @property
+    def array(self) -> SharedExchangeArray:
+        """
+        Return the array with its current length, a grown segment is mapped
+        again
+
+        :return: Shared memory array
+        :rtype: SharedExchangeArray
+        """
+        length = len(self)
+        if length > self._full.shape[-1]:
+            self._map(self._array.reattach())
+        obj = self._full[..., :length].view(SharedExchangeArray)
+        obj._mem = self._array.mem
+        obj._ext = self._array._ext
+        return obj
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the number of entries along the last axis which fit into the
+        segment
+
+        :return: Capacity
+        :rtype: int
+        """
+        return int(self._array._ext_words()[_WEA_EXT_CAPACITY])
+
+    @property
+    def frame_shape(self) -> tuple:
+        """
+        Return the shape of one entry along the last axis
+
+        :return: Frame shape
+        :rtype: tuple
+        """
+        return self._full.shape[:-1]
+
+    def append(self, data: np.ndarray) -> int:
+        """
+        Append one frame or several frames along the last axis
+
+        :param data: Frame or frames stacked along the last axis
+        :type data: np.ndarray
+        :raises ValueError: If the frame shape differs
+        :return: New length
+        :rtype: int
+        """
+        data = np.asanyarray(data)
+        if data.shape == self.frame_shape:
+            data = data[..., np.newaxis]
+        if data.shape[:-1] != self.frame_shape:
+            raise ValueError(
+                f"Frames of {data.shape[:-1]} do not match {self.frame_shape}"
+            )
+        length = len(self)
+        end = length + data.shape[-1]
+        if end > self.capacity:
+            self.reserve(max(end, 2 * self.capacity))
+        self._full[..., length:end] = data
+        self._dims[-1] = end
+        return end
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grow the segment to a capacity, a smaller capacity is ignored
+
+        :param capacity: Number of entries along the last axis
+        :type capacity: int
+        :raises MemoryError: If the segment can not grow on this platform
+        """
+        if capacity <= self.capacity:
+            return
+        fd = _shm_open(self._name)
+        if fd is None:
+            raise MemoryError("Shared memory segment can not grow on this platform")
+        size = self._offset + self._frame_nbytes * capacity
+        LOGGER.debug(f"Growing shared memory segment {self._name} to {size} bytes")
+        try:
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+        self.reopen()
+        self._array._ext_words()[_WEA_EXT_CAPACITY] = capacity
+
+    def reopen(self) -> SharedExchangeArray:
+        """
+        Map the segment again, e.g. after it grew
+
+        :raises FileNotFoundError: If shared memory segment was deleted
+        :return: Array with its current length
+        :rtype: SharedExchangeArray
+        """
+        self._map(self._array.reattach())
+        return self.array
+
+    def close(self) -> None:
+        """
+        Close shared memory segment
+        """
+        self._array.close()
+
+    def unlink(self) -> None:
+        """
+        Unlink shared memory segment
+        """
+        self._array.unlink()
+
+    def _map(self, array: SharedExchangeArray) -> None:
+        """
+        Protected mapping of all entries which fit into the mapped segment
+
+        Arrays which were returned before keep the previous mapping.
+
+        :param array: Array attached to the segment
+        :type array: SharedExchangeArray
+        """
+        buf = _segment_buffer(array.mem)
+        off, pytype, dims = check_buffer_array(buf)
+        frame_nbytes = pytype.itemsize * int(np.prod(dims[:-1]))
+        mapped = (array.mem.size - off) // frame_nbytes if frame_nbytes else 0
+        self._array = array
+        self._offset = off
+        self._frame_nbytes = frame_nbytes
+        self._dims = _header_dims(buf, len(dims))
+        self._full = np.ndarray(
+            (*dims[:-1], mapped),
+            dtype=pytype,
+            buffer=buf[off:],
+            order=_header_order(buf),
+        )
+
+
+def create_growable_array(
+    name: str, dtype: np.dtype, shape: tuple, capacity: typing.Optional[int] = None
+) -> SharedGrowableArray:
+    """
+    Create a new growable array in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Initial dimension, the last axis grows
+    :type shape: tuple
+    :param capacity: Reserved entries along the last axis, defaults to the
+     initial length
+    :type capacity: typing.Optional[int], optional
+    :raises ValueError: If the shape has no axis to grow
+    :return: Returns a SharedGrowableArray instance
+    :rtype: SharedGrowableArray
+    """
+    shape = tuple(shape)
+    if not shape:
+        raise ValueError("Growable array requires at least one dimension")
+    capacity = max(shape[-1], 1 if capacity is None else int(capacity), 1)
+    LOGGER.debug(f"Creating growable array {name} with capacity {capacity}")
+    array = SharedExchangeArray(name, True, dtype=dtype, shape=(*shape[:-1], capacity))
+    ext = array._ext_words()
+    _set_extension_flags(ext, _extension_flags(ext) | _WEA_FLAG_GROWABLE)
+    ext[_WEA_EXT_CAPACITY] = capacity
+    _header_dims(_segment_buffer(array.mem), len(shape))[-1] = shape[-1]
+    return SharedGrowableArray(array)
+
+
+def attach_growable_array(name: str) -> SharedGrowableArray:
+    """
+    Attach to an existing growable array in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :return: Returns a SharedGrowableArray instance
+    :rtype: SharedGrowableArray
+    """
+    return SharedGrowableArray(SharedExchangeArray(name, False))
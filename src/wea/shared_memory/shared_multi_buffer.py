@@ -0,0 +1,218 @@
+"""
+Double and triple buffered Wrapped Exchange Array in one shared memory segment
+"""
+# pylint: disable=W1202,W1203
+import logging
+import time
+import typing
+
+import numpy as np
+
+from ..meta_data import (
+    _WEA_EXT_FRONT,
+    _WEA_FLAG_MULTI_BUFFER,
+    _extension_flags,
+    _set_extension_flags,
+)
+from .shared_exchange_array import SharedExchangeArray
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedMultiBuffer:
+    """
+    Array with several buffers of which readers see the latest published one
+
+    The segment is a regular WrappedArray whose last axis holds the buffers.
+    The writer fills the back buffer and publishes it by incrementing the
+    front counter in the wea extension block of the header. A reader of the
+    front buffer is safe until the writer published buffers - 1 more times,
+    which is why triple buffering is the default.
+    """
+
+    def __init__(self, array: SharedExchangeArray):
+        if array._ext is None or not (
+            _extension_flags(array._ext) & _WEA_FLAG_MULTI_BUFFER
+        ):
+            raise TypeError(
+                f"Shared memory segment {array.mem.name} is no multi buffer"
+            )
+        self._array = array
+        self._ext = array._ext
+        self._buffers = array.shape[-1]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.close()
+
+    @property
+    def array(self) -> SharedExchangeArray:
+        """
+        Return the underlying array with the buffers along the last axis
+
+        :return: Shared memory array
+        :rtype: SharedExchangeArray
+        """
+        return self._array
+
+    @property
+    def buffers(self) -> int:
+        """
+        Return the number of buffers
+
+        :return: Number of buffers
+        :rtype: int
+        """
+        return self._buffers
+
+    @property
+    def generation(self) -> int:
+        """
+        Return the number of published buffers
+
+        :return: Front counter
+        :rtype: int
+        """
+        return int(self._ext[_WEA_EXT_FRONT])
+
+    @property
+    def front(self) -> np.ndarray:
+        """
+        Return the latest published buffer
+
+        :return: Buffer view
+        :rtype: np.ndarray
+        """
+        return self._buffer(self.generation)
+
+    @property
+    def back(self) -> np.ndarray:
+        """
+        Return the buffer which is filled by the writer next
+
+        :return: Buffer view
+        :rtype: np.ndarray
+        """
+        return self._buffer(self.generation + 1)
+
+    def publish(self):
+        """
+        Publish the back buffer as front buffer
+        """
+        self._ext[_WEA_EXT_FRONT] += 1
+
+    def read_consistent(
+        self,
+        func: typing.Callable[[np.ndarray], typing.Any],
+        retries: typing.Optional[int] = None,
+    ) -> typing.Any:
+        """
+        Call a function on the front buffer and repeat the call if the writer
+        started to overwrite the buffer meanwhile
+
+        :param func: Function which reads from the buffer
+        :type func: typing.Callable[[np.ndarray], typing.Any]
+        :param retries: Maximum number of retries, defaults to unlimited
+        :type retries: typing.Optional[int], optional
+        :raises TimeoutError: If no consistent read succeeded within retries
+        :return: Result of the function
+        :rtype: typing.Any
+        """
+        attempt = 0
+        while retries is None or attempt <= retries:
+            attempt += 1
+            generation = self.generation
+            result = func(self._buffer(generation))
+            if self.generation - generation <= self._buffers - 2:
+                return result
+            time.sleep(0)
+        raise TimeoutError(f"No consistent read within {retries} retries")
+
+    def snapshot(
+        self,
+        out: typing.Optional[np.ndarray] = None,
+        retries: typing.Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Copy a consistent snapshot of the front buffer
+
+        :param out: Array to copy into, defaults to a new array
+        :type out: typing.Optional[np.ndarray], optional
+        :param retries: Maximum number of retries, defaults to unlimited
+        :type retries: typing.Optional[int], optional
+        :return: Copy of the front buffer
+        :rtype: np.ndarray
+        """
+        if out is None:
+            out = np.empty(self._array.shape[:-1], dtype=self._array.dtype, order="F")
+
+        def copy(arr: np.ndarray):
+            np.copyto(out, arr)
+            return out
+
+        return self.read_consistent(copy, retries)
+
+    def close(self) -> None:
+        """
+        Close shared memory segment
+        """
+        self._array.close()
+
+    def unlink(self) -> None:
+        """
+        Unlink shared memory segment
+        """
+        self._array.unlink()
+
+    def _buffer(self, generation: int) -> np.ndarray:
+        """
+        Protected view of the buffer of a generation
+
+        :param generation: Front counter
+        :type generation: int
+        :return: Buffer view
+        :rtype: np.ndarray
+        """
+        return self._array.view(np.ndarray)[..., generation % self._buffers]
+
+
+def create_multi_buffer(
+    name: str, dtype: np.dtype, shape: tuple, buffers: int = 3
+) -> SharedMultiBuffer:
+    """
+    Create a new multi buffered array in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Array dimension
+    :type shape: tuple
+    :param buffers: Number of buffers, defaults to 3
+    :type buffers: int, optional
+    :return: Returns a SharedMultiBuffer instance
+    :rtype: SharedMultiBuffer
+    """
+    if buffers < 2:
+        raise ValueError("Multi buffer requires at least two buffers")
+    LOGGER.debug(f"Creating multi buffer {name} with {buffers} buffers")
+    array = SharedExchangeArray(
+        name, True, dtype=dtype, shape=(*tuple(shape), int(buffers))
+    )
+    ext = array._ext_words()
+    _set_extension_flags(ext, _extension_flags(ext) | _WEA_FLAG_MULTI_BUFFER)
+    return SharedMultiBuffer(array)
+
+
+def attach_multi_buffer(name: str) -> SharedMultiBuffer:
+    """
+    Attach to an existing multi buffered array in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :return: Returns a SharedMultiBuffer instance
+    :rtype: SharedMultiBuffer
+    """
+    return SharedMultiBuffer(SharedExchangeArray(name, False))
@@ -0,0 +1,211 @@
+"""
+Ring buffer of Wrapped Exchange Array frames in one shared memory segment
+"""
+# pylint: disable=W1202,W1203
+import logging
+import typing
+
+import numpy as np
+
+from ..meta_data import (
+    _WEA_EXT_HEAD,
+    _WEA_EXT_TAIL,
+    _WEA_FLAG_RING,
+    _extension_flags,
+    _set_extension_flags,
+)
+from .shared_exchange_array import SharedExchangeArray
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedRingBuffer:
+    """
+    Single-producer/single-consumer ring buffer of fixed-shape frames
+
+    The segment is a regular WrappedArray whose last axis holds the slots,
+    thus every slot is contiguous in Fortran order. The head and tail cursors
+    are stored in the wea extension block of the header. Only one process is
+    allowed to push and only one process is allowed to pop.
+    """
+
+    def __init__(self, array: SharedExchangeArray):
+        if array._ext is None or not (_extension_flags(array._ext) & _WEA_FLAG_RING):
+            raise TypeError(f"Shared memory segment {array.mem.name} is no ring")
+        self._array = array
+        self._ext = array._ext
+        self._slots = array.shape[-1]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self._ext[_WEA_EXT_TAIL] - self._ext[_WEA_EXT_HEAD])
+
+    @property
+    def array(self) -> SharedExchangeArray:
+        """
+        Return the underlying array with the slots along the last axis
+
+        :return: Shared memory array
+        :rtype: SharedExchangeArray
+        """
+        return self._array
+
+    @property
+    def slots(self) -> int:
+        """
+        Return the number of slots
+
+        :return: Number of slots
+        :rtype: int
+        """
+        return self._slots
+
+    @property
+    def frame_shape(self) -> tuple:
+        """
+        Return the shape of one frame
+
+        :return: Frame shape
+        :rtype: tuple
+        """
+        return self._array.shape[:-1]
+
+    def push(self, frame: np.ndarray) -> bool:
+        """
+        Copy a frame into the next free slot and publish it
+
+        :param frame: Frame data
+        :type frame: np.ndarray
+        :return: False if the ring is full
+        :rtype: bool
+        """
+        slot = self.claim()
+        if slot is None:
+            return False
+        slot[...] = frame
+        self.commit()
+        return True
+
+    def pop(
+        self, out: typing.Optional[np.ndarray] = None
+    ) -> typing.Optional[np.ndarray]:
+        """
+        Copy the oldest frame out of the ring and free its slot
+
+        :param out: Array to copy into, defaults to a new array
+        :type out: typing.Optional[np.ndarray], optional
+        :return: Frame data or None if the ring is empty
+        :rtype: typing.Optional[np.ndarray]
+        """
+        slot = self.peek()
+        if slot is None:
+            return None
+        if out is None:
+            out = np.empty(slot.shape, dtype=slot.dtype, order="F")
+        np.copyto(out, slot)
+        self.release()
+        return out
+
+    def claim(self) -> typing.Optional[np.ndarray]:
+        """
+        Return the next free slot for writing in place without publishing it
+
+        :return: Slot view or None if the ring is full
+        :rtype: typing.Optional[np.ndarray]
+        """
+        tail = int(self._ext[_WEA_EXT_TAIL])
+        if tail - int(self._ext[_WEA_EXT_HEAD]) >= self._slots:
+            return None
+        return self._slot(tail)
+
+    def commit(self):
+        """
+        Publish the slot returned by claim
+        """
+        self._ext[_WEA_EXT_TAIL] += 1
+
+    def peek(self) -> typing.Optional[np.ndarray]:
+        """
+        Return the oldest frame for reading in place without freeing its slot
+
+        :return: Slot view or None if the ring is empty
+        :rtype: typing.Optional[np.ndarray]
+        """
+        head = int(self._ext[_WEA_EXT_HEAD])
+        if head == int(self._ext[_WEA_EXT_TAIL]):
+            return None
+        return self._slot(head)
+
+    def release(self):
+        """
+        Free the slot returned by peek
+        """
+        self._ext[_WEA_EXT_HEAD] += 1
+
+    def close(self) -> None:
+        """
+        Close shared memory segment
+        """
+        self._array.close()
+
+    def unlink(self) -> None:
+        """
+        Unlink shared memory segment
+        """
+        self._array.unlink()
+
+    def _slot(self, cursor: int) -> np.ndarray:
+        """
+        Protected view of the slot of a cursor
+
+        :param cursor: Head or tail cursor
+        :type cursor: int
+        :return: Slot view
+        :rtype: np.ndarray
+        """
+        return self._array.view(np.ndarray)[..., cursor % self._slots]
+
+
+def create_ring_buffer(
+    name: str, dtype: np.dtype, shape: tuple, slots: int
+) -> SharedRingBuffer:
+    """
+    Create a new ring buffer in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :param dtype: Data format
+    :type dtype: np.dtype
+    :param shape: Frame dimension
+    :type shape: tuple
+    :param slots: Number of frames in the ring
+    :type slots: int
+    :return: Returns a SharedRingBuffer instance
+    :rtype: SharedRingBuffer
+    """
+    if slots < 1:
+        raise ValueError("Ring buffer requires at least one slot")
+    LOGGER.debug(f"Creating ring buffer {name} with {slots} slots")
+    array = SharedExchangeArray(
+        name, True, dtype=dtype, shape=(*tuple(shape), int(slots))
+    )
+    ext = array._ext_words()
+    _set_extension_flags(ext, _extension_flags(ext) | _WEA_FLAG_RING)
+    return SharedRingBuffer(array)
+
+
+def attach_ring_buffer(name: str) -> SharedRingBuffer:
+    """
+    Attach to an existing ring buffer in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :return: Returns a SharedRingBuffer instance
+    :rtype: SharedRingBuffer
+    """
+    return SharedRingBuffer(SharedExchangeArray(name, False))
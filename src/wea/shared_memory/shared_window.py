@@ -0,0 +1,259 @@
+"""
+Windowed attach to a slab of a large shared memory Wrapped Exchange Array
+"""
+# pylint: disable=W1202,W1203
+import logging
+import mmap
+import os
+import typing
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .. import instrumentation
+from ..buffered_memory.buffered_exchange_array import _frame_offset
+from ..meta_data import _JULIA_WA_HEADER_SIZEOF, _header_order, check_buffer_array
+from .shared_exchange_array import _segment_buffer, _shm_open
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedWindow:
+    """
+    Window into a shared memory array along its slowest varying axis, i.e.
+    the last axis in Fortran order and the first axis in C order
+
+    Only the header and the pages of the window are mapped, which keeps the
+    virtual memory and page tables of narrow readers small. The window can
+    be moved without attaching again. Arrays returned before keep their
+    mapping. Platforms without POSIX shared memory map the whole segment.
+    """
+
+    def __init__(self, name: str, readonly: bool = False):
+        self._name = name if name.startswith("/") else f"/{name}"
+        self._readonly = readonly
+        self._shm: typing.Optional[SharedMemory] = None
+        self._mmap: typing.Optional[mmap.mmap] = None
+        fd = _shm_open(self._name, readonly)
+        header: typing.Union[memoryview, bytearray]
+        if fd is None:
+            self._fd = -1
+            self._shm = SharedMemory(name=self._name, create=False)
+            header = _segment_buffer(self._shm)
+        else:
+            self._fd = fd
+            header = _pread_header(self._fd)
+        if instrumentation.HOOKS:
+            instrumentation.emit(instrumentation.SEGMENT_ATTACHED, self._size())
+        self._offset, self._dtype, self._shape = check_buffer_array(header)
+        self._order = _header_order(header)
+        self._axis = len(self._shape) - 1 if self._order == "F" else 0
+        frame = self._shape[: self._axis] + self._shape[self._axis + 1 :]
+        self._frame_nbytes = self._dtype.itemsize * int(np.prod(frame))
+        self._start = self._stop = 0
+        self._array: typing.Optional[np.ndarray] = self._map(0, 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace):
+        self.close()
+
+    @property
+    def array(self) -> typing.Optional[np.ndarray]:
+        """
+        Return the view of the current window
+
+        :return: Window view, None after the window was closed
+        :rtype: typing.Optional[np.ndarray]
+        """
+        return self._array
+
+    @property
+    def shape(self) -> tuple:
+        """
+        Return the shape of the whole array
+
+        :return: Array dimension
+        :rtype: tuple
+        """
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Return the data format
+
+        :return: Data format
+        :rtype: np.dtype
+        """
+        return self._dtype
+
+    @property
+    def axis(self) -> int:
+        """
+        Return the axis along which the window moves
+
+        :return: Slowest varying axis
+        :rtype: int
+        """
+        return self._axis
+
+    @property
+    def window(self) -> typing.Tuple[int, int]:
+        """
+        Return the range of the window along the axis
+
+        :return: Start and stop index
+        :rtype: typing.Tuple[int, int]
+        """
+        return self._start, self._stop
+
+    def move(self, start: int, stop: typing.Optional[int] = None) -> np.ndarray:
+        """
+        Map another range along the axis
+
+        :param start: First index
+        :type start: int
+        :param stop: Stop index, defaults to keeping the window size
+        :type stop: typing.Optional[int], optional
+        :raises ValueError: If the window is closed
+        :raises ValueError: If the range is outside of the array
+        :return: View of the new window
+        :rtype: np.ndarray
+        """
+        if self._fd < 0 and self._shm is None:
+            raise ValueError(f"Window of {self._name} is closed")
+        stop = start + self._stop - self._start if stop is None else stop
+        if not 0 <= start <= stop <= self._shape[self._axis]:
+            raise ValueError(
+                f"Window {start}:{stop} is outside of axis {self._axis} with "
+                f"length {self._shape[self._axis]}"
+            )
+        self._array = self._map(start, stop)
+        self._start, self._stop = start, stop
+        return self._array
+
+    def close(self) -> None:
+        """
+        Close the window and the shared memory segment, the mapping of arrays
+        which are still referenced is released with them
+        """
+        if instrumentation.HOOKS:
+            instrumentation.emit(instrumentation.SEGMENT_CLOSED, self._size())
+        self._release()
+        self._array = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def _map(self, start: int, stop: int) -> np.ndarray:
+        """
+        Protected mapping of the pages of a range along the axis
+
+        :param start: First index
+        :type start: int
+        :param stop: Stop index
+        :type stop: int
+        :return: View of the range
+        :rtype: np.ndarray
+        """
+        shape = list(self._shape)
+        shape[self._axis] = stop - start
+        begin = self._offset + start * self._frame_nbytes
+        end = self._offset + stop * self._frame_nbytes
+        if self._shm is not None:
+            buf = _segment_buffer(self._shm)[begin:end]
+            return np.ndarray(shape, dtype=self._dtype, buffer=buf, order=self._order)
+        self._release()
+        # An empty window maps the page in front of its end, the header
+        # guarantees that the end is never at the start of the segment
+        page = min(begin, end - 1) // mmap.ALLOCATIONGRANULARITY
+        page *= mmap.ALLOCATIONGRANULARITY
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        LOGGER.debug(f"Mapping {end - page} bytes of {self._name} at {page}")
+        self._mmap = mmap.mmap(self._fd, end - page, access=access, offset=page)
+        return np.ndarray(
+            shape,
+            dtype=self._dtype,
+            buffer=self._mmap,
+            offset=begin - page,
+            order=self._order,
+        )
+
+    def _size(self) -> int:
+        """
+        Protected size of the segment
+
+        :return: Segment size
+        :rtype: int
+        """
+        if self._shm is not None:
+            return self._shm.size
+        return os.fstat(self._fd).st_size if self._fd >= 0 else 0
+
+    def _release(self) -> None:
+        """
+        Protected release of the current mapping
+
+        numpy arrays reference the memory map without holding a buffer
+        export, thus closing the map explicitly would invalidate arrays
+        returned before. The map is unmapped with its last reference instead.
+        """
+        self._array = None
+        self._mmap = None
+
+
+def attach_shared_window(
+    name: str,
+    start: int = 0,
+    stop: typing.Optional[int] = None,
+    readonly: bool = False,
+) -> SharedWindow:
+    """
+    Attach to a range along the slowest varying axis of an existing
+    WrappedExchangeArray in shared memory
+
+    :param name: Shared memory location
+    :type name: str
+    :param start: First index, defaults to 0
+    :type start: int, optional
+    :param stop: Stop index, defaults to the length of the axis
+    :type stop: typing.Optional[int], optional
+    :param readonly: Map the window read-only, defaults to False
+    :type readonly: bool, optional
+    :raises FileNotFoundError: If the segment does not exist
+    :raises ValueError: If the range is outside of the array
+    :return: Returns a SharedWindow instance
+    :rtype: SharedWindow
+    """
+    window = SharedWindow(name, readonly)
+    window.move(start, window.shape[window.axis] if stop is None else stop)
+    return window
+
+
+def _pread_header(fd: int) -> bytearray:
+    """
+    Read the header of a segment without mapping it
+
+    The offset is validated before the rest of the header is read, thus a
+    corrupted segment can not trigger large reads.
+
+    :param fd: File descriptor of the segment
+    :type fd: int
+    :raises MemoryError: If the segment is smaller than the header
+    :raises TypeError: If the magic number or the offset is invalid
+    :return: Header
+    :rtype: bytearray
+    """
+    prefix = os.pread(fd, _JULIA_WA_HEADER_SIZEOF, 0)
+    if len(prefix) < _JULIA_WA_HEADER_SIZEOF:
+        raise MemoryError("Shared memory is smaller than header size")
+    off = _frame_offset(prefix)
+    header = bytearray(os.pread(fd, off, 0))
+    if len(header) < off:
+        raise MemoryError("Shared memory is smaller than header size")
+    return header
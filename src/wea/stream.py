@@ -0,0 +1,91 @@
+"""
+Streaming of Wrapped Exchange Array frames over file-like objects
+"""
+import io
+import typing
+
+import numpy as np
+
+from .buffered_memory.buffered_exchange_array import (
+    BufferedExchangeArray,
+    _exchange_buffers,
+    read_buffered_array,
+)
+
+
+def write_arrays(
+    fileobj: typing.BinaryIO, arrays: typing.Iterable[np.ndarray], order: str = "F"
+) -> int:
+    """
+    Write arrays as back-to-back exchange frames
+
+    Header and payload are written separately, thus BufferedExchangeArrays
+    and arrays which are contiguous in the requested order are not copied.
+    Short writes of unbuffered streams are continued until every buffer is
+    written completely.
+
+    :param fileobj: Binary stream, e.g. a file, pipe or socket file
+    :type fileobj: typing.BinaryIO
+    :param arrays: Arrays to write
+    :type arrays: typing.Iterable[np.ndarray]
+    :param order: Memory layout of the frames, "K" keeps the layout of C
+     contiguous arrays, defaults to "F"
+    :type order: str, optional
+    :raises BlockingIOError: If a non-blocking stream accepts no data
+    :return: Number of written bytes
+    :rtype: int
+    """
+    count = 0
+    for arr in arrays:
+        for buf in _exchange_buffers(arr, order):
+            count += _write_exactly(fileobj, buf)
+    return count
+
+
+def iter_arrays(
+    fileobj: typing.Union[io.RawIOBase, io.BufferedIOBase], reuse: bool = False
+) -> typing.Iterator[BufferedExchangeArray]:
+    """
+    Read back-to-back exchange frames until the end of the stream
+
+    With reuse set, consecutive frames with the same header are read into the
+    same array, which keeps the memory usage flat. The yielded array is then
+    only valid until the next iteration.
+
+    :param fileobj: Binary stream with a readinto method, e.g. a file, pipe or
+     socket file
+    :type fileobj: typing.Union[io.RawIOBase, io.BufferedIOBase]
+    :param reuse: Read into the previously yielded array, defaults to False
+    :type reuse: bool, optional
+    :raises MemoryError: If the stream ends within a frame
+    :yield: WrappedExchangeArray instance
+    :rtype: typing.Iterator[BufferedExchangeArray]
+    """
+    arr = None
+    while True:
+        try:
+            arr = read_buffered_array(fileobj.readinto, out=arr if reuse else None)
+        except EOFError:
+            return
+        yield arr
+
+
+def _write_exactly(fileobj: typing.BinaryIO, buf: memoryview) -> int:
+    """
+    Write a buffer completely
+
+    :param fileobj: Binary stream
+    :type fileobj: typing.BinaryIO
+    :param buf: Buffer to write
+    :type buf: memoryview
+    :raises BlockingIOError: If a non-blocking stream accepts no data
+    :return: Number of written bytes
+    :rtype: int
+    """
+    pos = 0
+    while pos < buf.nbytes:
+        count = fileobj.write(buf[pos:])
+        if not count:
+            raise BlockingIOError("Stream accepted no data of the exchange frame")
+        pos += count
+    return pos
@@ -20,7 +20,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 IN THE SOFTWARE.
 """
 
-import numpy as np
+import math
 
 
 def checkdims(dims: tuple):
@@ -32,15 +32,7 @@ def checkdims(dims: tuple):
     :return: Number of elements
     :rtype: int
     """
-    number: int = 1
-
-    def multipy(dim: int):
-        nonlocal number
-        number = number * dim
-
-    for dim in dims:
-        multipy(dim)
-    return int(number)
+    return int(math.prod(dims))
 
 
 def roundup(a_val: int, b_val: int):
@@ -53,5 +45,4 @@ def roundup(a_val: int, b_val: int):
     : type b_val: int
     """
     add = a_val + (b_val - 1)
-    cld = np.ceil(add / b_val) * b_val
-    return int(cld)
+    return (add + b_val - 1) // b_val * b_val
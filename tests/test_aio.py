@@ -0,0 +1,76 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from wea import create_buffered_array
+from wea.aio import recv_array, send_array, start_array_server
+
+
+def test_send_recv_array():
+    data = np.random.randn(10, 2)
+
+    async def roundtrip():
+        server = await start_array_server(lambda arr: arr * 2, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        wa = create_buffered_array(data.dtype, data.shape)
+        wa[:] = data[:]
+        await send_array(writer, wa)
+        await send_array(writer, data[:, 1])
+        first = await recv_array(reader)
+        second = await recv_array(reader)
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return first, second
+
+    first, second = asyncio.run(roundtrip())
+    assert (first == data * 2).all()
+    assert (second == data[:, 1] * 2).all()
+
+
+def test_recv_array_eof():
+    wa = create_buffered_array(np.dtype("float64"), (10, 2))
+
+    async def receive(payload):
+        reader = asyncio.StreamReader()
+        reader.feed_data(payload)
+        reader.feed_eof()
+        return await recv_array(reader)
+
+    with pytest.raises(EOFError):
+        asyncio.run(receive(b""))
+    with pytest.raises(MemoryError):
+        asyncio.run(receive(bytes(wa.exchange_buffer)[:-1]))
+
+
+def test_recv_array_invalid_header():
+    wa = create_buffered_array(np.dtype("float64"), (10, 2))
+    frame = bytearray(wa.exchange_buffer)
+    frame[8:16] = np.int64(1 << 40).tobytes()
+
+    async def receive():
+        reader = asyncio.StreamReader()
+        reader.feed_data(frame)
+        reader.feed_eof()
+        return await recv_array(reader)
+
+    with pytest.raises(TypeError):
+        asyncio.run(receive())
+
+
+def test_server_closes_invalid_connection():
+    async def roundtrip():
+        server = await start_array_server(lambda arr: arr, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"\0" * 64)
+        await writer.drain()
+        closed = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return closed
+
+    assert asyncio.run(roundtrip()) == b""
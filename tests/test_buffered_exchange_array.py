@@ -1,8 +1,11 @@
+import io
+
 import numpy as np
 import pytest
 
 import wea.meta_data as meta
-from wea import create_buffered_array, load_buffered_array
+from wea import create_buffered_array, load_buffered_array, read_buffered_array
+from wea.buffered_memory.buffered_exchange_array import _exchange_buffers
 
 
 @pytest.mark.parametrize("shape", [(10, 2), (10, 1)])
@@ -51,5 +54,166 @@ def test_BufferedExchangeArray_attributes():
     wa[:] = data[:]
     compare = wa[:] == data[:]
     assert compare.all()
-    assert isinstance(wa.exchange_buffer, bytearray)
+    assert isinstance(wa.exchange_buffer, memoryview)
     assert wa.exchange_buffer[128:] == bytearray(data.tobytes(order="F"))
+
+
+def test_exchange_buffer_zero_copy():
+    data = np.random.randn(10, 2)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    buf = wa.exchange_buffer
+    assert buf is wa.exchange_buffer
+    wa[0, 0] = 42.0
+    assert np.frombuffer(buf, dtype=data.dtype, offset=128)[0] == 42.0
+
+
+@pytest.mark.parametrize("kind", [bytearray, bytes, memoryview])
+def test_load_buffered_array_zero_copy(kind):
+    data = np.random.randn(10, 2)
+    frame = bytearray(create_buffered_array(data.dtype, data.shape).exchange_buffer)
+    frame[128:] = data.tobytes(order="F")
+    buf = kind(frame)
+    wa = load_buffered_array(buf)
+    assert (wa == data).all()
+    assert np.shares_memory(wa, np.frombuffer(buf, dtype=np.uint8))
+    assert wa.flags.writeable == (kind is not bytes)
+
+
+def test_exchange_buffer_of_slice():
+    data = np.random.randn(10, 2)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    wr = load_buffered_array(wa[2:5, 1].exchange_buffer)
+    assert wr.shape == (3,)
+    assert (wr == data[2:5, 1]).all()
+
+
+def test_c_order():
+    data = np.random.randn(10, 3)
+    wa = create_buffered_array(data.dtype, data.shape, order="C")
+    assert wa.flags.c_contiguous
+    wa[:] = data[:]
+    off = wa._exchange_buffer_offset
+    assert bytes(wa.exchange_buffer[off:]) == data.tobytes(order="C")
+    wr = load_buffered_array(bytes(wa.exchange_buffer))
+    assert wr.flags.c_contiguous
+    assert (wr == data).all()
+    wr = load_buffered_array(wa[2:5].exchange_buffer)
+    assert wr.flags.c_contiguous
+    assert (wr == data[2:5]).all()
+    header, payload = _exchange_buffers(data, "K")
+    assert np.shares_memory(np.frombuffer(payload, dtype=np.uint8), data)
+    assert (load_buffered_array(bytes(header) + bytes(payload)) == data).all()
+    with pytest.raises(ValueError):
+        create_buffered_array(data.dtype, data.shape, order="K")
+    head, body = wa[2:5].exchange_buffers
+    assert np.shares_memory(np.frombuffer(body, dtype=np.uint8), wa)
+    assert bytes(head) == bytes(wa[2:5].exchange_buffer[: len(head)])
+    head, body = wa[:, 1:].exchange_buffers
+    assert bytes(head) + bytes(body) == bytes(wa[:, 1:].exchange_buffer)
+
+
+def test_structured_array():
+    dtype = np.dtype([("time", "datetime64[us]"), ("value", "f4"), ("valid", "?")])
+    data = np.zeros(7, dtype=dtype)
+    data["time"] = np.datetime64("2020-01-01") + np.arange(7)
+    data["value"] = np.arange(7)
+    data["valid"] = np.arange(7) % 2 == 0
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    wr = load_buffered_array(bytes(wa.exchange_buffer))
+    assert wr.dtype == dtype
+    assert (wr == data).all()
+
+
+def test_foreign_byteorder():
+    data = np.random.randn(10, 3)
+    foreign = data.dtype.newbyteorder()
+    wa = create_buffered_array(foreign, data.shape)
+    wa[:] = data[:]
+    magic, _, _, _, dims = meta._read_header(wa.exchange_buffer)
+    assert magic == meta._JULIA_WA_MAGIC
+    assert dims == data.shape
+    assert bytes(wa.exchange_buffer[:4]) != meta._JULIA_WA_MAGIC.tobytes()
+    wr = load_buffered_array(bytes(wa.exchange_buffer))
+    assert wr.dtype == foreign
+    assert (wr == data).all()
+    wr = load_buffered_array(wa.compress(shuffle=True))
+    assert wr.dtype == foreign
+    assert (wr == data).all()
+    with pytest.raises(TypeError):
+        load_buffered_array(bytes(wa.exchange_buffer), swap=True)
+    buf = bytearray(wa.exchange_buffer)
+    wr = load_buffered_array(buf, swap=True)
+    assert wr.dtype == data.dtype
+    assert (wr == data).all()
+    assert bytes(buf[:4]) == meta._JULIA_WA_MAGIC.tobytes()
+    assert (load_buffered_array(buf) == data).all()
+
+
+def test_swap_structured():
+    dtype = np.dtype([("a", "<f8"), ("b", ">i4"), ("c", ">f4", (2,))])
+    data = np.zeros(5, dtype=dtype)
+    data["a"] = np.arange(5)
+    data["b"] = -np.arange(5)
+    data["c"] = np.arange(10).reshape(5, 2)
+    wa = create_buffered_array(dtype, data.shape)
+    wa[:] = data[:]
+    wr = load_buffered_array(bytearray(wa.exchange_buffer), swap=True)
+    assert wr.dtype == dtype.newbyteorder("=")
+    for name in dtype.names:
+        assert (wr[name] == data[name]).all()
+
+
+def test_load_buffered_array_too_small():
+    wa = create_buffered_array(np.dtype("float64"), (10, 2))
+    with pytest.raises(MemoryError):
+        load_buffered_array(wa.exchange_buffer[:-1])
+
+
+def test_exchange_buffers():
+    data = np.random.randn(10, 2)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    header, payload = wa.exchange_buffers
+    assert bytes(header) + bytes(payload) == bytes(wa.exchange_buffer)
+    header, payload = wa[:, 1].exchange_buffers
+    assert np.shares_memory(np.frombuffer(payload, dtype=np.uint8), wa)
+    assert (load_buffered_array(bytes(header) + bytes(payload)) == data[:, 1]).all()
+
+
+def test_read_buffered_array():
+    data = np.random.randn(10, 2)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    stream = io.BytesIO(bytes(wa.exchange_buffer) * 2 + bytes(wa[:3].exchange_buffer))
+    wr = read_buffered_array(stream.readinto)
+    assert (wr == data).all()
+    wr[:] = 0.0
+    assert read_buffered_array(stream.readinto, out=wr) is wr
+    assert (wr == data).all()
+    wn = read_buffered_array(stream.readinto, out=wr)
+    assert wn is not wr
+    assert (wn == data[:3]).all()
+    with pytest.raises(EOFError):
+        read_buffered_array(stream.readinto)
+
+
+def test_read_buffered_array_truncated():
+    wa = create_buffered_array(np.dtype("float64"), (10, 2))
+    stream = io.BytesIO(bytes(wa.exchange_buffer)[:-1])
+    with pytest.raises(MemoryError):
+        read_buffered_array(stream.readinto)
+
+
+def test_read_buffered_array_invalid_header():
+    wa = create_buffered_array(np.dtype("float64"), (10, 2))
+    frame = bytearray(wa.exchange_buffer)
+    frame[:4] = b"\0\0\0\0"
+    with pytest.raises(TypeError):
+        read_buffered_array(io.BytesIO(frame).readinto)
+    frame = bytearray(wa.exchange_buffer)
+    frame[8:16] = np.int64(1 << 40).tobytes()
+    with pytest.raises(TypeError):
+        read_buffered_array(io.BytesIO(frame).readinto)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from wea import create_growable_buffered_array, load_buffered_array
+
+
+def test_append_grow():
+    rows = np.random.randn(4, 2, 10)
+    ga = create_growable_buffered_array(rows.dtype, (4, 2, 0))
+    assert len(ga) == 0
+    assert ga.capacity == 1
+    for idx in range(10):
+        assert ga.append(rows[..., idx]) == idx + 1
+    assert ga.capacity == 16
+    assert ga.array.shape == (4, 2, 10)
+    assert (ga.array == rows).all()
+    wa = load_buffered_array(bytes(ga.exchange_buffer))
+    assert (wa == rows).all()
+    assert ga.append(rows[..., :7]) == 17
+    assert ga.capacity == 32
+    assert (ga.array[..., 10:] == rows[..., :7]).all()
+    with pytest.raises(ValueError):
+        ga.append(np.zeros((4, 3)))
+
+
+def test_reserve():
+    ga = create_growable_buffered_array(np.dtype("f4"), (5,), capacity=8)
+    assert len(ga) == 5
+    assert ga.capacity == 8
+    ga.array[:] = np.arange(5)
+    ga.reserve(4)
+    assert ga.capacity == 8
+    ga.reserve(100)
+    assert ga.capacity == 100
+    assert (ga.array == np.arange(5)).all()
@@ -0,0 +1,76 @@
+import io
+
+import numpy as np
+import pytest
+
+from wea import create_buffered_array, load_buffered_array, read_buffered_array
+from wea.codecs import compress_buffer, decompress_buffer
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_compress_load(codec, shuffle):
+    data = np.round(np.random.randn(1000, 3), 2)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    buf = wa.compress(codec, shuffle=shuffle)
+    assert len(buf) < len(wa.exchange_buffer)
+    wr = load_buffered_array(buf)
+    assert (wr == data).all()
+    assert bytes(wr.exchange_buffer) == bytes(wa.exchange_buffer)
+
+
+def test_compress_chunks():
+    data = np.random.randn(1000, 3)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    buf = compress_buffer(wa.exchange_buffer, shuffle=True, chunk_size=1000, threads=4)
+    assert bytes(decompress_buffer(buf, threads=4)) == bytes(wa.exchange_buffer)
+    with pytest.raises(TypeError):
+        compress_buffer(buf)
+    with pytest.raises(TypeError):
+        decompress_buffer(wa.exchange_buffer)
+    with pytest.raises(ValueError):
+        compress_buffer(wa.exchange_buffer, "snappy")
+
+
+def test_read_compressed():
+    data = np.zeros((100, 2))
+    wa = create_buffered_array(data.dtype, data.shape)
+    stream = io.BytesIO(bytes(wa.compress()) * 2)
+    assert (read_buffered_array(stream.readinto) == data).all()
+    assert (read_buffered_array(stream.readinto) == data).all()
+
+
+def test_decompress_invalid_chunk_table():
+    data = np.random.randn(1000, 3)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    buf = compress_buffer(wa.exchange_buffer, chunk_size=1000)
+    off = len(wa.exchange_buffer) - data.nbytes
+    # Chunk count which does not cover the payload
+    broken = bytearray(buf)
+    broken[off + 8 : off + 16] = np.int64(1 << 40).tobytes()
+    with pytest.raises(TypeError):
+        decompress_buffer(broken)
+    # Chunk length which exceeds the payload
+    broken = bytearray(buf)
+    broken[off + 16 : off + 24] = np.int64(1 << 40).tobytes()
+    with pytest.raises(TypeError):
+        decompress_buffer(broken)
+    # Chunks which decompress to a length other than their share of the payload
+    data = np.random.randn(1001, 3)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    buf = compress_buffer(wa.exchange_buffer, chunk_size=1000)
+    count = int(np.frombuffer(buf, np.int64, 1, off + 8)[0])
+    lengths = np.frombuffer(buf, np.int64, count, off + 16).copy()
+    pos = off + 16 + 8 * count
+    chunks = np.split(np.frombuffer(buf, np.uint8, offset=pos), np.cumsum(lengths)[:-1])
+    chunks[0], chunks[-1] = chunks[-1], chunks[0]
+    lengths[0], lengths[-1] = lengths[-1], lengths[0]
+    broken = (
+        bytes(buf[: off + 16]) + lengths.tobytes() + np.concatenate(chunks).tobytes()
+    )
+    with pytest.raises(TypeError, match="chunk 0"):
+        decompress_buffer(broken)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from wea import (
+    DeltaTracker,
+    apply_delta,
+    create_buffered_array,
+    load_buffered_array,
+)
+
+
+@pytest.mark.parametrize("block_size", [8, 100, 4096])
+def test_delta_apply(block_size):
+    data = np.random.randn(1001, 3)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data[:]
+    wr = load_buffered_array(bytearray(wa.exchange_buffer))
+    tracker = DeltaTracker(wa, block_size=block_size)
+    assert len(tracker.dirty_blocks()) == 0
+    wa[5, 1] = 1.0
+    wa[-1, -1] = 2.0
+    assert len(tracker.dirty_blocks()) == 2
+    delta = tracker.delta()
+    assert len(delta) < len(wa.exchange_buffer) or block_size == 4096
+    assert apply_delta(wr, delta) == 2
+    assert (wr == wa).all()
+    assert apply_delta(wr, tracker.delta()) == 0
+
+
+def test_delta_c_order():
+    data = np.random.randn(100, 3)
+    wa = create_buffered_array(data.dtype, data.shape, order="C")
+    wr = np.zeros_like(data)
+    tracker = DeltaTracker(wa, block_size=64)
+    wa[:] = data[:]
+    apply_delta(wr, tracker.delta())
+    assert (wr == data).all()
+    with pytest.raises(ValueError):
+        apply_delta(np.asfortranarray(wr), tracker.delta())
+
+
+def test_delta_validation():
+    wa = create_buffered_array(np.int32, (10, 10))
+    tracker = DeltaTracker(wa)
+    wa[0, 0] = 1
+    delta = tracker.delta()
+    with pytest.raises(TypeError):
+        load_buffered_array(delta)
+    with pytest.raises(TypeError):
+        apply_delta(wa, wa.exchange_buffer)
+    with pytest.raises(ValueError):
+        apply_delta(np.zeros((10, 10), dtype=np.int64, order="F"), delta)
+    with pytest.raises(ValueError):
+        apply_delta(np.zeros((10, 10), dtype=np.int32, order="C"), delta)
+    with pytest.raises(MemoryError):
+        apply_delta(np.zeros((10, 10), dtype=np.int32, order="F"), delta[:-1])
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import wea.meta_data as meta
+from wea import create_exchange_record, load_exchange_record, pack_exchange_record
+
+
+def test_pack_load_exchange_record():
+    data = {
+        "timestamps": np.arange(10, dtype=np.int64),
+        "samples": (np.random.randn(10, 2) + 1j).astype(np.complex64),
+        "flags": np.ones(3, dtype=np.uint8),
+    }
+    record = pack_exchange_record(data)
+    assert list(record) == list(data)
+    buf = bytes(record.exchange_buffer)
+    base = np.frombuffer(buf, dtype=np.uint8).ctypes.data
+    loaded = load_exchange_record(buf)
+    assert len(loaded) == len(data)
+    for key, val in data.items():
+        assert loaded[key].dtype == val.dtype
+        assert (loaded[key] == val).all()
+        assert (loaded[key].ctypes.data - base) % meta._JULIA_WA_AGLIGN == 0
+
+
+def test_create_exchange_record_zero_copy():
+    record = create_exchange_record({"a": (np.dtype("float32"), (4, 2))})
+    record["a"][:] = 1.0
+    loaded = load_exchange_record(record.exchange_buffer)
+    assert np.shares_memory(loaded["a"], record["a"])
+    assert (loaded["a"] == 1.0).all()
+
+
+def test_load_exchange_record_invalid():
+    with pytest.raises(TypeError):
+        load_exchange_record(bytes(128))
+    record = pack_exchange_record({"a": np.zeros(4)})
+    with pytest.raises(MemoryError):
+        load_exchange_record(record.exchange_buffer[:-1])
+    with pytest.raises(ValueError):
+        pack_exchange_record({"a" * 49: np.zeros(4)})
+
+
+def test_exchange_record_order():
+    data = {
+        "c": np.random.randn(4, 3),
+        "f": np.asfortranarray(np.random.randn(4, 3)),
+        "strided": np.random.randn(4, 6)[:, ::2],
+    }
+    loaded = load_exchange_record(bytes(pack_exchange_record(data).exchange_buffer))
+    assert loaded["c"].flags.c_contiguous and not loaded["c"].flags.f_contiguous
+    assert loaded["f"].flags.f_contiguous
+    assert loaded["strided"].flags.f_contiguous
+    for key, val in data.items():
+        assert (loaded[key] == val).all()
+    packed = pack_exchange_record(data, order="C")
+    assert all(arr.flags.c_contiguous for arr in packed.values())
+    record = create_exchange_record({"a": (np.dtype("f8"), (4, 2), "C")})
+    assert record["a"].flags.c_contiguous
+    with pytest.raises(ValueError):
+        pack_exchange_record(data, order="A")
@@ -0,0 +1,78 @@
+import io
+
+import numpy as np
+import pytest
+
+from wea import (
+    attach_shared_array,
+    create_buffered_array,
+    create_shared_array,
+    instrumentation,
+    load_buffered_array,
+)
+from wea.stream import write_arrays
+
+
+@pytest.fixture
+def counters():
+    with instrumentation.instrumented() as hook:
+        yield hook
+
+
+def test_hooks_registry():
+    events = []
+    hook = lambda event, value: events.append((event, value))  # noqa: E731
+    instrumentation.add_hook(hook)
+    try:
+        create_buffered_array(np.dtype("f8"), (4, 2))
+    finally:
+        instrumentation.remove_hook(hook)
+    assert events[0][0] == instrumentation.BUFFER_ALLOCATED
+    assert instrumentation.HOOKS == ()
+    with pytest.raises(ValueError):
+        instrumentation.remove_hook(hook)
+    count = len(events)
+    create_buffered_array(np.dtype("f8"), (4, 2))
+    assert len(events) == count
+
+
+def test_buffered_counters(counters):
+    wa = create_buffered_array(np.dtype("f8"), (10, 2))
+    load_buffered_array(wa.exchange_buffer)
+    wa[::2].exchange_buffer
+    stats = counters.snapshot()
+    counters.reset()
+    sizes = [len(wa.exchange_buffer), len(wa[::2].exchange_buffer)]
+    assert counters.snapshot()[instrumentation.BUFFER_ALLOCATED] == (1, sizes[1])
+    assert stats[instrumentation.BUFFER_ALLOCATED] == (2, sum(sizes))
+    assert stats[instrumentation.BYTES_COPIED] == (1, 80)
+    assert stats[instrumentation.HEADER_ENCODE][0] == 2
+    assert stats[instrumentation.HEADER_DECODE][0] == 1
+    assert stats[instrumentation.HEADER_DECODE][1] > 0
+
+
+def test_exchange_buffers_copy(counters):
+    data = np.random.randn(10, 2)
+    create_buffered_array(data.dtype, data.shape).exchange_buffers
+    assert instrumentation.BYTES_COPIED not in counters.snapshot()
+    write_arrays(io.BytesIO(), [data])
+    assert counters.snapshot()[instrumentation.BYTES_COPIED] == (1, data.nbytes)
+
+
+def test_shared_counters(counters):
+    name = "/test-instrumentation"
+    wa = create_shared_array(name, np.dtype("f8"), (10, 2))
+    try:
+        wr = attach_shared_array(name)
+        wr.snapshot()
+        wr.reattach().close()
+        wr.close()
+    finally:
+        wa.unlink()
+    stats = counters.snapshot()
+    assert stats[instrumentation.SEGMENT_CREATED][0] == 1
+    assert stats[instrumentation.SEGMENT_ATTACHED][0] == 2
+    assert stats[instrumentation.SEGMENT_CLOSED][0] == 2
+    assert stats[instrumentation.SEGMENT_UNLINKED][0] == 1
+    assert stats[instrumentation.BYTES_COPIED] == (1, 160)
+    assert stats[instrumentation.REOPEN][0] == 1
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import wea.meta_data as meta
+from wea import create_mapped_array, load_buffered_array, open_mapped_array
+
+
+@pytest.mark.parametrize("shape", [(10, 2), (10, 1)])
+def test_create_mapped_array(tmp_path, shape):
+    path = tmp_path / "array.wea"
+    data = np.random.random_sample(shape)
+    with create_mapped_array(path, data.dtype, data.shape) as wa:
+        wa[:] = data[:]
+    buf = path.read_bytes()
+    magic, eltype, N, off, dims = meta._read_header(buf)
+    assert magic == meta._JULIA_WA_MAGIC
+    assert eltype == 10
+    assert dims == data.shape
+    assert off == 128
+    assert (load_buffered_array(buf) == data).all()
+
+
+def test_open_mapped_array(tmp_path):
+    path = tmp_path / "array.wea"
+    data = np.random.randn(10, 2)
+    with create_mapped_array(path, data.dtype, data.shape) as wa:
+        wa[:] = data[:]
+    with pytest.raises(FileExistsError):
+        create_mapped_array(path, data.dtype, data.shape)
+    with open_mapped_array(path) as wa:
+        assert not wa.flags.writeable
+        assert (wa == data).all()
+    with open_mapped_array(path, "c") as wa:
+        wa[:] = 0.0
+    with open_mapped_array(path, "r+") as wa:
+        assert (wa == data).all()
+        wa[0, 0] = 42.0
+    with open_mapped_array(path) as wa:
+        assert wa[0, 0] == 42.0
+    with pytest.raises(ValueError):
+        open_mapped_array(path, "w")
+
+
+def test_mapped_array_c_order(tmp_path):
+    path = tmp_path / "array.wea"
+    data = np.random.randn(10, 2)
+    with create_mapped_array(path, data.dtype, data.shape, order="C") as wa:
+        wa[:] = data[:]
+    with open_mapped_array(path) as wa:
+        assert wa.flags.c_contiguous
+        assert (wa == data).all()
+
+
+def test_create_mapped_array_unsupported(tmp_path):
+    path = tmp_path / "array.wea"
+    with pytest.raises(TypeError):
+        create_mapped_array(path, np.dtype("O"), (3,))
+    assert not path.exists()
+    with pytest.raises(ValueError):
+        create_mapped_array(path, np.dtype("float64"), (3,), order="K")
+    assert not path.exists()
+
+
+def test_open_mapped_array_read_only_file(tmp_path):
+    path = tmp_path / "array.wea"
+    with create_mapped_array(path, np.dtype("float64"), (4,)) as wa:
+        wa[:] = 1.0
+    path.chmod(0o444)
+    with open_mapped_array(path, "c") as wa:
+        wa[:] = 2.0
+        assert (wa == 2.0).all()
+    with open_mapped_array(path) as wa:
+        assert (wa == 1.0).all()
@@ -1,7 +1,11 @@
+import io
+
 import numpy as np
 import pytest
 
 import wea.meta_data as meta
+from wea import create_buffered_array
+from wea.stream import write_arrays
 
 from .helper import create_buffer
 
@@ -40,5 +44,87 @@ def test_read_header():
     assert dims == exp_dims
 
 
+def test_extension():
+    buf, dims, N, off, type, exp_header = create_buffer()
+    buf[: len(exp_header)] = exp_header
+    assert meta._extension(buf, N, off) is None
+    meta._write_header(buf, type, dims)
+    ext = meta._extension(buf, N, off)
+    assert ext.shape == (meta._WEA_EXT_SIZEOF // 8,)
+    assert ext[meta._WEA_EXT_SEQUENCE] == 0
+    assert meta._read_header(buf) == (meta._JULIA_WA_MAGIC, 10, N, off, dims)
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.dtype("bool"),
+        np.dtype("float16"),
+        np.dtype("datetime64[ns]"),
+        np.dtype("timedelta64[s]"),
+        np.dtype([("id", "u4"), ("pos", "f8", (3,)), ("flag", "?")]),
+        np.dtype({"names": ["a", "b"], "formats": ["u1", "f8"]}, align=True),
+    ],
+)
+def test_extended_types(dtype):
+    dims = (5, 2)
+    size, off, _ = meta._calculate_size(dims, dtype)
+    assert off % meta._JULIA_WA_AGLIGN == 0
+    buf = bytearray(size)
+    assert meta._write_header(buf, dtype, dims) == off
+    assert meta.check_buffer_array(buf) == (off, dtype, dims)
+    assert meta.check_buffer_array(buf[:off]) == (off, dtype, dims)
+
+
+def test_unsupported_types():
+    for dtype in [np.dtype("O"), np.dtype([("a", "O")]), np.dtype("U4")]:
+        with pytest.raises(TypeError):
+            meta._eltype(dtype)
+    buf, dims, _, _, type, _ = create_buffer()
+    meta._write_header(buf, np.dtype([("a", "f8")]), (5,))
+    buf[meta._extension_offset(1) + meta._WEA_EXT_SIZEOF + 8] = ord("x")
+    with pytest.raises(TypeError):
+        meta.check_buffer_array(buf)
+
+
+def test_index_frames():
+    arrays = [np.random.randn(4, 3) for _ in range(50)]
+    arrays += [np.arange(7, dtype=np.int32)]
+    arrays += [np.random.randn(4, 3) for _ in range(3)]
+    wa = create_buffered_array(np.float32, (2, 2))
+    arrays += [wa, np.zeros((0, 2))]
+    fid = io.BytesIO()
+    write_arrays(fid, arrays)
+    buf = fid.getvalue()
+    offsets, sizes, dtypes, shapes = meta.index_frames(buf)
+    assert len(offsets) == len(arrays)
+    assert offsets[0] == 0
+    assert (offsets[1:] == np.cumsum(sizes)[:-1]).all()
+    assert offsets[-1] + sizes[-1] == len(buf)
+    for arr, off, size, dtype, shape in zip(arrays, offsets, sizes, dtypes, shapes):
+        assert dtype == arr.dtype
+        assert shape == arr.shape
+        frame = buf[off : off + size]
+        assert meta.check_buffer_array(frame)[1:] == (arr.dtype, arr.shape)
+
+
+def test_index_frames_compressed():
+    wa = create_buffered_array(np.float64, (100,))
+    frames = [bytes(wa.compress()) for _ in range(3)]
+    offsets, sizes, _, shapes = meta.index_frames(b"".join(frames))
+    assert list(sizes) == [len(frame) for frame in frames]
+    assert list(shapes) == [(100,)] * 3
+
+
+def test_index_frames_truncated():
+    assert len(meta.index_frames(b"")[0]) == 0
+    wa = create_buffered_array(np.float64, (10, 2))
+    buf = bytes(wa.exchange_buffer) * 3
+    with pytest.raises(MemoryError):
+        meta.index_frames(buf[:-1])
+    with pytest.raises(MemoryError):
+        meta.index_frames(buf + buf[:10])
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,96 @@
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+import wea.paging as paging
+from wea import (
+    advise,
+    attach_shared_array,
+    create_buffered_array,
+    create_mapped_array,
+    create_shared_array,
+    open_mapped_array,
+    prefault,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestPaging(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestPaging, self).__init__(*args, **kwargs)
+        self._shm_name = "/test-paging-1"
+
+    def setUp(self) -> None:
+        super(TestPaging, self).setUp()
+        if sys.platform == "win32":
+            self._shm_name = f"/test-paging-{random.randrange(100)}"
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def tearDown(self) -> None:
+        super(TestPaging, self).tearDown()
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            logger.info("Nothing to tear down")
+
+    def test_prefault(self):
+        wa = create_shared_array(
+            self._shm_name, np.dtype("float64"), (1024, 64), prefault=True
+        )
+        wa[:] = 1.0
+        for threads in [1, 4]:
+            self.assertGreaterEqual(prefault(wa, threads=threads), 0.0)
+            self.assertGreaterEqual(prefault(wa[:, 10:20], threads=threads), 0.0)
+        wr = attach_shared_array(self._shm_name, prefault=2)
+        self.assertTrue((wr == 1.0).all())
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Requires madvise")
+    def test_advise(self):
+        wa = create_shared_array(
+            self._shm_name, np.dtype("float64"), (1024, 64), advice=["willneed"]
+        )
+        advise(wa, "sequential", "normal")
+        with self.assertRaises(ValueError):
+            advise(wa, "unknown")
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Requires madvise")
+    def test_prefault_copy_on_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "paging.wea")
+            wa = create_mapped_array(path, np.dtype("float64"), (1024, 64))
+            wa[:] = 1.0
+            wa.close()
+            with mock.patch.object(paging, "_populate", return_value=True) as call:
+                wc = open_mapped_array(path, mode="c", prefault=True)
+                self.assertEqual(call.call_args[0][1], paging._MADV_POPULATE_READ)
+                wc[:] = 2.0
+                prefault(wc[:, :10])
+                self.assertEqual(call.call_args[0][1], paging._MADV_POPULATE_READ)
+                wr = open_mapped_array(path, mode="r+", prefault=True)
+                self.assertEqual(call.call_args[0][1], paging._MADV_POPULATE_WRITE)
+            wc.close()
+            self.assertTrue((wr == 1.0).all())
+            wr.close()
+
+    def test_not_mapped(self):
+        with self.assertRaises(TypeError):
+            prefault(create_buffered_array(np.dtype("float64"), (10,)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+import wea.parallel
+from wea import (
+    create_buffered_array,
+    create_shared_array,
+    instrumentation,
+    parallel_copy,
+)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(wea.parallel, "_MIN_CHUNK", 64)
+
+
+@pytest.mark.parametrize("order", ["F", "C"])
+@pytest.mark.parametrize("threads", [1, 3, 8])
+def test_parallel_copy(order, threads):
+    data = np.random.randn(50, 7)
+    wa = create_buffered_array(data.dtype, data.shape, order=order)
+    assert parallel_copy(wa, data, threads=threads) is wa
+    assert (wa == data).all()
+    parallel_copy(wa[::2, 1:], data[1::2, :-1], threads=threads)
+    assert (wa[::2, 1:] == data[1::2, :-1]).all()
+    assert (wa[1::2] == data[1::2]).all()
+    parallel_copy(wa, 2.5, threads=threads)
+    assert (wa == 2.5).all()
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_parallel_copy_overlap(threads):
+    data = np.random.randn(1000)
+    wa = create_buffered_array(data.dtype, data.shape)
+    wa[:] = data
+    wa.assign(wa[::-1], threads=threads)
+    assert (wa == data[::-1]).all()
+    parallel_copy(wa[1:], wa[:-1], threads=threads)
+    assert (wa[1:] == data[::-1][:-1]).all()
+
+
+def test_parallel_copy_casting():
+    wa = create_buffered_array(np.dtype("int32"), (100,))
+    wa.assign(np.full(100, 2.7), threads=4)
+    assert (wa == 2).all()
+
+
+def test_split_contiguous():
+    dst = np.empty((50, 7), order="F")
+    pairs = wea.parallel._split(dst, np.asfortranarray(np.ones((50, 7))), 4)
+    assert len(pairs) == 4
+    assert all(chunk.ndim == 1 for chunk, _ in pairs)
+    pairs = wea.parallel._split(dst, np.ones((50, 7)), 4)
+    assert [chunk.shape for chunk, _ in pairs] == [(50, 1), (50, 2), (50, 2), (50, 2)]
+
+
+def test_assign_copy_out():
+    data = np.random.randn(30, 4)
+    wa = create_shared_array("/test-parallel-1", data.dtype, data.shape)
+    try:
+        with instrumentation.instrumented() as counters:
+            wa.assign(data, threads=4)
+            out = wa.copy_out(threads=4)
+        assert (wa == data).all()
+        assert type(out) is np.ndarray
+        assert out.flags.f_contiguous
+        assert (out == data).all()
+        assert counters.snapshot()[instrumentation.BYTES_COPIED] == (2, 2 * data.nbytes)
+        buf = np.empty_like(data)
+        assert wa.copy_out(buf) is buf
+        assert (buf == data).all()
+    finally:
+        wa.unlink()
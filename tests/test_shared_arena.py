@@ -0,0 +1,93 @@
+import logging
+import pickle
+import sys
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+import wea.meta_data as meta
+from wea.shared_memory import attach_shared_arena, create_shared_arena
+
+logger = logging.getLogger(__name__)
+
+
+class TestSharedArena(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestSharedArena, self).__init__(*args, **kwargs)
+        self._shm_name = "/test-arena-1"
+
+    def setUp(self) -> None:
+        super(TestSharedArena, self).setUp()
+        if sys.platform == "win32":
+            self._shm_name = f"/test-arena-{random.randrange(100)}"
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def tearDown(self) -> None:
+        super(TestSharedArena, self).tearDown()
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            logger.info("Nothing to tear down")
+
+    def test_create_attach(self):
+        arena = create_shared_arena(self._shm_name, 4096, entries=4)
+        reader = attach_shared_arena(self._shm_name)
+        data = {
+            "samples": np.random.randn(10, 2),
+            "flags": np.arange(3, dtype=np.uint8),
+        }
+        for key, val in data.items():
+            wa = arena.create(key, val.dtype, val.shape)
+            wa[:] = val[:]
+            self.assertEqual(wa.mem, arena.mem)
+            self.assertEqual(wa.ctypes.data % meta._JULIA_WA_AGLIGN, 0)
+        self.assertEqual(len(reader), 2)
+        self.assertEqual(reader.keys(), ["samples", "flags"])
+        for key, val in data.items():
+            self.assertIn(key, reader)
+            wa = reader[key]
+            self.assertEqual(wa.dtype, val.dtype)
+            self.assertTrue((wa == val).all())
+        with self.assertRaises(KeyError):
+            reader.attach("missing")
+        with self.assertRaises(FileExistsError):
+            arena.create("flags", np.dtype("uint8"), (3,))
+
+    def test_out_of_space(self):
+        arena = create_shared_arena(self._shm_name, 256, entries=1)
+        with self.assertRaises(MemoryError):
+            arena.create("large", np.dtype("float64"), (64,))
+        arena.create("small", np.dtype("float64"), (4,))
+        with self.assertRaises(MemoryError):
+            arena.create("other", np.dtype("float64"), (4,))
+
+    def test_member_segment(self):
+        arena = create_shared_arena(self._shm_name, 4096, entries=2)
+        wa = arena.create("samples", np.dtype("float64"), (4,))
+        wa[:] = np.arange(4)
+        with self.assertRaises(TypeError):
+            wa.close()
+        with self.assertRaises(TypeError):
+            wa[1:].unlink()
+        wb = wa.reattach()
+        self.assertIsNot(wb.mem, arena.mem)
+        self.assertTrue((wb == np.arange(4)).all())
+        wb[0] = 42.0
+        self.assertEqual(wa[0], 42.0)
+        attached = attach_shared_arena(self._shm_name)
+        self.assertTrue((attached["samples"] == wb).all())
+        with self.assertRaises(TypeError):
+            pickle.loads(pickle.dumps(wa)).close()
+
+
+if __name__ == "__main__":
+    unittest.main()
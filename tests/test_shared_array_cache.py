@@ -0,0 +1,110 @@
+import logging
+import sys
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+from wea.shared_memory import (
+    SharedArrayCache,
+    attach_cached_array,
+    create_shared_array,
+    release_cached_array,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestSharedArrayCache(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestSharedArrayCache, self).__init__(*args, **kwargs)
+        self._shm_names = ["/test-cache-1", "/test-cache-2"]
+
+    def setUp(self) -> None:
+        super(TestSharedArrayCache, self).setUp()
+        if sys.platform == "win32":
+            self._shm_names = [
+                f"/test-cache-{random.randrange(100)}-{idx}" for idx in range(2)
+            ]
+        self.tearDown()
+
+    def tearDown(self) -> None:
+        super(TestSharedArrayCache, self).tearDown()
+        for name in self._shm_names:
+            try:
+                shm = shared_memory.SharedMemory(name, create=False)
+                shm.unlink()
+            except FileNotFoundError:
+                logger.info("Nothing to tear down")
+
+    def test_attach_release(self):
+        data = np.random.randn(10, 2)
+        wa = create_shared_array(self._shm_names[0], data.dtype, data.shape)
+        wa[:] = data[:]
+        cache = SharedArrayCache(maxsize=1)
+        first = cache.attach(self._shm_names[0])
+        second = cache.attach(self._shm_names[0])
+        self.assertIs(first.mem, second.mem)
+        self.assertTrue((second == data).all())
+        first[0, 0] = 42.0
+        self.assertEqual(wa[0, 0], 42.0)
+        cache.release(first)
+        cache.release(second)
+        with self.assertRaises(ValueError):
+            cache.release(second)
+        self.assertIn(self._shm_names[0], cache)
+        create_shared_array(self._shm_names[1], data.dtype, data.shape)
+        with cache.attached(self._shm_names[1]):
+            self.assertEqual(len(cache), 1)
+        self.assertNotIn(self._shm_names[0], cache)
+
+    def test_ttl(self):
+        create_shared_array(self._shm_names[0], np.dtype("int8"), (4,))
+        cache = SharedArrayCache(ttl=0)
+        with cache.attached(self._shm_names[0]):
+            self.assertEqual(len(cache), 1)
+        self.assertEqual(len(cache), 0)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Requires /dev/shm")
+    def test_recreated_segment(self):
+        wa = create_shared_array(self._shm_names[0], np.dtype("int8"), (4,))
+        wa[:] = 7
+        first = attach_cached_array(self._shm_names[0])
+        release_cached_array(first)
+        wa.unlink()
+        wb = create_shared_array(self._shm_names[0], np.dtype("int16"), (8, 3))
+        wb[:] = 3
+        second = attach_cached_array(self._shm_names[0])
+        release_cached_array(second)
+        self.assertEqual(first.shape, (4,))
+        self.assertTrue((first == 7).all())
+        self.assertEqual(second.shape, (8, 3))
+        self.assertEqual(second.dtype, np.dtype("int16"))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Requires /dev/shm")
+    def test_recreated_segment_referenced(self):
+        cache = SharedArrayCache(maxsize=1)
+        wa = create_shared_array(self._shm_names[0], np.dtype("int8"), (4,))
+        wa[:] = 7
+        first = cache.attach(self._shm_names[0])
+        wa.unlink()
+        wb = create_shared_array(self._shm_names[0], np.dtype("int8"), (8,))
+        wb[:] = 3
+        second = cache.attach(self._shm_names[0])
+        cache.release(first)
+        cache.release(second)
+        wc = create_shared_array(self._shm_names[1], np.dtype("int8"), (2,))
+        with cache.attached(self._shm_names[1]) as third:
+            self.assertNotIn(self._shm_names[0], cache)
+            self.assertTrue((third == wc).all())
+        self.assertTrue((first == 7).all())
+        self.assertTrue((second == 3).all())
+        with self.assertRaises(ValueError):
+            cache.release(first)
+
+
+if __name__ == "__main__":
+    unittest.main()
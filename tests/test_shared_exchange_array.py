@@ -1,8 +1,13 @@
+import asyncio
 import logging
+import pickle
 import struct
 import sys
+import threading
+import time
 import unittest
 from multiprocessing import shared_memory
+from unittest import mock
 
 import numpy as np
 
@@ -12,6 +17,7 @@ if sys.platform == "win32":
 from parameterized import parameterized
 
 import wea.meta_data as meta
+from wea import futex
 from wea.shared_memory import (
     SharedExchangeArray,
     attach_shared_array,
@@ -95,6 +101,130 @@ class TestWrappedArray(unittest.TestCase):
         self.assertTrue(compare.all())
         self.assertEqual(type(self._wa.mem), shared_memory.SharedMemory)
 
+    def test_write_snapshot(self):
+        data = np.random.randn(10, 2)
+        self._wa = create_shared_array(self._shm_name, data.dtype, data.shape)
+        wa = attach_shared_array(self._shm_name)
+        self.assertEqual(wa.version, 0)
+        with self._wa.write() as arr:
+            arr[:] = data[:]
+            self.assertEqual(wa.version, 1)
+            with self.assertRaises(TimeoutError):
+                wa.snapshot(retries=3)
+        self.assertEqual(wa.version, 2)
+        snap = wa.snapshot()
+        self.assertEqual(type(snap), np.ndarray)
+        self.assertTrue((snap == data).all())
+        self.assertEqual(wa.read_consistent(lambda arr: arr.shape), data.shape)
+
+    def test_c_order(self):
+        data = np.random.randn(10, 2)
+        self._wa = create_shared_array(
+            self._shm_name, data.dtype, data.shape, order="C"
+        )
+        self._wa[:] = data[:]
+        wa = attach_shared_array(self._shm_name)
+        self.assertTrue(wa.flags.c_contiguous)
+        self.assertTrue((wa == data).all())
+        self.assertTrue(wa.snapshot().flags.c_contiguous)
+        off = meta._calculate_size(data.shape, data.dtype)[1]
+        self.assertEqual(bytes(wa.mem.buf[off:]), data.tobytes(order="C"))
+
+    def test_reopen_deprecated(self):
+        data = np.random.randn(10, 2)
+        self._wa = create_shared_array(self._shm_name, data.dtype, data.shape)
+        self._wa[:] = data[:]
+        mem = self._wa.mem
+        with self.assertWarns(DeprecationWarning):
+            try:
+                self._wa.reopen()
+            except AttributeError:
+                # numpy 2 does not allow to replace the buffer
+                return
+        self.assertIsNot(self._wa.mem, mem)
+        self.assertTrue((self._wa == data).all())
+        mem.close()
+
+    def test_reattach(self):
+        data = np.random.randn(10, 2)
+        self._wa = create_shared_array(self._shm_name, data.dtype, data.shape)
+        self._wa[:] = data[:]
+        wa = self._wa.reattach()
+        self.assertIsInstance(wa, SharedExchangeArray)
+        self.assertTrue((wa == data).all())
+        wa[0, 0] = 42.0
+        self.assertEqual(self._wa[0, 0], 42.0)
+        wa.close()
+
+    def test_pickle(self):
+        data = np.random.randn(10, 4)
+        self._wa = create_shared_array(self._shm_name, data.dtype, data.shape)
+        self._wa[:] = data[:]
+        for view in [self._wa, self._wa[::-2, 1:], self._wa.T, self._wa[3]]:
+            wa = pickle.loads(pickle.dumps(view))
+            self.assertIsInstance(wa, SharedExchangeArray)
+            self.assertEqual(wa.strides, view.strides)
+            self.assertTrue((wa == view).all())
+            self.assertEqual(wa.version, 0)
+        wa = pickle.loads(pickle.dumps(self._wa[::-1]))
+        wa[0, 0] = 42.0
+        self.assertEqual(self._wa[-1, 0], 42.0)
+        copy = pickle.loads(pickle.dumps(self._wa + 1))
+        self.assertEqual(type(copy), np.ndarray)
+
+    def test_notify_wait(self):
+        self._wa = create_shared_array(self._shm_name, np.dtype("f8"), (10, 2))
+        wa = attach_shared_array(self._shm_name)
+        seen = 0
+        with self.assertRaises(TimeoutError):
+            wa.wait(timeout=0.01)
+        self.assertEqual(self._wa.notify(), 1)
+        self.assertEqual(wa.wait(timeout=1, seen=seen), 1)
+        timer = threading.Timer(0.05, self._wa.notify)
+        timer.start()
+        start = time.monotonic()
+        self.assertEqual(wa.wait(timeout=5), 2)
+        self.assertLess(time.monotonic() - start, 5)
+        timer.join()
+        with mock.patch.object(futex, "_SYSCALL", None):
+            timer = threading.Timer(0.05, self._wa.notify)
+            timer.start()
+            self.assertEqual(wa.wait(timeout=5, seen=2), 3)
+            timer.join()
+
+    def test_wait_async(self):
+        self._wa = create_shared_array(self._shm_name, np.dtype("f8"), (10, 2))
+        wa = attach_shared_array(self._shm_name)
+
+        async def waiting():
+            task = asyncio.ensure_future(wa.wait_async(timeout=5))
+            await asyncio.sleep(0.05)
+            self._wa.notify()
+            return await task
+
+        self.assertEqual(asyncio.run(waiting()), 1)
+
+    def test_snapshot_without_extension(self):
+        data = np.random.randn(10, 2)
+        size, _, _ = meta._calculate_size(data.shape, data.dtype)
+        shm = shared_memory.SharedMemory(self._shm_name, create=True, size=size)
+        struct.pack_into(
+            f"{meta._JULIA_WA_HEADER_FORMAT}qq",
+            shm.buf,
+            0,
+            meta._JULIA_WA_MAGIC,
+            10,
+            2,
+            128,
+            10,
+            2,
+        )
+        self._wa = attach_shared_array(self._shm_name)
+        with self.assertRaises(TypeError):
+            self._wa.snapshot()
+        with self.assertRaises(TypeError):
+            self._wa.notify()
+
 
 if __name__ == "__main__":
     unittest.main()
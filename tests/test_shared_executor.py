@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from wea import SharedArrayExecutor, create_buffered_array, create_shared_array
+
+
+def _square(arr):
+    return arr**2
+
+
+def _fail(arr):
+    raise RuntimeError("failed chunk")
+
+
+@pytest.fixture
+def executor():
+    with SharedArrayExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("order", ["F", "C"])
+def test_map_into_output(executor, order):
+    data = np.random.randn(20, 3)
+    wa = create_shared_array("/test-executor-in", data.dtype, data.shape, order=order)
+    out = create_shared_array("/test-executor-out", data.dtype, data.shape)
+    try:
+        wa[:] = data[:]
+        assert executor.map(_square, wa, out, chunks=5) is out
+        assert np.allclose(out, data**2)
+        executor.map(_square, wa, axis=1)
+        assert np.allclose(wa, data**2)
+    finally:
+        wa.unlink()
+        out.unlink()
+
+
+def test_map_errors(executor):
+    wa = create_shared_array("/test-executor-in", np.dtype("f8"), (4, 2))
+    try:
+        with pytest.raises(TypeError):
+            executor.map(_square, create_buffered_array(np.dtype("f8"), (4, 2)))
+        with pytest.raises(ValueError):
+            executor.map(_square, wa, wa[:2], axis=0)
+        with pytest.raises(RuntimeError):
+            executor.map(_fail, wa)
+    finally:
+        wa.unlink()
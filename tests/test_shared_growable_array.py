@@ -0,0 +1,93 @@
+import logging
+import sys
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+from wea.meta_data import (
+    _WEA_FLAG_GROWABLE,
+    _extension_flags,
+    _set_extension_flags,
+)
+from wea.shared_memory import (
+    attach_growable_array,
+    attach_shared_array,
+    create_growable_array,
+    create_shared_array,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestSharedGrowableArray(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestSharedGrowableArray, self).__init__(*args, **kwargs)
+        self._shm_name = "/test-growable-1"
+
+    def setUp(self) -> None:
+        super(TestSharedGrowableArray, self).setUp()
+        if sys.platform == "win32":
+            self._shm_name = f"/test-growable-{random.randrange(100)}"
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def tearDown(self) -> None:
+        super(TestSharedGrowableArray, self).tearDown()
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            logger.info("Nothing to tear down")
+
+    @unittest.skipIf(sys.platform == "win32", "Segments can not grow on Windows")
+    def test_append_grow(self):
+        rows = np.random.randn(3, 20)
+        writer = create_growable_array(self._shm_name, rows.dtype, (3, 0), capacity=2)
+        reader = attach_growable_array(self._shm_name)
+        self.assertEqual(len(writer), 0)
+        self.assertEqual(writer.capacity, 2)
+        self.assertEqual(writer.append(rows[:, 0]), 1)
+        self.assertEqual(writer.append(rows[:, 1:2]), 2)
+        self.assertEqual(writer.capacity, 2)
+        view = reader.array
+        self.assertEqual(view.shape, (3, 2))
+        self.assertEqual(writer.append(rows[:, 2:]), 20)
+        self.assertEqual(writer.capacity, 20)
+        self.assertTrue((writer.array == rows).all())
+        self.assertTrue((reader.array == rows).all())
+        self.assertTrue(reader.array.flags.f_contiguous)
+        self.assertTrue((view == rows[:, :2]).all())
+        wa = attach_shared_array(self._shm_name)
+        self.assertEqual(wa.shape, (3, 20))
+        self.assertTrue((wa == rows).all())
+        writer.append(rows[:, :1])
+        self.assertEqual(writer.capacity, 40)
+        self.assertEqual(reader.reopen().shape, (3, 21))
+        with self.assertRaises(ValueError):
+            writer.append(np.zeros((2, 1)))
+        reader.close()
+        writer.close()
+
+    def test_no_growable_array(self):
+        create_shared_array(self._shm_name, np.dtype("f8"), (3, 2))
+        with self.assertRaises(TypeError):
+            attach_growable_array(self._shm_name)
+
+    def test_c_order_not_growable(self):
+        arr = create_shared_array(self._shm_name, np.dtype("f8"), (3, 2), order="C")
+        ext = arr._ext_words()
+        _set_extension_flags(ext, _extension_flags(ext) | _WEA_FLAG_GROWABLE)
+        with self.assertRaises(TypeError):
+            attach_growable_array(self._shm_name)
+        arr.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
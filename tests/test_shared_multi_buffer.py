@@ -0,0 +1,66 @@
+import logging
+import sys
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+from wea.shared_memory import attach_multi_buffer, create_multi_buffer
+
+logger = logging.getLogger(__name__)
+
+
+class TestSharedMultiBuffer(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestSharedMultiBuffer, self).__init__(*args, **kwargs)
+        self._shm_name = "/test-multi-1"
+
+    def setUp(self) -> None:
+        super(TestSharedMultiBuffer, self).setUp()
+        if sys.platform == "win32":
+            self._shm_name = f"/test-multi-{random.randrange(100)}"
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def tearDown(self) -> None:
+        super(TestSharedMultiBuffer, self).tearDown()
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            logger.info("Nothing to tear down")
+
+    def test_publish(self):
+        data = np.random.randn(4, 5, 2)
+        writer = create_multi_buffer(self._shm_name, data.dtype, (5, 2))
+        reader = attach_multi_buffer(self._shm_name)
+        self.assertEqual(reader.buffers, 3)
+        for idx, frame in enumerate(data):
+            writer.back[:] = frame
+            self.assertFalse((reader.front == frame).all())
+            writer.publish()
+            self.assertEqual(reader.generation, idx + 1)
+            self.assertTrue((reader.front == frame).all())
+            self.assertTrue((reader.snapshot() == frame).all())
+
+    def test_read_consistent(self):
+        writer = create_multi_buffer(self._shm_name, np.dtype("int64"), (3,), 2)
+        reader = attach_multi_buffer(self._shm_name)
+
+        def overlapping_write(arr):
+            writer.publish()
+            return arr.copy()
+
+        with self.assertRaises(TimeoutError):
+            reader.read_consistent(overlapping_write, retries=2)
+        self.assertEqual(reader.read_consistent(lambda arr: arr.shape), (3,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import logging
+import sys
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+from wea.shared_memory import (
+    attach_ring_buffer,
+    create_ring_buffer,
+    create_shared_array,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestSharedRingBuffer(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestSharedRingBuffer, self).__init__(*args, **kwargs)
+        self._shm_name = "/test-ring-1"
+
+    def setUp(self) -> None:
+        super(TestSharedRingBuffer, self).setUp()
+        if sys.platform == "win32":
+            self._shm_name = f"/test-ring-{random.randrange(100)}"
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def tearDown(self) -> None:
+        super(TestSharedRingBuffer, self).tearDown()
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            logger.info("Nothing to tear down")
+
+    def test_push_pop(self):
+        frames = np.random.randn(5, 4, 3)
+        producer = create_ring_buffer(self._shm_name, frames.dtype, (4, 3), 3)
+        consumer = attach_ring_buffer(self._shm_name)
+        self.assertEqual(consumer.frame_shape, (4, 3))
+        self.assertEqual(consumer.slots, 3)
+        self.assertIsNone(consumer.pop())
+        for frame in frames[:3]:
+            self.assertTrue(producer.push(frame))
+        self.assertFalse(producer.push(frames[3]))
+        self.assertEqual(len(consumer), 3)
+        out = np.empty((4, 3))
+        for frame in frames[:2]:
+            self.assertIs(consumer.pop(out), out)
+            self.assertTrue((out == frame).all())
+        for frame in frames[3:]:
+            self.assertTrue(producer.push(frame))
+        for frame in frames[2:]:
+            self.assertTrue((consumer.pop() == frame).all())
+        self.assertEqual(len(consumer), 0)
+
+    def test_claim_commit(self):
+        producer = create_ring_buffer(self._shm_name, np.dtype("int32"), (8,), 2)
+        consumer = attach_ring_buffer(self._shm_name)
+        slot = producer.claim()
+        slot[:] = np.arange(8)
+        self.assertIsNone(consumer.peek())
+        producer.commit()
+        view = consumer.peek()
+        self.assertTrue(view.flags.f_contiguous)
+        self.assertTrue((view == np.arange(8)).all())
+        consumer.release()
+        self.assertIsNone(consumer.peek())
+
+    def test_attach_plain_array(self):
+        self._wa = create_shared_array(self._shm_name, np.dtype("int32"), (8, 2))
+        with self.assertRaises(TypeError):
+            attach_ring_buffer(self._shm_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
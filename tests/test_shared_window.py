@@ -0,0 +1,88 @@
+import logging
+import sys
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+if sys.platform == "win32":
+    import random
+
+from wea.shared_memory import attach_shared_window, create_shared_array
+
+logger = logging.getLogger(__name__)
+
+
+class TestSharedWindow(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestSharedWindow, self).__init__(*args, **kwargs)
+        self._shm_name = "/test-window-1"
+
+    def setUp(self) -> None:
+        super(TestSharedWindow, self).setUp()
+        if sys.platform == "win32":
+            self._shm_name = f"/test-window-{random.randrange(100)}"
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def tearDown(self) -> None:
+        super(TestSharedWindow, self).tearDown()
+        try:
+            shm = shared_memory.SharedMemory(self._shm_name, create=False)
+            shm.unlink()
+        except FileNotFoundError:
+            logger.info("Nothing to tear down")
+
+    def test_window_f_order(self):
+        data = np.random.randn(100, 3000)
+        wa = create_shared_array(self._shm_name, data.dtype, data.shape)
+        wa[:] = data[:]
+        with attach_shared_window(self._shm_name, 1000, 1010) as window:
+            self.assertEqual(window.shape, data.shape)
+            self.assertEqual(window.axis, 1)
+            self.assertEqual(window.array.shape, (100, 10))
+            self.assertTrue((window.array == data[:, 1000:1010]).all())
+            if window._mmap is not None:
+                self.assertLess(len(window._mmap), wa.mem.size // 100)
+            window.array[0, 0] = 42.0
+            self.assertEqual(wa[0, 1000], 42.0)
+            arr = window.move(2990)
+            self.assertEqual(window.window, (2990, 3000))
+            self.assertTrue((arr == data[:, 2990:]).all())
+            with self.assertRaises(ValueError):
+                window.move(2999, 3001)
+            empty = window.move(3, 3)
+            self.assertEqual(empty.shape, (100, 0))
+            self.assertIsNotNone(empty.base)
+
+    def test_window_c_order_readonly(self):
+        data = np.random.randn(500, 4)
+        wa = create_shared_array(self._shm_name, data.dtype, data.shape, order="C")
+        wa[:] = data[:]
+        window = attach_shared_window(self._shm_name, 100, 200, readonly=True)
+        self.assertEqual(window.axis, 0)
+        self.assertTrue((window.array == data[100:200]).all())
+        if window._mmap is not None:
+            self.assertFalse(window.array.flags.writeable)
+        window.close()
+
+    def test_window_defaults_and_closed(self):
+        data = np.random.randn(10, 30)
+        wa = create_shared_array(self._shm_name, data.dtype, data.shape)
+        wa[:] = data[:]
+        window = attach_shared_window(self._shm_name, 5)
+        self.assertEqual(window.window, (5, 30))
+        self.assertTrue((window.array == data[:, 5:]).all())
+        window.close()
+        with self.assertRaises(ValueError):
+            window.move(0, 10)
+
+    @unittest.skipIf(sys.platform == "win32", "Windows maps the whole segment")
+    def test_window_invalid_offset(self):
+        wa = create_shared_array(self._shm_name, np.dtype("f8"), (10, 30))
+        wa.mem.buf[8:16] = np.int64(1 << 40).tobytes()
+        with self.assertRaises(TypeError):
+            attach_shared_window(self._shm_name)
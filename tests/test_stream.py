@@ -0,0 +1,56 @@
+import io
+
+import numpy as np
+import pytest
+
+from wea import create_buffered_array
+from wea.stream import iter_arrays, write_arrays
+
+
+def test_write_iter_arrays():
+    data = [np.random.randn(10, 2), np.random.randn(10, 2), np.arange(5)]
+    wa = create_buffered_array(data[0].dtype, data[0].shape)
+    wa[:] = data[0][:]
+    fid = io.BytesIO()
+    count = write_arrays(fid, [wa, *data[1:]])
+    assert count == len(fid.getvalue())
+    fid.seek(0)
+    arrays = list(iter_arrays(fid))
+    assert len(arrays) == len(data)
+    for arr, val in zip(arrays, data):
+        assert (arr == val).all()
+
+
+class _ShortWriter(io.BytesIO):
+    def write(self, buf):
+        return super().write(bytes(buf)[:7])
+
+
+def test_write_arrays_short_writes():
+    data = [np.random.randn(10, 2), np.arange(5)]
+    fid = _ShortWriter()
+    count = write_arrays(fid, data)
+    assert count == len(fid.getvalue())
+    fid.seek(0)
+    for arr, val in zip(iter_arrays(fid), data):
+        assert (arr == val).all()
+
+
+def test_iter_arrays_reuse(tmp_path):
+    data = [np.random.randn(10, 2) for _ in range(3)]
+    path = tmp_path / "frames.wea"
+    with open(path, "wb") as fid:
+        write_arrays(fid, data)
+    with open(path, "rb") as fid:
+        arrays = []
+        for arr, val in zip(iter_arrays(fid, reuse=True), data):
+            assert (arr == val).all()
+            arrays.append(arr)
+    assert all(arr is arrays[0] for arr in arrays)
+
+
+def test_iter_arrays_truncated():
+    fid = io.BytesIO()
+    write_arrays(fid, [np.zeros(4)])
+    with pytest.raises(MemoryError):
+        list(iter_arrays(io.BytesIO(fid.getvalue()[:-1])))